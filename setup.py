@@ -1,7 +1,58 @@
+import os
+import warnings
+
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
 
 import wordsearch
 
+# The search kernels are plain, annotated Python. They are compiled when a
+# compiler is available and silently left as Python otherwise.
+KERNELS = ['wordsearch/_kernels.py']
+
+
+def compiled_kernels():
+    """Gives the extension modules for the search kernels.
+
+    mypyc is preferred, then Cython. Setting the ``WORDSEARCH_PURE_PYTHON``
+    environment variable skips compilation entirely.
+
+    Returns:
+        A :obj:`list` of extension modules, which is empty when neither
+        compiler is installed.
+    """
+    if os.environ.get('WORDSEARCH_PURE_PYTHON'):
+        return []
+    try:
+        from mypyc.build import mypycify
+        return mypycify(KERNELS, opt_level='3')
+    except ImportError:
+        pass
+    try:
+        from Cython.Build import cythonize
+        return cythonize(KERNELS, language_level=3)
+    except ImportError:
+        return []
+
+
+class OptionalBuildExt(build_ext):
+    """A ``build_ext`` command that falls back to the pure Python kernels when
+    the extensions cannot be compiled (e.g. no C compiler is installed).
+    """
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as error:  # pylint: disable=broad-except
+            warnings.warn('falling back to pure Python kernels: %s' % error)
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as error:  # pylint: disable=broad-except
+            warnings.warn('could not compile %s: %s' % (ext.name, error))
+
+
 setup(
     name='wordsearch',
     packages=find_packages(),
@@ -9,6 +60,8 @@ setup(
     url='https://github.com/david-graves/pillar-kata-word-search',
     author='David Graves',
     author_email='graves.230@osu.edu',
+    ext_modules=compiled_kernels(),
+    cmdclass={'build_ext': OptionalBuildExt},
     entry_points={
         'console_scripts':[
             'wordsearch = wordsearch:main'
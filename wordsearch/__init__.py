@@ -7,21 +7,54 @@ Example:
 
         $ python -m wordsearch <FILE>
 
+    Other commands are run by giving their name first, for example:
+
+        $ python -m wordsearch generate --size 15 DOG,CAT,PIG
+
+    Words can also be read from a separate file, which may be far larger
+    than memory, since it is searched a chunk at a time:
+
+        $ python -m wordsearch --words-file dictionary.txt <FILE>
+
 Attributes:
     __version__ (str): The module's version string.
+    DIRECTION_MODELS (dict): Maps the names accepted by the ``--directions``
+        option to the directions they enable.
+    COMMANDS (dict): Maps the name of each command to the module implementing
+        it. Each module provides a ``main`` function taking the command line
+        arguments that follow the command name.
 """
 import argparse
+import importlib
+import sys
 
-from wordsearch.solver import Puzzle
+from wordsearch.limits import LimitExceeded, Limits
+from wordsearch.progress import metrics_writer, progress_bar
+from wordsearch.solver import (CHUNK_SIZE, DIRECTIONS, FORWARD_DIRECTIONS,
+                               KNIGHT_MOVES, Puzzle)
+from wordsearch.wordlist import WordList, read_words
 
 __version__ = '0.1.0'
 
+DIRECTION_MODELS = {
+    'all': DIRECTIONS,
+    'forward': FORWARD_DIRECTIONS,
+    'knight': KNIGHT_MOVES,
+}
+
+COMMANDS = {
+    'batch': 'wordsearch.batch',
+    'compile-words': 'wordsearch.wordlist',
+    'generate': 'wordsearch.generate',
+}
+
 
 def format_results(results, words):
     """Formats the `results` for each word in `words`.
 
     The results are received as a dict mapping a word to the positions of the
-    characters of that word in the puzzle. The list of words is provided as a
+    characters of that word in the puzzle, either as a :obj:`list` or as a
+    :obj:`wordsearch.match.Match`. The list of words is provided as a
     second argument to control the order that the results should be printed in.
 
     This function assumes that the coordinates of each character are in the form
@@ -46,7 +79,7 @@ def format_results(results, words):
     return '\n'.join(strings)
 
 
-def parse_puzzle(puzzle_file):
+def parse_puzzle(puzzle_file, limits=None):
     """Parses a puzzle file, producing a list of words and puzzle board.
 
     Reads the contents of the open :obj:`file object`, and creates a list of
@@ -81,52 +114,268 @@ def parse_puzzle(puzzle_file):
     Args:
         puzzle_file (:obj:`file object`): An open file containing the puzzle to
             be parsed.
+        limits (:obj:`wordsearch.limits.Limits`): The limits on the size of the
+            input, the board and the word list. Nothing is limited if omitted.
 
     Returns:
         A two-tuple containing the :obj:`list` of words and the puzzle board as
         a square, two-dimensional :obj:`list`.
+
+    Raises:
+        LimitExceeded: As soon as the input goes over one of the ``limits``,
+            before the rest of the file is read.
     """
     if puzzle_file is None:
         raise ValueError('Invalid argument: puzzle_file must not be None.')
+    limits = limits if limits is not None else Limits()
     words = None
     puzzle = []
-    for line in puzzle_file:
+    for line in read_lines(puzzle_file, limits.max_input):
         # By splitting on nothing, the string is split on white space.
         # The combination of splitting and joining like this is used to remove
         # all white space (like the \n at the end of each line).
         line = ''.join(line.split()).split(',')
         if words is None:
+            limits.check('max_words', len(line))
             words = line
         else:
+            limits.check('max_size', len(line))
+            limits.check('max_size', len(puzzle) + 1)
             puzzle.append(line)
     return words, puzzle
 
 
+def read_lines(puzzle_file, max_input=None):
+    """A generator that yields the lines of ``puzzle_file`` without ever
+    reading more than ``max_input`` characters from it.
+
+    Args:
+        puzzle_file (:obj:`file object`): An open file to read from.
+        max_input (int): The maximum number of characters to read, or ``None``
+            to read the whole file.
+
+    Yields:
+        str: Each line of the file.
+
+    Raises:
+        LimitExceeded: If the file is longer than ``max_input`` characters.
+    """
+    if max_input is None:
+        yield from puzzle_file
+        return
+    consumed = 0
+    while True:
+        line = puzzle_file.readline(max_input - consumed + 1)
+        if not line:
+            return
+        consumed += len(line)
+        if consumed > max_input:
+            raise LimitExceeded('max_input', consumed, max_input)
+        yield line
+
+
 def build_argument_parser():
     """Constructs and configures an :obj:`argparse.ArgumentParser`.
 
-    The parser is configured with the program name, description, and a
-    positional argument for the input file.
+    The parser is configured with the program name, description, a
+    positional argument for the input file, and the optional resource limits
+    (see :class:`wordsearch.limits.Limits`).
 
     Returns:
         A configured instance of :obj:`argparse.ArgumentParser`.
     """
     argument_parser = argparse.ArgumentParser(
-        prog='wordsearch', description='Solves word search puzzles.')
+        prog='wordsearch',
+        description='Solves word search puzzles.',
+        epilog='other commands: %s (run "wordsearch COMMAND -h" for help)' %
+        ', '.join(sorted(COMMANDS)))
     argument_parser.add_argument('puzzle_file',
                                  help='The input puzzle file to solve.',
                                  type=argparse.FileType('r', encoding='UTF-8'))
+    words = argument_parser.add_mutually_exclusive_group()
+    words.add_argument(
+        '--words',
+        metavar='FILE',
+        help='A word list compiled with "wordsearch compile-words" to search '
+        'for, instead of the words in the puzzle file.')
+    words.add_argument(
+        '--words-file',
+        metavar='FILE',
+        help='A text file of words to search for, separated by commas or new '
+        'lines, instead of the words in the puzzle file. It is read and '
+        'searched in chunks, and words are printed as they are found.')
+    argument_parser.add_argument(
+        '--chunk-size',
+        type=int,
+        metavar='N',
+        default=CHUNK_SIZE,
+        help='Search N words of --words-file at a time (default: %s).' %
+        CHUNK_SIZE)
+    argument_parser.add_argument(
+        '--directions',
+        choices=sorted(DIRECTION_MODELS),
+        default='all',
+        help='The directions words may be spelled in (default: all).')
+    argument_parser.add_argument(
+        '--wrap',
+        action='store_true',
+        help='Let words wrap around the edges of the board.')
+    argument_parser.add_argument(
+        '--paths',
+        action='store_true',
+        help='Find words along paths of adjacent cells, as in Boggle, instead '
+        'of along straight lines.')
+    progress = argument_parser.add_argument_group('progress reporting')
+    progress.add_argument('--progress',
+                          action='store_true',
+                          help='Show a progress bar on standard error.')
+    progress.add_argument(
+        '--metrics',
+        metavar='FILE',
+        help='Write the words and cells searched per second, and the ETA, to '
+        'FILE as lines of JSON while searching.')
+    add_limit_arguments(argument_parser)
     return argument_parser
 
 
-def main():
-    """The main entry point of the program."""
+def add_limit_arguments(argument_parser):
+    """Adds the options of :func:`build_limits` to a command line parser, as
+    a group of resource limits.
+
+    Args:
+        argument_parser (:obj:`argparse.ArgumentParser`): The parser to
+            configure.
+    """
+    limits = argument_parser.add_argument_group('resource limits')
+    limits.add_argument('--max-size',
+                        type=int,
+                        metavar='N',
+                        help='Reject boards wider or taller than N.')
+    limits.add_argument('--max-words',
+                        type=int,
+                        metavar='N',
+                        help='Reject word lists longer than N words.')
+    limits.add_argument('--max-steps',
+                        type=int,
+                        metavar='N',
+                        help='Give up after N character comparisons.')
+    limits.add_argument('--timeout',
+                        type=float,
+                        metavar='SECONDS',
+                        help='Give up after searching for SECONDS.')
+    limits.add_argument('--max-input',
+                        type=int,
+                        metavar='N',
+                        help='Reject puzzle files longer than N characters.')
+
+
+def build_limits(arguments):
+    """Creates the :class:`wordsearch.limits.Limits` requested on the command
+    line.
+
+    Args:
+        arguments (:obj:`argparse.Namespace`): The parsed arguments.
+
+    Returns:
+        A :obj:`wordsearch.limits.Limits` instance.
+    """
+    return Limits(max_size=arguments.max_size,
+                  max_words=arguments.max_words,
+                  max_steps=arguments.max_steps,
+                  timeout=arguments.timeout,
+                  max_input=arguments.max_input)
+
+
+def build_progress(arguments, metrics_file):
+    """Creates the progress callback requested on the command line.
+
+    Args:
+        arguments (:obj:`argparse.Namespace`): The parsed arguments.
+        metrics_file (:obj:`file object`): The file to write metrics to, or
+            ``None``.
+
+    Returns:
+        A callable taking the metrics of a
+        :obj:`wordsearch.progress.Progress`, or ``None`` if no progress is to
+        be reported.
+    """
+    reporters = []
+    if arguments.progress:
+        reporters.append(progress_bar(sys.stderr))
+    if metrics_file is not None:
+        reporters.append(metrics_writer(metrics_file))
+    if not reporters:
+        return None
+
+    def report(metrics):
+        for reporter in reporters:
+            reporter(metrics)
+
+    return report
+
+
+def finish_progress(arguments):
+    """Ends the line of the progress bar, if one was drawn."""
+    if arguments.progress:
+        sys.stderr.write('\n')
+
+
+def main(argv=None):
+    """The main entry point of the program.
+
+    Args:
+        argv (:obj:`list` of :obj:`str`): The command line arguments. Defaults
+            to :obj:`sys.argv`.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        importlib.import_module(COMMANDS[argv[0]]).main(argv[1:])
+        return
     argument_parser = build_argument_parser()
-    arguments = argument_parser.parse_args()
-    words, board = parse_puzzle(arguments.puzzle_file)
-    arguments.puzzle_file.close()
-    puzzle = Puzzle(board)
-    print(format_results(puzzle.find_all(words), words))
+    arguments = argument_parser.parse_args(argv)
+    metrics_file = None
+    try:
+        limits = build_limits(arguments)
+        with arguments.puzzle_file:
+            words, board = parse_puzzle(arguments.puzzle_file, limits)
+        puzzle = Puzzle(board,
+                        limits,
+                        directions=DIRECTION_MODELS[arguments.directions],
+                        wrap=arguments.wrap)
+        search = puzzle.find_paths if arguments.paths else puzzle.find_all
+        if arguments.metrics is not None:
+            metrics_file = open(arguments.metrics, 'w', encoding='UTF-8')
+        on_progress = build_progress(arguments, metrics_file)
+
+        def warn(word, reason):
+            # pylint: disable=unused-argument
+            print('%s: warning: %s' % (argument_parser.prog, reason),
+                  file=sys.stderr)
+
+        if arguments.words is not None:
+            with WordList.load(arguments.words) as word_list:
+                results = search(word_list, on_progress=on_progress)
+            finish_progress(arguments)
+            print(format_results(results, list(results)))
+        elif arguments.words_file is not None:
+            stream = puzzle.iter_find_paths if arguments.paths else \
+                puzzle.iter_find
+            with open(arguments.words_file, encoding='UTF-8') as word_file:
+                for word, positions in stream(read_words(word_file), warn,
+                                              arguments.chunk_size,
+                                              on_progress):
+                    print(format_results({word: positions}, [word]),
+                          flush=True)
+            finish_progress(arguments)
+        else:
+            results = search(words, warn, on_progress=on_progress)
+            finish_progress(arguments)
+            print(format_results(results, list(results)))
+    except (LimitExceeded, OSError, ValueError) as error:
+        argument_parser.error(str(error))
+    finally:
+        if metrics_file is not None:
+            metrics_file.close()
 
 
 if __name__ == '__main__':
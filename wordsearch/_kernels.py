@@ -0,0 +1,432 @@
+"""The :mod:`_kernels` module contains the typed inner loops used by the
+:class:`wordsearch.solver.Puzzle` class and the puzzle generator.
+
+The functions in this module are written in the subset of Python understood by
+mypyc and Cython (pure Python mode) so that they may be compiled to a C
+extension when the package is installed with ``setup.py``. When no compiler is
+available, the extension is simply not built and this very same source file is
+imported instead, so the results never depend on how the package was installed.
+
+The board is passed to the kernels as a flat, row-major :obj:`list` of cells.
+A match is reported as a single integer code of the form
+``start * len(moves) + move``, where ``start`` is the flat index of the first
+character and ``move`` is the index of the direction in ``moves``. Only the
+given moves are ever tried, and when ``wrap`` is set, lines continue on the
+opposite edge of the board instead of stopping at it (a toroidal board).
+
+Every kernel also counts the steps it takes (one per starting cell visited plus
+one per character compared) and gives up as soon as it goes over the ``budget``
+it was given, so the caller can enforce a limit on adversarial input without
+any per-step overhead outside of the kernel. The path search, whose work from a
+single cell is not bounded by the size of the board, also reads the clock every
+:attr:`CLOCK_STEPS` steps and gives up once its ``deadline`` has passed.
+
+Attributes:
+    CLOCK_STEPS (int): The number of steps the path search takes between two
+        readings of the clock.
+"""
+import time
+from typing import List, Sequence, Tuple
+
+CLOCK_STEPS = 4096
+
+
+def scan(cells: Sequence[str], height: int, width: int, word: str,
+         moves: Sequence[Tuple[int, int]], wrap: bool, starts: Sequence[int],
+         limit: int, budget: int) -> Tuple[List[int], int]:
+    """Scans the board for straight-line occurrences of ``word``.
+
+    The starting positions are visited in the order given by ``starts`` and
+    the directions in the order given by ``moves``, so the first code returned
+    always describes the same occurrence that a naive search would find first.
+
+    Args:
+        cells (:obj:`list` of :obj:`str`): The board, flattened row by row.
+        height (int): The number of rows in the board.
+        width (int): The number of columns in the board.
+        word (str): The word to search for. It must not be empty.
+        moves (:obj:`list` of :obj:`tuple`): The (y, x) steps to search along.
+        wrap (bool): Whether lines wrap around the edges of the board.
+        starts (:obj:`list` of int): The flat indices of the cells to start
+            from.
+        limit (int): The maximum number of matches to collect, or zero to
+            collect every match.
+        budget (int): The number of steps the scan may take before giving up.
+
+    Returns:
+        tuple: A :obj:`tuple` containing the :obj:`list` of codes of the matches
+        found, in search order, and the number of steps taken. If the number of
+        steps is larger than ``budget`` the scan was abandoned early.
+    """
+    matches: List[int] = []
+    length = len(word)
+    distance = length - 1
+    count = len(moves)
+    first = word[0]
+    steps = 0
+    for start in starts:
+        steps += 1
+        if steps > budget:
+            return matches, steps
+        if cells[start] != first:
+            continue
+        row = start // width
+        column = start - row * width
+        for index in range(count):
+            step_y, step_x = moves[index]
+            offset = 1
+            if wrap:
+                # pylint: disable=invalid-name
+                y = row
+                x = column
+                while offset < length:
+                    y = (y + step_y) % height
+                    x = (x + step_x) % width
+                    if cells[y * width + x] != word[offset]:
+                        break
+                    offset += 1
+                # pylint: enable=invalid-name
+            else:
+                end_y = row + step_y * distance
+                end_x = column + step_x * distance
+                if end_y < 0 or end_y >= height or end_x < 0 or \
+                        end_x >= width:
+                    continue
+                step = step_y * width + step_x
+                position = start + step
+                while offset < length and cells[position] == word[offset]:
+                    position += step
+                    offset += 1
+            steps += offset
+            if offset == length:
+                matches.append(start * count + index)
+                if len(matches) == limit:
+                    return matches, steps
+        if steps > budget:
+            return matches, steps
+    return matches, steps
+
+
+def scan_trie(codes: Sequence[int], height: int, width: int,
+              moves: Sequence[Tuple[int, int]], wrap: bool,
+              starts: Sequence[int], first_edge: Sequence[int],
+              edge_count: Sequence[int], node_word: Sequence[int],
+              edge_code: Sequence[int], edge_target: Sequence[int],
+              shortest: int, found: List[int], budget: int) -> int:
+    """Scans the board for every word of a trie at once.
+
+    From each starting cell, and along each move, the trie is walked one cell
+    at a time until the line leaves the board or the trie has no edge for the
+    next character, so every word sharing a prefix shares the work of
+    matching it. Starts and moves are visited in the same order as
+    :func:`scan`, and only the first match of each word is kept, so each
+    word's code is the one :func:`scan` would return first. Lines are never
+    followed for more characters than the board is wide or high, so a wrapped
+    line stops after going around once. Lines too short to hold the shortest
+    word are not walked at all.
+
+    The trie is given as flat arrays: node ``n`` has the edges
+    ``first_edge[n]`` to ``first_edge[n] + edge_count[n]``, and it spells the
+    word ``node_word[n]``, or no word if that is negative. Node zero is the
+    root.
+
+    Args:
+        codes (:obj:`list` of int): The board, flattened row by row, with each
+            cell as a code point (or a negative number if it is not a single
+            character).
+        height (int): The number of rows in the board.
+        width (int): The number of columns in the board.
+        moves (:obj:`list` of :obj:`tuple`): The (y, x) steps to search along.
+        wrap (bool): Whether lines wrap around the edges of the board.
+        starts (:obj:`list` of int): The flat indices of the cells to start
+            from.
+        first_edge (:obj:`list` of int): The first edge of each node.
+        edge_count (:obj:`list` of int): The number of edges of each node.
+        node_word (:obj:`list` of int): The word spelled by each node.
+        edge_code (:obj:`list` of int): The code point of each edge.
+        edge_target (:obj:`list` of int): The node each edge leads to.
+        shortest (int): The length of the shortest word in the trie.
+        found (:obj:`list` of int): The match code of each word, or a negative
+            number for words not found yet. It is updated in place.
+        budget (int): The number of steps the scan may take before giving up.
+
+    Returns:
+        int: The number of steps taken. If it is larger than ``budget`` the
+        scan was abandoned early.
+    """
+    count = len(moves)
+    longest = max(height, width)
+    root_first = first_edge[0]
+    root_last = root_first + edge_count[0]
+    steps = 0
+    for start in starts:
+        steps += 1
+        if steps > budget:
+            return steps
+        code = codes[start]
+        node = -1
+        for edge in range(root_first, root_last):
+            if edge_code[edge] == code:
+                node = edge_target[edge]
+                break
+        if node < 0:
+            continue
+        row = start // width
+        column = start - row * width
+        for index in range(count):
+            step_y, step_x = moves[index]
+            if not wrap:
+                available = longest
+                if step_y > 0:
+                    available = min(available, (height - 1 - row) // step_y)
+                elif step_y < 0:
+                    available = min(available, row // -step_y)
+                if step_x > 0:
+                    available = min(available, (width - 1 - column) // step_x)
+                elif step_x < 0:
+                    available = min(available, column // -step_x)
+                if available + 1 < shortest:
+                    continue
+            current = node
+            # pylint: disable=invalid-name
+            y = row
+            x = column
+            depth = 1
+            while True:
+                word = node_word[current]
+                if word >= 0 and found[word] < 0:
+                    found[word] = start * count + index
+                if depth == longest:
+                    break
+                depth += 1
+                y += step_y
+                x += step_x
+                if wrap:
+                    y %= height
+                    x %= width
+                elif y < 0 or y >= height or x < 0 or x >= width:
+                    break
+                code = codes[y * width + x]
+                edge = first_edge[current]
+                last = edge + edge_count[current]
+                current = -1
+                while edge < last:
+                    if edge_code[edge] == code:
+                        current = edge_target[edge]
+                        break
+                    edge += 1
+                steps += 1
+                if current < 0:
+                    break
+            # pylint: enable=invalid-name
+        if steps > budget:
+            return steps
+    return steps
+
+
+def collect_trie(codes: Sequence[int], height: int, width: int,
+                 moves: Sequence[Tuple[int, int]], wrap: bool,
+                 starts: Sequence[int], first_edge: Sequence[int],
+                 edge_count: Sequence[int], node_word: Sequence[int],
+                 edge_code: Sequence[int], edge_target: Sequence[int],
+                 matches: List[int], budget: int) -> int:
+    """Scans the board for every occurrence of every word of a trie at once.
+
+    This walks the board exactly like :func:`scan_trie`, but instead of
+    keeping the first match of each word, it records every match, so that
+    the caller can count how often each word occurs.
+
+    Args:
+        codes (:obj:`list` of int): See :func:`scan_trie`.
+        height (int): The number of rows in the board.
+        width (int): The number of columns in the board.
+        moves (:obj:`list` of :obj:`tuple`): The (y, x) steps to search along.
+        wrap (bool): Whether lines wrap around the edges of the board.
+        starts (:obj:`list` of int): The flat indices of the cells to start
+            from.
+        first_edge (:obj:`list` of int): See :func:`scan_trie`.
+        edge_count (:obj:`list` of int): See :func:`scan_trie`.
+        node_word (:obj:`list` of int): See :func:`scan_trie`.
+        edge_code (:obj:`list` of int): See :func:`scan_trie`.
+        edge_target (:obj:`list` of int): See :func:`scan_trie`.
+        matches (:obj:`list` of int): Every match found is appended to it, in
+            search order, as the index of the word followed by the match
+            code.
+        budget (int): The number of steps the scan may take before giving up.
+
+    Returns:
+        int: The number of steps taken. If it is larger than ``budget`` the
+        scan was abandoned early.
+    """
+    count = len(moves)
+    longest = max(height, width)
+    root_first = first_edge[0]
+    root_last = root_first + edge_count[0]
+    steps = 0
+    for start in starts:
+        steps += 1
+        if steps > budget:
+            return steps
+        code = codes[start]
+        node = -1
+        for edge in range(root_first, root_last):
+            if edge_code[edge] == code:
+                node = edge_target[edge]
+                break
+        if node < 0:
+            continue
+        row = start // width
+        column = start - row * width
+        for index in range(count):
+            step_y, step_x = moves[index]
+            current = node
+            # pylint: disable=invalid-name
+            y = row
+            x = column
+            depth = 1
+            while True:
+                word = node_word[current]
+                if word >= 0:
+                    matches.append(word)
+                    matches.append(start * count + index)
+                if depth == longest:
+                    break
+                depth += 1
+                y += step_y
+                x += step_x
+                if wrap:
+                    y %= height
+                    x %= width
+                elif y < 0 or y >= height or x < 0 or x >= width:
+                    break
+                code = codes[y * width + x]
+                edge = first_edge[current]
+                last = edge + edge_count[current]
+                current = -1
+                while edge < last:
+                    if edge_code[edge] == code:
+                        current = edge_target[edge]
+                        break
+                    edge += 1
+                steps += 1
+                if current < 0:
+                    break
+            # pylint: enable=invalid-name
+        if steps > budget:
+            return steps
+    return steps
+
+
+def search_paths(codes: Sequence[int], neighbors: Sequence[Sequence[int]],
+                 starts: Sequence[int], first_edge: Sequence[int],
+                 edge_count: Sequence[int], node_word: Sequence[int],
+                 edge_code: Sequence[int], edge_target: Sequence[int],
+                 pending: List[int], paths: List[List[int]], budget: int,
+                 deadline: float) -> int:
+    """Searches the board for every word of a trie along paths of adjacent
+    cells, where no cell is used twice in the same word.
+
+    This is a depth-first search from each starting cell that only follows a
+    neighbor if the trie has an edge for its character, and that abandons a
+    branch as soon as every word below the current trie node has been found.
+    The cells on the current path are kept in a bitmask. Starts are visited in
+    the order given and neighbors in the order of ``neighbors``, and only the
+    first path found for each word is kept.
+
+    Args:
+        codes (:obj:`list` of int): The board, flattened row by row, with each
+            cell as a code point (or a negative number if it is not a single
+            character).
+        neighbors (:obj:`list` of :obj:`list` of int): The flat indices of the
+            cells adjacent to each cell.
+        starts (:obj:`list` of int): The flat indices of the cells to start
+            from.
+        first_edge (:obj:`list` of int): See :func:`scan_trie`.
+        edge_count (:obj:`list` of int): See :func:`scan_trie`.
+        node_word (:obj:`list` of int): See :func:`scan_trie`.
+        edge_code (:obj:`list` of int): See :func:`scan_trie`.
+        edge_target (:obj:`list` of int): See :func:`scan_trie`.
+        pending (:obj:`list` of int): The number of words not found yet below
+            each trie node, including the node itself. It is updated in place.
+        paths (:obj:`list` of :obj:`list` of int): The flat indices of the
+            cells of each word, or an empty list for words not found yet. It is
+            updated in place.
+        budget (int): The number of steps the search may take before giving
+            up.
+        deadline (float): The :func:`time.monotonic` time after which the
+            search gives up, or infinity.
+
+    Returns:
+        int: The number of steps taken. If it is larger than ``budget``, or if
+        the deadline has passed, the search was abandoned early.
+    """
+    steps = 0
+    for start in starts:
+        steps += 1
+        if steps > budget or pending[0] == 0:
+            return steps
+        node = child(0, codes[start], first_edge, edge_count, edge_code,
+                     edge_target)
+        if node < 0 or pending[node] == 0:
+            continue
+        cells: List[int] = [start]
+        nodes: List[int] = [node]
+        cursors: List[int] = [0]
+        visited = 1 << start
+        while cells:
+            cell = cells[-1]
+            node = nodes[-1]
+            cursor = cursors[-1]
+            around = neighbors[cell]
+            if cursor == len(around) or pending[node] == 0:
+                visited ^= 1 << cell
+                cells.pop()
+                nodes.pop()
+                cursors.pop()
+                continue
+            cursors[-1] = cursor + 1
+            neighbor = around[cursor]
+            bit = 1 << neighbor
+            if visited & bit:
+                continue
+            steps += 1
+            # A single start can branch exponentially, so the limits are
+            # checked within the search and not only between starts.
+            if steps > budget:
+                return steps
+            if steps % CLOCK_STEPS == 0 and time.monotonic() > deadline:
+                return steps
+            node = child(node, codes[neighbor], first_edge, edge_count,
+                         edge_code, edge_target)
+            if node < 0 or pending[node] == 0:
+                continue
+            cells.append(neighbor)
+            nodes.append(node)
+            cursors.append(0)
+            visited |= bit
+            word = node_word[node]
+            if word >= 0 and not paths[word]:
+                paths[word] = list(cells)
+                pending[0] -= 1
+                for parent in nodes:
+                    pending[parent] -= 1
+        if steps > budget:
+            return steps
+    return steps
+
+
+def child(node: int, code: int, first_edge: Sequence[int],
+          edge_count: Sequence[int], edge_code: Sequence[int],
+          edge_target: Sequence[int]) -> int:
+    """Follows the edge of a trie ``node`` labelled ``code``.
+
+    Returns:
+        int: The node the edge leads to, or -1 if there is no such edge.
+    """
+    edge = first_edge[node]
+    last = edge + edge_count[node]
+    while edge < last:
+        if edge_code[edge] == code:
+            return edge_target[edge]
+        edge += 1
+    return -1
@@ -0,0 +1,302 @@
+"""The :mod:`batch` module contains the ``batch`` command, which solves a
+corpus of puzzle files, searching each distinct board only once.
+
+Boards that are copies, rotations or mirror images of one another share a
+fingerprint (see :meth:`wordsearch.solver.Puzzle.fingerprint`). Each group of
+boards with the same fingerprint is searched once, on its canonical board, and
+the matches are mapped back to each board of the group.
+
+Example:
+    To solve every puzzle in a directory, do:
+
+        $ python -m wordsearch batch puzzles/*.puzzle
+
+    The results of each puzzle follow a ``==> FILE <==`` header, in the order
+    the files are given. With ``--export``, they are written to a binary,
+    columnar file instead (see :mod:`wordsearch.export`), a group of boards
+    at a time, as soon as each group is searched.
+"""
+import argparse
+import sys
+
+from wordsearch import (DIRECTION_MODELS, add_limit_arguments, build_limits,
+                        build_progress, finish_progress, format_results,
+                        parse_puzzle)
+from wordsearch.export import FORMATS, ResultWriter
+from wordsearch.limits import LimitExceeded
+from wordsearch.match import Match
+from wordsearch.progress import Progress
+from wordsearch.solver import Puzzle
+from wordsearch.wordlist import WordList
+
+
+def solve_corpus(puzzles,
+                 directions=None,
+                 wrap=False,
+                 limits=None,
+                 on_invalid=None,
+                 on_progress=None):
+    """Solves a corpus of puzzles, searching each distinct board once.
+
+    Collects the results of :func:`iter_solve_corpus` in the order of the
+    puzzles.
+
+    Args:
+        puzzles: An iterable of (words, board) pairs, as returned by
+            :func:`wordsearch.parse_puzzle`.
+        directions (:obj:`list` of :obj:`tuple`): The direction model. See
+            :class:`wordsearch.solver.Puzzle`.
+        wrap (bool): See :class:`wordsearch.solver.Puzzle`.
+        limits (:obj:`wordsearch.limits.Limits`): The resource limits enforced
+            on each board and each search.
+        on_invalid (callable): See :func:`iter_solve_corpus`.
+        on_progress (callable): See :func:`iter_solve_corpus`.
+
+    Returns:
+        tuple: A :obj:`tuple` of the results of each puzzle, in order (each a
+        :obj:`dict` mapping the words found to their
+        :obj:`wordsearch.match.Match`), and the number of distinct boards
+        searched.
+    """
+    results = {}
+    boards = 0
+    for indexes, found in iter_solve_corpus(puzzles, directions, wrap, limits,
+                                            on_invalid, on_progress):
+        results.update(zip(indexes, found))
+        boards += 1
+    return [results[index] for index in range(len(results))], boards
+
+
+def iter_solve_corpus(puzzles,
+                      directions=None,
+                      wrap=False,
+                      limits=None,
+                      on_invalid=None,
+                      on_progress=None):
+    """A generator that solves a corpus of puzzles, searching each distinct
+    board once, and gives the results of each group of boards as soon as it
+    is searched.
+
+    The result of each puzzle is exactly what
+    :meth:`wordsearch.solver.Puzzle.find_all` gives for it: the canonical
+    board is searched for the words of the whole group in a single pass per
+    distinct symmetry of its boards, trying the cells and directions in the
+    order the puzzle's own search would, so that a word occurring more than
+    once gets the same match. The boards of a group are released once it is
+    searched.
+
+    Args:
+        puzzles: An iterable of (words, board) pairs, as returned by
+            :func:`wordsearch.parse_puzzle`.
+        directions (:obj:`list` of :obj:`tuple`): The direction model. See
+            :class:`wordsearch.solver.Puzzle`.
+        wrap (bool): See :class:`wordsearch.solver.Puzzle`.
+        limits (:obj:`wordsearch.limits.Limits`): The resource limits enforced
+            on each board and each search.
+        on_invalid (callable): See :meth:`wordsearch.solver.Puzzle.find_all`.
+            Each invalid word is reported once per group of boards.
+        on_progress (callable): Called with the metrics of a
+            :obj:`wordsearch.progress.Progress`, counting the words of the
+            puzzles solved so far.
+
+    Yields:
+        tuple: The indexes of the puzzles of a group, in order, and the
+        results of each (a :obj:`dict` mapping the words found to their
+        :obj:`wordsearch.match.Match`).
+    """
+    members = []
+    groups = {}
+    for index, (words, board) in enumerate(puzzles):
+        puzzle = Puzzle(board, limits, directions, wrap)
+        fingerprint, symmetry = puzzle.canonical()
+        members.append((words, puzzle, symmetry))
+        groups.setdefault(fingerprint, []).append(index)
+    progress = None
+    if on_progress is not None:
+        progress = Progress(on_progress,
+                            sum(len(words) for words, _, _ in members))
+    for indexes in groups.values():
+        words = [word for index in indexes for word in members[index][0]]
+        puzzle = members[indexes[0]][1]
+        cells = puzzle.height * puzzle.width
+        if progress is not None:
+            progress.start_chunk(len(words), cells)
+        found = _solve_group([members[index] for index in indexes], words,
+                             on_invalid)
+        for index in indexes:
+            members[index] = None
+        if progress is not None:
+            progress.scanned(cells)
+            progress.finish_chunk()
+        yield indexes, found
+    if progress is not None:
+        progress.finish()
+
+
+def _solve_group(members, words, on_invalid):
+    """Searches the canonical board of a group of ``members`` for ``words``,
+    and gives the results of each member."""
+    _, first, symmetry = members[0]
+    board = symmetry.board(first.board)
+    # Each puzzle's word list is limited on its own, as in find_all.
+    for member_words, puzzle, _ in members:
+        puzzle.limits.check('max_words', len(member_words))
+    word_list = WordList.from_words(words, first.width)
+    if on_invalid is not None:
+        for word, reason in word_list.invalid:
+            on_invalid(word, reason)
+    # The whole group is charged to one budget, whatever its number of boards.
+    budget = first.limits.budget()
+    searches = {}
+    results = []
+    for member_words, puzzle, member_symmetry in members:
+        if member_symmetry not in searches:
+            searches[member_symmetry] = _search_as(puzzle, member_symmetry,
+                                                   board, word_list, budget)
+        found = searches[member_symmetry]
+        result = {}
+        for word in member_words:
+            if word in found and word not in result:
+                result[word] = found[word]
+        results.append(result)
+    return results
+
+
+def _search_as(puzzle, symmetry, board, word_list, budget):
+    """Searches the canonical ``board``, which ``symmetry`` maps ``puzzle``'s
+    board onto, for ``word_list``, trying the cells and the directions in the
+    order of ``puzzle``'s own search, and maps the matches back to
+    ``puzzle``."""
+    size = puzzle.width
+    canonical = Puzzle(
+        board, puzzle.limits,
+        [symmetry.direction(direction) for direction in puzzle.directions],
+        puzzle.wrap)
+    starts = []
+    for start in range(size * size):
+        row, column = symmetry.position(divmod(start, size), size)
+        starts.append(row * size + column)
+    inverse = symmetry.inverse()
+    wrapped = (size, size) if puzzle.wrap else None
+    return {
+        word: Match(inverse.position(match.start, size),
+                    inverse.direction(match.direction), match.length, wrapped)
+        for word, match in canonical.find_words(word_list, budget,
+                                                starts).items()
+    }
+
+
+def build_argument_parser():
+    """Constructs and configures the :obj:`argparse.ArgumentParser` of the
+    ``batch`` command.
+
+    Returns:
+        A configured instance of :obj:`argparse.ArgumentParser`.
+    """
+    argument_parser = argparse.ArgumentParser(
+        prog='wordsearch batch',
+        description='Solves many word search puzzles, searching boards that '
+        'are copies, rotations or mirror images of one another only once.')
+    argument_parser.add_argument('puzzle_files',
+                                 nargs='+',
+                                 metavar='puzzle_file',
+                                 help='The puzzle files to solve.')
+    argument_parser.add_argument(
+        '--directions',
+        choices=sorted(DIRECTION_MODELS),
+        default='all',
+        help='The directions words may be spelled in (default: all).')
+    argument_parser.add_argument(
+        '--wrap',
+        action='store_true',
+        help='Let words wrap around the edges of the board.')
+    argument_parser.add_argument('--progress',
+                                 action='store_true',
+                                 help='Show a progress bar on standard error.')
+    argument_parser.add_argument(
+        '--metrics',
+        metavar='FILE',
+        help='Write the words and cells searched per second, and the ETA, to '
+        'FILE as lines of JSON while searching.')
+    argument_parser.add_argument(
+        '--export',
+        metavar='FILE',
+        help='Write one row per match to FILE, in a binary columnar format, '
+        'instead of printing the results.')
+    argument_parser.add_argument(
+        '--export-format',
+        choices=FORMATS,
+        help='The format of --export (default: parquet if pyarrow is '
+        'installed, packed otherwise).')
+    add_limit_arguments(argument_parser)
+    return argument_parser
+
+
+def print_results(paths, results):
+    """Prints the results of each puzzle under a header naming its file.
+
+    Args:
+        paths (:obj:`list` of :obj:`str`): The puzzle files.
+        results (:obj:`list` of :obj:`dict`): The results of each puzzle.
+    """
+    for index, (path, result) in enumerate(zip(paths, results)):
+        if index:
+            sys.stdout.write('\n')
+        print('==> %s <==' % path)
+        if result:
+            print(format_results(result, list(result)))
+
+
+def main(argv=None):
+    """The entry point of the ``batch`` command.
+
+    Args:
+        argv (:obj:`list` of :obj:`str`): The command line arguments, without
+            the command name. Defaults to :obj:`sys.argv`.
+    """
+    argument_parser = build_argument_parser()
+    arguments = argument_parser.parse_args(argv)
+    metrics_file = None
+    try:
+        limits = build_limits(arguments)
+        puzzles = []
+        for path in arguments.puzzle_files:
+            with open(path, encoding='UTF-8') as puzzle_file:
+                puzzles.append(parse_puzzle(puzzle_file, limits))
+        if arguments.metrics is not None:
+            metrics_file = open(arguments.metrics, 'w', encoding='UTF-8')
+
+        def warn(word, reason):
+            # pylint: disable=unused-argument
+            print('%s: warning: %s' % (argument_parser.prog, reason),
+                  file=sys.stderr)
+
+        options = {
+            'directions': DIRECTION_MODELS[arguments.directions],
+            'wrap': arguments.wrap,
+            'limits': limits,
+            'on_invalid': warn,
+            'on_progress': build_progress(arguments, metrics_file)
+        }
+        if arguments.export is not None:
+            # The rows of each group are written as soon as it is searched.
+            boards = 0
+            with ResultWriter(arguments.export,
+                              arguments.export_format) as writer:
+                for indexes, found in iter_solve_corpus(puzzles, **options):
+                    for index, result in zip(indexes, found):
+                        writer.write(arguments.puzzle_files[index], result)
+                    boards += 1
+            finish_progress(arguments)
+        else:
+            results, boards = solve_corpus(puzzles, **options)
+            finish_progress(arguments)
+            print_results(arguments.puzzle_files, results)
+        print('solved %s puzzles with %s distinct boards' %
+              (len(puzzles), boards),
+              file=sys.stderr)
+    except (LimitExceeded, OSError, ValueError) as error:
+        argument_parser.error(str(error))
+    finally:
+        if metrics_file is not None:
+            metrics_file.close()
@@ -0,0 +1,230 @@
+"""The :mod:`export` module writes search results as columns of binary data,
+for analytics tools to load without parsing the text of
+:func:`wordsearch.format_results`.
+
+There is one row per match, with the columns ``puzzle`` (an identifier of the
+puzzle, such as its file name), ``word``, ``start_x``, ``start_y``,
+``direction_x``, ``direction_y`` and ``length``. Rows are buffered and written
+in batches.
+
+Two formats are supported. Parquet is written with ``pyarrow``, when it is
+installed. The packed format needs nothing but the standard library: a header
+of two little-endian, unsigned 32-bit integers, the :attr:`MAGIC` number and
+the :attr:`VERSION`, followed by batches. Each batch starts with three unsigned
+32-bit integers, the number of rows and the number of bytes of puzzle and word
+text. Then come 32-bit signed integer columns, in the order ``puzzle_offset``
+and ``word_offset`` (one per row, plus one), ``start_x``, ``start_y``,
+``direction_x``, ``direction_y`` and ``length`` (one per row), and finally
+the UTF-8 text of the puzzles and of the words, back to back.
+
+Example:
+    To export the results of a corpus, do:
+
+        $ python -m wordsearch batch --export results.parquet puzzles/*.puzzle
+
+Attributes:
+    MAGIC (int): The number that every packed result file starts with.
+    VERSION (int): The version of the packed format.
+    BATCH_SIZE (int): The number of rows written at a time by default.
+    FORMATS (:obj:`list` of :obj:`str`): The formats that can be written.
+    COLUMNS (:obj:`list` of :obj:`str`): The names of the columns.
+"""
+import array
+import struct
+import sys
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None  # pylint: disable=invalid-name
+
+MAGIC = 0x58525357  # b'WSRX' in little-endian order.
+VERSION = 1
+BATCH_SIZE = 65536
+FORMATS = ['packed', 'parquet']
+COLUMNS = [
+    'puzzle', 'word', 'start_x', 'start_y', 'direction_x', 'direction_y',
+    'length'
+]
+
+HEADER = struct.Struct('<2I')
+BATCH = struct.Struct('<3I')
+
+NUMBERS = COLUMNS[2:]
+
+
+def default_format():
+    """Gives the format written when none is chosen: Parquet if ``pyarrow``
+    is installed, or the packed format otherwise.
+
+    Returns:
+        str: One of :attr:`FORMATS`.
+    """
+    return 'packed' if pyarrow is None else 'parquet'
+
+
+class ResultWriter:
+    """The :class:`ResultWriter` class buffers matches as rows and writes them
+    to a file in batches, in one of the :attr:`FORMATS`.
+
+    Args:
+        path (str): The file to write.
+        format (str): One of :attr:`FORMATS`, or ``None`` for
+            :func:`default_format`.
+        batch_size (int): The number of rows written at a time.
+
+    Raises:
+        ValueError: If the format is unknown, or if it is Parquet and
+            ``pyarrow`` is not installed.
+    """
+
+    # pylint: disable=redefined-builtin
+    def __init__(self, path, format=None, batch_size=BATCH_SIZE):
+        format = default_format() if format is None else format
+        if format not in FORMATS:
+            raise ValueError('unknown export format (%s).' % format)
+        if format == 'parquet' and pyarrow is None:
+            raise ValueError('the parquet format requires pyarrow.')
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive.')
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self.rows = 0
+        self.columns = {name: [] for name in COLUMNS}
+        self.parquet = None
+        self.file = None
+        if format == 'parquet':
+            # The schema is fixed, so that a file is written even without
+            # any rows.
+            schema = pyarrow.schema(
+                [(name, pyarrow.string()) for name in COLUMNS[:2]] +
+                [(name, pyarrow.int32()) for name in NUMBERS])
+            self.parquet = pyarrow.parquet.ParquetWriter(path, schema)
+        else:
+            self.file = open(path, 'wb')
+            self.file.write(HEADER.pack(MAGIC, VERSION))
+    # pylint: enable=redefined-builtin
+
+    def write(self, puzzle, results):
+        """Adds a row for each match of a puzzle.
+
+        Args:
+            puzzle (str): The identifier of the puzzle.
+            results (dict): Maps each word found to its
+                :obj:`wordsearch.match.Match`.
+        """
+        columns = self.columns
+        for word, match in results.items():
+            columns['puzzle'].append(puzzle)
+            columns['word'].append(word)
+            columns['start_x'].append(match.start[1])
+            columns['start_y'].append(match.start[0])
+            columns['direction_x'].append(match.direction[1])
+            columns['direction_y'].append(match.direction[0])
+            columns['length'].append(match.length)
+            if len(columns['word']) == self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """Writes the buffered rows as a batch."""
+        columns = self.columns
+        count = len(columns['word'])
+        if not count:
+            return
+        if self.format == 'parquet':
+            schema = self.parquet.schema
+            arrays = [
+                pyarrow.array(columns[field.name], field.type)
+                for field in schema
+            ]
+            self.parquet.write_table(pyarrow.table(arrays, schema=schema))
+        else:
+            texts = []
+            offsets = []
+            for name in ['puzzle', 'word']:
+                encoded = [value.encode('UTF-8') for value in columns[name]]
+                offset = array.array('i', [0])
+                for data in encoded:
+                    offset.append(offset[-1] + len(data))
+                texts.append(b''.join(encoded))
+                offsets.append(offset)
+            self.file.write(BATCH.pack(count, len(texts[0]), len(texts[1])))
+            for values in offsets + [
+                    array.array('i', columns[name]) for name in NUMBERS
+            ]:
+                if sys.byteorder != 'little':
+                    values.byteswap()
+                self.file.write(values.tobytes())
+            for text in texts:
+                self.file.write(text)
+        self.rows += count
+        for values in columns.values():
+            values.clear()
+
+    def close(self):
+        """Writes the remaining rows and closes the file."""
+        self.flush()
+        if self.parquet is not None:
+            self.parquet.close()
+            self.parquet = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_packed(result_file):
+    """A generator that reads the batches of a file in the packed format.
+
+    Args:
+        result_file (:obj:`file object`): A file open for reading bytes.
+
+    Yields:
+        dict: The columns of each batch, by name (see :attr:`COLUMNS`), as
+        :obj:`list` of :obj:`str` or :obj:`array.array` of int.
+
+    Raises:
+        ValueError: If the file is not in the packed format.
+    """
+    header = result_file.read(HEADER.size)
+    if len(header) != HEADER.size or HEADER.unpack(header)[0] != MAGIC:
+        raise ValueError('not a packed result file.')
+    version = HEADER.unpack(header)[1]
+    if version != VERSION:
+        raise ValueError('unsupported result file version (%s).' % version)
+    while True:
+        header = result_file.read(BATCH.size)
+        if not header:
+            return
+        if len(header) != BATCH.size:
+            raise ValueError('the packed result file is truncated.')
+        count, puzzle_size, word_size = BATCH.unpack(header)
+        arrays = []
+        for length in [count + 1] * 2 + [count] * len(NUMBERS):
+            values = array.array('i')
+            data = result_file.read(4 * length)
+            if len(data) != 4 * length:
+                raise ValueError('the packed result file is truncated.')
+            values.frombytes(data)
+            if sys.byteorder != 'little':
+                values.byteswap()
+            arrays.append(values)
+        batch = {}
+        for name, offsets, size in [('puzzle', arrays[0], puzzle_size),
+                                    ('word', arrays[1], word_size)]:
+            text = result_file.read(size)
+            if len(text) != size:
+                raise ValueError('the packed result file is truncated.')
+            batch[name] = [
+                text[offsets[index]:offsets[index + 1]].decode('UTF-8')
+                for index in range(count)
+            ]
+        batch.update(zip(NUMBERS, arrays[2:]))
+        yield batch
@@ -0,0 +1,519 @@
+"""The :mod:`generate` module creates word search puzzles from a list of words,
+using the same direction model as :mod:`wordsearch.solver`.
+
+Example:
+    To generate a puzzle from the command line, do:
+
+        $ python -m wordsearch generate --size 15 --seed 1 DOG,CAT,PIG
+
+    The output is in the format read by :func:`wordsearch.parse_puzzle`.
+
+Attributes:
+    ALPHABET (str): The letters used to fill the cells not covered by a word.
+"""
+import argparse
+import random
+import sys
+
+from wordsearch import _kernels
+from wordsearch.limits import UNLIMITED
+from wordsearch.solver import DIRECTIONS, MIN_WORD_SIZE
+from wordsearch.wordlist import WordList
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+class PuzzleGenerator:
+    """The :class:`PuzzleGenerator` class places words on a square board and
+    fills the remaining cells with random letters, so that every word can be
+    found exactly once.
+
+    Words are placed along the given ``directions``, so a generator restricted
+    to, say, :attr:`wordsearch.solver.FORWARD_DIRECTIONS` makes puzzles for a
+    :class:`wordsearch.solver.Puzzle` restricted the same way.
+
+    A generator is meant to be reused: the placement tables for its board size
+    are computed once, and its random number generator is seeded once, so a
+    given seed always produces the same sequence of puzzles.
+
+    Args:
+        size (int): The width and height of the generated boards.
+        seed: The seed for the random number generator, or ``None``.
+        alphabet (str): The letters used to fill the empty cells.
+        max_density (float): The largest fraction of the board that the words
+            may cover, between 0 and 1.
+        max_attempts (int): The number of times a puzzle is laid out from
+            scratch before giving up.
+        directions (:obj:`list` of :obj:`tuple`): The (y, x) steps that words
+            may be placed along. Defaults to :attr:`DIRECTIONS`.
+
+    Raises:
+        ValueError: If ``size`` is smaller than :attr:`MIN_WORD_SIZE`, the
+            alphabet has fewer than two letters, or ``max_density`` is not in
+            the range (0, 1].
+    """
+
+    def __init__(self,
+                 size,
+                 seed=None,
+                 alphabet=ALPHABET,
+                 max_density=1.0,
+                 max_attempts=100,
+                 directions=None):
+        if size < MIN_WORD_SIZE:
+            raise ValueError('size must be at least %s.' % MIN_WORD_SIZE)
+        if len(set(alphabet)) < 2:
+            raise ValueError('alphabet must have at least two letters.')
+        if not 0 < max_density <= 1:
+            raise ValueError('max_density must be in the range (0, 1].')
+        self.size = size
+        self.alphabet = alphabet
+        self.max_density = max_density
+        self.max_attempts = max_attempts
+        self.random = random.Random(seed)
+        self.directions = list(DIRECTIONS if directions is None else directions)
+        # The flat step of each direction and, for each word length, the
+        # range of starting rows and columns that keep the word on the board.
+        self.steps = [y * size + x for y, x in self.directions]
+        self.bounds = {}
+        # The layout and the occurrence tracker of the last list of words.
+        self.prepared = None
+
+    def start_ranges(self, move, length):
+        """Gives the rows and columns a word of ``length`` characters can start
+        from when placed along ``directions[move]``.
+
+        Args:
+            move (int): The index of the direction in ``directions``.
+            length (int): The number of characters in the word.
+
+        Returns:
+            tuple: A :obj:`tuple` of two :obj:`range` objects, giving the valid
+            rows and the valid columns.
+        """
+        key = (move, length)
+        if key not in self.bounds:
+            ranges = []
+            for step in self.directions[move]:
+                low = -step * (length - 1) if step < 0 else 0
+                high = self.size - step * (length - 1) if step > 0 else \
+                    self.size
+                ranges.append(range(low, high))
+            self.bounds[key] = tuple(ranges)
+        return self.bounds[key]
+
+    def generate(self, words):
+        """Generates a board containing each of the ``words`` exactly once.
+
+        Args:
+            words (:obj:`list` of :obj:`str`): The words to place on the board.
+
+        Returns:
+            :obj:`list` of :obj:`list` of :obj:`str`: The generated board.
+
+        Raises:
+            ValueError: If a word is too short or too long for the board, if
+                the words would cover more than ``max_density`` of the board,
+                or if no layout was found after ``max_attempts`` attempts.
+        """
+        for word in words:
+            if not MIN_WORD_SIZE <= len(word) <= self.size:
+                raise ValueError('the word (%s) does not fit on the board.' %
+                                 word)
+        if sum(len(word) for word in words) > \
+                self.max_density * self.size * self.size:
+            raise ValueError('the words exceed the maximum density.')
+        if self.prepared is None or self.prepared[0] != words:
+            self.prepared = (list(words), plan(words),
+                             Occurrences(WordList.from_words(words),
+                                         self.size, self.directions))
+        _, layout, occurrences = self.prepared
+        for _ in range(self.max_attempts):
+            cells = self.place(layout)
+            if cells is None:
+                continue
+            board = self.fill(occurrences, cells)
+            if board is not None:
+                return board
+        raise ValueError('could not generate a puzzle after %s attempts.' %
+                         self.max_attempts)
+
+    def place(self, words):
+        """Places the ``words`` on an empty board, in the given order.
+
+        Args:
+            words (:obj:`list` of :obj:`str`): The words to place, as given by
+                :func:`plan`.
+
+        Returns:
+            :obj:`list`: The flat board with ``None`` in every free cell, or
+            ``None`` if a word could not be placed.
+        """
+        cells = [None] * (self.size * self.size)
+        occupied = 0
+        for word in words:
+            occupied = self.place_word(word, cells, occupied)
+            if occupied is None:
+                return None
+        return cells
+
+    def place_word(self, word, cells, occupied):
+        """Places a single ``word`` on the board.
+
+        Random placements are tried first; if they all collide, every
+        placement is tried in a random order. A placement is allowed to cross
+        another word only where both words have the same letter.
+
+        Args:
+            word (str): The word to place.
+            cells (:obj:`list`): The flat board, updated in place.
+            occupied (int): A bitmap of the cells that are already covered.
+
+        Returns:
+            int: The updated occupancy bitmap, or ``None`` if the word could
+            not be placed.
+        """
+        candidates = []
+        for move in range(len(self.directions)):
+            rows, columns = self.start_ranges(move, len(word))
+            if rows and columns:
+                candidates.append((move, rows, columns))
+        if not candidates:
+            return None
+        for _ in range(16):
+            move, rows, columns = self.random.choice(candidates)
+            start = self.random.choice(rows) * self.size + \
+                self.random.choice(columns)
+            mask = self.fits(word, cells, occupied, start, self.steps[move])
+            if mask is not None:
+                self.write(word, cells, start, self.steps[move])
+                return occupied | mask
+        placements = [(row * self.size + column, move)
+                      for move, rows, columns in candidates
+                      for row in rows
+                      for column in columns]
+        self.random.shuffle(placements)
+        for start, move in placements:
+            mask = self.fits(word, cells, occupied, start, self.steps[move])
+            if mask is not None:
+                self.write(word, cells, start, self.steps[move])
+                return occupied | mask
+        return None
+
+    @staticmethod
+    def fits(word, cells, occupied, start, step):
+        """Checks whether ``word`` can be written from ``start`` along
+        ``step`` without changing any covered cell.
+
+        Returns:
+            int: The bitmap of the cells the word would cover, or ``None`` if
+            the word collides with another one.
+        """
+        mask = 0
+        position = start
+        for character in word:
+            bit = 1 << position
+            if occupied & bit and cells[position] != character:
+                return None
+            mask |= bit
+            position += step
+        return mask
+
+    @staticmethod
+    def write(word, cells, start, step):
+        """Writes ``word`` to ``cells`` from ``start`` along ``step``."""
+        position = start
+        for character in word:
+            cells[position] = character
+            position += step
+
+    def fill(self, occurrences, cells):
+        """Fills the free cells with random letters, then redraws the letters
+        that accidentally spell one of the words a second time.
+
+        The board is verified in a single pass over the trie of the words,
+        and after each redrawn letter only the lines through that cell are
+        searched again.
+
+        Args:
+            occurrences (:class:`Occurrences`): The tracker of the words
+                placed on the board, which is loaded with the filled board.
+            cells (:obj:`list`): The flat board, with ``None`` in free cells.
+
+        Returns:
+            :obj:`list` of :obj:`list` of :obj:`str`: The board, or ``None``
+            if a duplicate is made up of placed letters only.
+
+        Raises:
+            ValueError: If a word does not appear at all.
+        """
+        free = [index for index, cell in enumerate(cells) if cell is None]
+        letters = self.random.choices(self.alphabet, k=len(free))
+        for index, letter in zip(free, letters):
+            cells[index] = letter
+        free = set(free)
+        occurrences.load(cells)
+        for _ in range(self.max_attempts):
+            duplicates = occurrences.duplicates()
+            if duplicates is None:
+                return [cells[row:row + self.size]
+                        for row in range(0, len(cells), self.size)]
+            # Any occurrence but one made of placed letters only must go.
+            redraw = [[position for position in duplicate if position in free]
+                      for duplicate in duplicates]
+            if sum(1 for positions in redraw if not positions) > 1:
+                return None
+            position = self.random.choice(
+                [position for positions in redraw for position in positions])
+            letter = self.random.choice(
+                [letter for letter in self.alphabet
+                 if letter != cells[position]])
+            cells[position] = letter
+            occurrences.update(position, letter)
+        return None
+
+
+class Occurrences:
+    """The :class:`Occurrences` class keeps track of where each word of a word
+    list occurs on a board, along straight lines that do not wrap, and keeps
+    it up to date as the letters of the board change.
+
+    A board is searched once, when it is loaded, in a single pass over the
+    trie of the word list. When a cell changes, only the occurrences through that cell are
+    dropped and only the lines through it are searched again. An occurrence
+    is a set of cells, so a palindrome read in both directions occurs once.
+
+    Args:
+        word_list (:obj:`wordsearch.wordlist.WordList`): The words to track.
+        size (int): The width and height of the board.
+        directions (:obj:`list` of :obj:`tuple`): The (y, x) steps words are
+            read along.
+    """
+
+    def __init__(self, word_list, size, directions):
+        self.word_list = word_list
+        self.lengths = [len(word) for word in word_list]
+        # Lists are indexed faster than the arrays of the word list.
+        self.trie = tuple(
+            list(values)
+            for values in (word_list.first_edge, word_list.edge_count,
+                           word_list.node_word, word_list.edge_code,
+                           word_list.edge_target))
+        self.size = size
+        self.directions = list(directions)
+        self.steps = [y * size + x for y, x in self.directions]
+        self.firsts = {ord(word[0]) for word in word_list}
+        self.codes = []
+        # The start and flat step of each occurrence of each word, by the
+        # first and last cells of the occurrence, in either order.
+        self.found = []
+
+    def load(self, cells):
+        """Searches a new board, given as a flat :obj:`list` of letters, row
+        by row."""
+        self.codes = [ord(cell) for cell in cells]
+        self.found = [{} for _ in range(len(self.word_list))]
+        self.search(range(self.size * self.size))
+
+    def search(self, starts):
+        """Records every occurrence starting from one of the ``starts``."""
+        codes = self.codes
+        firsts = self.firsts
+        # Only cells holding the first letter of a word can start one.
+        starts = [start for start in starts if codes[start] in firsts]
+        matches = []
+        _kernels.collect_trie(self.codes, self.size, self.size,
+                              self.directions, False, starts, *self.trie,
+                              matches, UNLIMITED)
+        count = len(self.directions)
+        for index in range(0, len(matches), 2):
+            word = matches[index]
+            start, move = divmod(matches[index + 1], count)
+            step = self.steps[move]
+            end = start + step * (self.lengths[word] - 1)
+            self.found[word][min(start, end), max(start, end)] = start, step
+
+    def update(self, position, letter):
+        """Changes the letter of the cell at the flat index ``position``."""
+        self.codes[position] = ord(letter)
+        for word, found in enumerate(self.found):
+            length = self.lengths[word]
+            for key, (start, step) in list(found.items()):
+                if position in range(start, start + step * length, step):
+                    del found[key]
+        row, column = divmod(position, self.size)
+        longest = max(self.lengths, default=0)
+        starts = set()
+        for step_y, step_x in self.directions:
+            # pylint: disable=invalid-name
+            y, x = row, column
+            for _ in range(longest):
+                if not (0 <= y < self.size and 0 <= x < self.size):
+                    break
+                starts.add(y * self.size + x)
+                y, x = y - step_y, x - step_x
+            # pylint: enable=invalid-name
+        self.search(sorted(starts))
+
+    def duplicates(self):
+        """Looks for a word that does not appear exactly once.
+
+        Returns:
+            :obj:`list`: The flat indices of the cells of each occurrence of
+            the first such word, in the order of the word list, or ``None``
+            if every word appears exactly once.
+
+        Raises:
+            ValueError: If a word does not appear at all.
+        """
+        for word, found in enumerate(self.found):
+            if not found:
+                raise ValueError('the word (%s) is missing.' %
+                                 self.word_list[word])
+            if len(found) > 1:
+                length = self.lengths[word]
+                return [
+                    list(range(start, start + step * length, step))
+                    for start, step in found.values()
+                ]
+        return None
+
+
+def plan(words):
+    """Decides which of the ``words`` have to be placed, longest word first.
+
+    A word that is spelled out by a longer word (forwards or backwards) is not
+    placed on its own, since that would make it appear twice.
+
+    Args:
+        words (:obj:`list` of :obj:`str`): The words to place.
+
+    Returns:
+        :obj:`list` of :obj:`str`: The words to place, in placement order.
+
+    Raises:
+        ValueError: If a word is spelled out by more than one longer word, in
+            which case it can never appear exactly once.
+    """
+    placed = []
+    for word in sorted(dict.fromkeys(words), key=len, reverse=True):
+        containers = [
+            other for other in placed
+            if word in other or word[::-1] in other
+        ]
+        if len(containers) > 1:
+            raise ValueError('the word (%s) is part of more than one word.' %
+                             word)
+        if not containers:
+            placed.append(word)
+    return placed
+
+
+def find_duplicate(puzzle, words):
+    """Looks for a word that does not appear exactly once in ``puzzle``.
+
+    A palindrome read in both directions counts as a single occurrence.
+
+    Args:
+        puzzle (:obj:`wordsearch.solver.Puzzle`): The puzzle to check. It must
+            not wrap.
+        words (:obj:`list` of :obj:`str`): The words that should appear once.
+
+    Returns:
+        :obj:`set`: The positions of an extra occurrence, or ``None`` if every
+        word appears exactly once.
+
+    Raises:
+        ValueError: If a word does not appear at all.
+    """
+    occurrences = Occurrences(WordList.from_words(words), puzzle.width,
+                              puzzle.directions)
+    occurrences.load(puzzle.cells())
+    duplicates = occurrences.duplicates()
+    if duplicates is None:
+        return None
+    return {divmod(position, puzzle.width) for position in duplicates[1]}
+
+
+def format_puzzle(words, board):
+    """Formats ``words`` and ``board`` in the format read by
+    :func:`wordsearch.parse_puzzle`.
+
+    Args:
+        words (:obj:`list` of :obj:`str`): The list of words.
+        board (:obj:`list` of :obj:`list` of :obj:`str`): The puzzle board.
+
+    Returns:
+        str: The puzzle, with the comma separated words on the first line and
+        one comma separated row of the board on each following line.
+    """
+    return '\n'.join([','.join(words)] + [','.join(row) for row in board])
+
+
+def build_argument_parser():
+    """Constructs and configures the :obj:`argparse.ArgumentParser` of the
+    ``generate`` command.
+
+    Returns:
+        A configured instance of :obj:`argparse.ArgumentParser`.
+    """
+    argument_parser = argparse.ArgumentParser(
+        prog='wordsearch generate',
+        description='Generates word search puzzles.')
+    argument_parser.add_argument(
+        'words', help='The comma separated list of words to place.')
+    argument_parser.add_argument('--size',
+                                 type=int,
+                                 default=15,
+                                 help='The width and height of the board.')
+    argument_parser.add_argument('--seed',
+                                 type=int,
+                                 help='The seed for the random letters.')
+    argument_parser.add_argument('--count',
+                                 type=int,
+                                 default=1,
+                                 help='The number of puzzles to generate.')
+    argument_parser.add_argument('--alphabet',
+                                 default=ALPHABET,
+                                 help='The letters used to fill the board.')
+    argument_parser.add_argument(
+        '--max-density',
+        type=float,
+        default=1.0,
+        help='The largest fraction of the board the words may cover.')
+    argument_parser.add_argument(
+        '--output',
+        help='A file name pattern containing {index} to write each puzzle to. '
+        'Puzzles are written to standard output, separated by a blank line, '
+        'if omitted.')
+    return argument_parser
+
+
+def main(argv=None):
+    """The entry point of the ``generate`` command.
+
+    Args:
+        argv (:obj:`list` of :obj:`str`): The command line arguments, without
+            the command name. Defaults to :obj:`sys.argv`.
+    """
+    argument_parser = build_argument_parser()
+    arguments = argument_parser.parse_args(argv)
+    words = ''.join(arguments.words.split()).split(',')
+    try:
+        generator = PuzzleGenerator(arguments.size,
+                                    seed=arguments.seed,
+                                    alphabet=arguments.alphabet,
+                                    max_density=arguments.max_density)
+        for index in range(arguments.count):
+            text = format_puzzle(words, generator.generate(words))
+            if arguments.output is None:
+                if index:
+                    sys.stdout.write('\n')
+                print(text)
+            else:
+                with open(arguments.output.format(index=index),
+                          'w',
+                          encoding='UTF-8') as puzzle_file:
+                    puzzle_file.write(text + '\n')
+    except ValueError as error:
+        argument_parser.error(str(error))
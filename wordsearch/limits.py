@@ -0,0 +1,164 @@
+"""The :mod:`limits` module contains the resource limits that can be placed on
+parsing and solving a puzzle, so that adversarial input produces an error
+instead of a stalled worker.
+
+Example:
+    Limits are passed to :func:`wordsearch.parse_puzzle` and to
+    :class:`wordsearch.solver.Puzzle`::
+
+        limits = Limits(max_size=100, max_words=1000, timeout=2.0)
+        words, board = parse_puzzle(puzzle_file, limits=limits)
+        puzzle = Puzzle(board, limits=limits)
+
+Attributes:
+    UNLIMITED (int): The step budget handed to the search kernels when no step
+        limit is configured.
+"""
+import math
+import sys
+import time
+
+UNLIMITED = sys.maxsize
+
+
+class LimitExceeded(RuntimeError):
+    """Raised when a puzzle or a search exceeds one of its :class:`Limits`.
+
+    Args:
+        limit (str): The name of the limit that was exceeded, which is the name
+            of the matching :class:`Limits` attribute.
+        value: The value that exceeded the limit.
+        maximum: The configured maximum.
+
+    Attributes:
+        limit (str): The name of the limit that was exceeded.
+        value: The value that exceeded the limit.
+        maximum: The configured maximum.
+    """
+
+    def __init__(self, limit, value, maximum):
+        super().__init__('%s exceeded: %s > %s' % (limit, value, maximum))
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+
+    def as_dict(self):
+        """Gives the error as a :obj:`dict`, suitable for logging or JSON.
+
+        Returns:
+            A :obj:`dict` with the ``limit``, ``value`` and ``maximum`` keys.
+        """
+        return {
+            'limit': self.limit,
+            'value': self.value,
+            'maximum': self.maximum
+        }
+
+
+class Limits:
+    """The :class:`Limits` class holds the configurable resource limits. Every
+    limit is optional; a limit of ``None`` is not enforced.
+
+    Args:
+        max_size (int): The maximum width (and height) of a board.
+        max_words (int): The maximum number of words in a word list.
+        max_steps (int): The maximum number of character comparisons made by a
+            single call to :meth:`wordsearch.solver.Puzzle.find` or
+            :meth:`wordsearch.solver.Puzzle.find_all`.
+        timeout (float): The maximum number of seconds a single search may run.
+        max_input (int): The maximum number of characters read from a puzzle
+            file.
+
+    Raises:
+        ValueError: If any of the limits is not positive.
+    """
+
+    def __init__(self,
+                 max_size=None,
+                 max_words=None,
+                 max_steps=None,
+                 timeout=None,
+                 max_input=None):
+        for name, value in [('max_size', max_size), ('max_words', max_words),
+                            ('max_steps', max_steps), ('timeout', timeout),
+                            ('max_input', max_input)]:
+            if value is not None and value <= 0:
+                raise ValueError('%s must be positive.' % name)
+        self.max_size = max_size
+        self.max_words = max_words
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.max_input = max_input
+
+    def check(self, limit, value):
+        """Checks ``value`` against the limit called ``limit``.
+
+        Args:
+            limit (str): The name of the limit to check.
+            value: The value to be checked.
+
+        Raises:
+            LimitExceeded: If the limit is set and ``value`` is larger.
+        """
+        maximum = getattr(self, limit)
+        if maximum is not None and value > maximum:
+            raise LimitExceeded(limit, value, maximum)
+
+    def budget(self):
+        """Starts a new :class:`Budget` for a single search.
+
+        Returns:
+            A :class:`Budget`, or ``None`` if neither a step limit nor a timeout
+            is configured.
+        """
+        if self.max_steps is None and self.timeout is None:
+            return None
+        return Budget(self.max_steps, self.timeout)
+
+
+class Budget:
+    """The :class:`Budget` class tracks the steps and time spent by a single
+    search against the limits it was created with.
+
+    Args:
+        max_steps (int): The number of comparison steps available, or ``None``.
+        timeout (float): The number of seconds available, or ``None``.
+    """
+
+    def __init__(self, max_steps=None, timeout=None):
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.steps = 0
+        self.started = time.monotonic()
+
+    @property
+    def remaining(self):
+        """int: The number of steps left, or :attr:`UNLIMITED`."""
+        if self.max_steps is None:
+            return UNLIMITED
+        return self.max_steps - self.steps
+
+    @property
+    def deadline(self):
+        """float: The :func:`time.monotonic` time at which the timeout expires,
+        or infinity."""
+        if self.timeout is None:
+            return math.inf
+        return self.started + self.timeout
+
+    def spend(self, steps):
+        """Records ``steps`` comparison steps and checks both limits.
+
+        Args:
+            steps (int): The number of steps taken since the last call.
+
+        Raises:
+            LimitExceeded: If the step limit or the timeout has been exceeded.
+        """
+        self.steps += steps
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise LimitExceeded('max_steps', self.steps, self.max_steps)
+        if self.timeout is not None:
+            elapsed = time.monotonic() - self.started
+            if elapsed > self.timeout:
+                raise LimitExceeded('timeout', round(elapsed, 3), self.timeout)
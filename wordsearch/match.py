@@ -0,0 +1,112 @@
+"""The :mod:`match` module contains the :class:`Match` class, the compact
+result of finding a word along a straight line of the board.
+
+Example:
+    A match is described by where it starts, the direction it goes in and its
+    length, and only gives the position of each character when asked::
+
+        match = Match((0, 1), (1, 1), 3)
+        list(match)  # [(0, 1), (1, 2), (2, 3)]
+"""
+import collections.abc
+
+
+class Match(collections.abc.Sequence):
+    """The :class:`Match` class describes where a word was found, without
+    storing the position of each of its characters.
+
+    A match is a read-only sequence of the (y, x) positions of the characters
+    of the word, computed when they are accessed, so it can be used wherever a
+    :obj:`list` of positions was used before, and it compares equal to the
+    :obj:`list` of the same positions.
+
+    Args:
+        start (tuple): The (y, x) position of the first character.
+        direction (tuple): The (y, x) step from one character to the next.
+        length (int): The number of characters.
+        size (tuple): The (height, width) of the board if the match wraps
+            around its edges, or ``None``.
+
+    Attributes:
+        start (tuple): The (y, x) position of the first character.
+        direction (tuple): The (y, x) step from one character to the next.
+        length (int): The number of characters.
+        size (tuple): The (height, width) of the board the positions wrap
+            around, or ``None``.
+    """
+
+    __slots__ = ('start', 'direction', 'length', 'size')
+
+    def __init__(self, start, direction, length, size=None):
+        self.start = start
+        self.direction = direction
+        self.length = length
+        self.size = size
+
+    def position(self, offset):
+        """Gives the position of the character at ``offset``.
+
+        Args:
+            offset (int): The index of the character, from zero.
+
+        Returns:
+            tuple: The (y, x) position of the character.
+        """
+        # pylint: disable=invalid-name
+        y = self.start[0] + self.direction[0] * offset
+        x = self.start[1] + self.direction[1] * offset
+        if self.size is not None:
+            return y % self.size[0], x % self.size[1]
+        return y, x
+        # pylint: enable=invalid-name
+
+    @property
+    def end(self):
+        """tuple: The (y, x) position of the last character."""
+        return self.position(self.length - 1)
+
+    def as_dict(self):
+        """Gives the match as a :obj:`dict`, suitable for logging or JSON.
+
+        Returns:
+            A :obj:`dict` with the ``start``, ``direction`` and ``length`` keys,
+            where positions are lists of the form [y, x].
+        """
+        return {
+            'start': list(self.start),
+            'direction': list(self.direction),
+            'length': self.length
+        }
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.position(offset)
+                    for offset in range(self.length)[index]]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('match index out of range.')
+        return self.position(index)
+
+    def __iter__(self):
+        for offset in range(self.length):
+            yield self.position(offset)
+
+    def __eq__(self, other):
+        if isinstance(other, Match):
+            return (self.start, self.direction, self.length,
+                    self.size) == (other.start, other.direction, other.length,
+                                   other.size)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.start, self.direction, self.length, self.size))
+
+    def __repr__(self):
+        return 'Match(start=%s, direction=%s, length=%s)' % (
+            self.start, self.direction, self.length)
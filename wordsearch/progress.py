@@ -0,0 +1,162 @@
+"""The :mod:`progress` module contains the :class:`Progress` class, which
+reports how far a long search has got, and the reporters used by the
+``--progress`` and ``--metrics`` options of the command line.
+
+Example:
+    A progress callback is passed to :meth:`wordsearch.solver.Puzzle.find_all`
+    and is called with a :obj:`dict` of metrics at most every
+    :attr:`INTERVAL` seconds, and once more when the search is done::
+
+        puzzle.find_all(words, on_progress=lambda metrics: print(metrics))
+
+Attributes:
+    INTERVAL (float): The least number of seconds between two reports.
+"""
+import json
+import time
+
+INTERVAL = 0.5
+
+
+class Progress:
+    """The :class:`Progress` class counts the words and cells searched so far
+    and passes the resulting metrics to a callback, no more often than every
+    ``interval`` seconds.
+
+    Searches report the cells they scan one row at a time, and words as each
+    chunk of words is done. Within a chunk, the words done are estimated from
+    the share of the board already scanned. Reporting only reads the clock
+    once per row, so it adds no measurable overhead to the search itself.
+
+    Args:
+        callback (callable): Called with the metrics (see :meth:`as_dict`).
+        total (int): The number of words to search, or ``None`` if unknown.
+        interval (float): The least number of seconds between two reports.
+
+    Attributes:
+        words (int): The number of words in the chunks done.
+        cells (int): The number of cells scanned, over all chunks.
+    """
+
+    def __init__(self, callback, total=None, interval=INTERVAL):
+        self.callback = callback
+        self.total = total
+        self.interval = interval
+        self.words = 0
+        self.cells = 0
+        self.chunk_words = 0
+        self.chunk_cells = 0
+        self.chunk_scanned = 0
+        self.started = time.monotonic()
+        self.reported = self.started
+
+    def start_chunk(self, words, cells):
+        """Starts searching a chunk of ``words`` words over ``cells`` cells."""
+        self.chunk_words = words
+        self.chunk_cells = cells
+        self.chunk_scanned = 0
+
+    def scanned(self, cells):
+        """Records that ``cells`` more cells have been scanned, and reports if
+        the last report is older than the interval."""
+        self.cells += cells
+        self.chunk_scanned += cells
+        now = time.monotonic()
+        if now - self.reported >= self.interval:
+            self.report(now)
+
+    def finish_chunk(self):
+        """Records that every word of the current chunk has been searched."""
+        self.words += self.chunk_words
+        self.start_chunk(0, 0)
+
+    def finish(self):
+        """Reports the final metrics, whatever the time of the last report."""
+        self.report(time.monotonic())
+
+    def report(self, now):
+        """Passes the metrics at time ``now`` to the callback."""
+        self.reported = now
+        self.callback(self.as_dict(now))
+
+    def as_dict(self, now=None):
+        """Gives the current metrics as a :obj:`dict`, suitable for JSON.
+
+        Args:
+            now (float): The :func:`time.monotonic` time to report at, or
+                ``None`` for the current time.
+
+        Returns:
+            A :obj:`dict` with the ``words`` and ``cells`` done, the ``total``
+            number of words (or ``None``), the ``elapsed`` seconds, the
+            ``words_per_second`` and ``cells_per_second``, and the ``eta`` in
+            seconds (or ``None`` if it is unknown).
+        """
+        now = time.monotonic() if now is None else now
+        elapsed = now - self.started
+        words = self.words
+        if self.chunk_cells:
+            words += self.chunk_words * self.chunk_scanned // self.chunk_cells
+        words_per_second = words / elapsed if elapsed > 0 else 0.0
+        cells_per_second = self.cells / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total is not None and words_per_second > 0:
+            eta = round(max(self.total - words, 0) / words_per_second, 3)
+        return {
+            'words': words,
+            'total': self.total,
+            'cells': self.cells,
+            'elapsed': round(elapsed, 3),
+            'words_per_second': round(words_per_second, 1),
+            'cells_per_second': round(cells_per_second, 1),
+            'eta': eta
+        }
+
+
+def progress_bar(stream, width=30):
+    """Creates a callback drawing a progress bar on a terminal ``stream``.
+
+    The bar is redrawn in place on a single line. When the total number of
+    words is unknown, only the counts and rates are shown.
+
+    Args:
+        stream (:obj:`file object`): The text stream to draw on.
+        width (int): The number of characters in the bar.
+
+    Returns:
+        A callable taking the metrics of :meth:`Progress.as_dict`.
+    """
+
+    def draw(metrics):
+        line = '%s words, %.0f words/s, %.0f cells/s' % (
+            metrics['words'], metrics['words_per_second'],
+            metrics['cells_per_second'])
+        if metrics['total']:
+            done = min(metrics['words'] / metrics['total'], 1.0)
+            filled = int(done * width)
+            line = '[%s%s] %3d%% %s' % ('#' * filled, '.' * (width - filled),
+                                        done * 100, line)
+        if metrics['eta'] is not None:
+            line += ', ETA %ss' % int(metrics['eta'])
+        stream.write('\r' + line)
+        stream.flush()
+
+    return draw
+
+
+def metrics_writer(stream):
+    """Creates a callback writing each report to ``stream`` as a line of
+    JSON, for other programs to follow.
+
+    Args:
+        stream (:obj:`file object`): The text stream to write to.
+
+    Returns:
+        A callable taking the metrics of :meth:`Progress.as_dict`.
+    """
+
+    def write(metrics):
+        stream.write(json.dumps(metrics) + '\n')
+        stream.flush()
+
+    return write
@@ -1,6 +1,7 @@
 """The :mod:`solver` module contains a set of constants and the :class:`Puzzle`
 class that provide a means of easily working with a word search grid represented
-as a nested :obj:`list` of characters.
+as a nested :obj:`list` of characters, along with its immutable, thread-safe
+counterpart, :class:`FrozenPuzzle`.
 
 Attributes:
     RIGHT (tuple): A pair of indices (y, x) that represent the minimum number of
@@ -31,10 +32,34 @@ Attributes:
         containing :attr:`RIGHT`, :attr:`LEFT`, :attr:`UP`, :attr:`DOWN`,
         :attr:`UP_RIGHT`, :attr:`DOWN_RIGHT`, :attr:`UP_LEFT`, and
         :attr:`UP_RIGHT`.
+    FORWARD_DIRECTIONS (:obj:`list` of `tuple`): The directions in which
+        words are read forwards: :attr:`RIGHT`, :attr:`DOWN`,
+        :attr:`DOWN_RIGHT` and :attr:`UP_RIGHT`.
+    KNIGHT_MOVES (:obj:`list` of `tuple`): The eight moves of a chess knight,
+        for puzzles whose words are spelled out by knight jumps.
     MIN_WORD_SIZE (int): The minimum word size for a given :class:`Puzzle`.
         This also determines the minimum height and width of a :class:`Puzzle`,
         which are equal.
+    CHUNK_SIZE (int): The number of words searched at a time by default when
+        words are streamed (see :meth:`Puzzle.iter_find`).
+    COMPILED (bool): Whether the search kernels of :mod:`wordsearch._kernels`
+        were loaded from a compiled extension rather than from their Python
+        source.
 """
+import collections.abc
+import hashlib
+import itertools
+import json
+import math
+import threading
+import types
+
+from wordsearch import _kernels
+from wordsearch.limits import UNLIMITED, Limits
+from wordsearch.match import Match
+from wordsearch.progress import Progress
+from wordsearch.symmetry import SYMMETRIES, canonical_form
+
 
 RIGHT = (0, 1)
 LEFT = (0, -1)
@@ -45,7 +70,12 @@ DOWN_RIGHT = (1, 1)
 UP_LEFT = (-1, -1)
 DOWN_LEFT = (1, -1)
 DIRECTIONS = [RIGHT, LEFT, UP, DOWN, UP_RIGHT, DOWN_RIGHT, UP_LEFT, DOWN_LEFT]
+FORWARD_DIRECTIONS = [RIGHT, DOWN, DOWN_RIGHT, UP_RIGHT]
+KNIGHT_MOVES = [(-2, 1), (-1, 2), (1, 2), (2, 1), (2, -1), (1, -2), (-1, -2),
+                (-2, -1)]
 MIN_WORD_SIZE = 2
+CHUNK_SIZE = 65536
+COMPILED = not _kernels.__file__.endswith('.py')
 
 
 class Puzzle:
@@ -55,19 +85,41 @@ class Puzzle:
     Args:
         board (:obj:`list` of :obj:`list` of :obj:`str`): A two-dimensional list
             of single characters that represent the word search puzzle board.
+        limits (:obj:`wordsearch.limits.Limits`): The resource limits enforced
+            on the board and on every search. No limits are enforced if omitted.
+        directions (:obj:`list` of :obj:`tuple`): The (y, x) steps that words
+            may be spelled along, in the order they are searched. Any step is
+            allowed, e.g. :attr:`FORWARD_DIRECTIONS` or :attr:`KNIGHT_MOVES`.
+            Defaults to :attr:`DIRECTIONS`.
+        wrap (bool): Whether words may wrap around the edges of the board, as
+            if it were a torus. Defaults to ``False``.
 
     Raises:
         ValueError: If the specified ``board`` argument is empty or ``None``,
             or if the board is not square in shape (i.e., if the width and
-            height are different).
+            height are different), or if ``directions`` is empty, repeats a
+            step or contains the step (0, 0).
         TypeError: If the board is not of type :obj:`list`.
+        LimitExceeded: If the board is larger than ``limits.max_size``.
     """
 
-    def __init__(self, board):
+    def __init__(self, board, limits=None, directions=None, wrap=False):
         if board in [None, [], [[]]]:
             raise ValueError('board is empty.')
         if not isinstance(board, list):
             raise TypeError('board is not of type list.')
+        self.limits = limits if limits is not None else Limits()
+        self.limits.check('max_size', len(board))
+        directions = DIRECTIONS if directions is None else directions
+        directions = [(int(y), int(x)) for y, x in directions]
+        if not directions:
+            raise ValueError('directions is empty.')
+        if len(set(directions)) != len(directions):
+            raise ValueError('directions contains duplicates.')
+        if (0, 0) in directions:
+            raise ValueError('directions contains the step (0, 0).')
+        self.directions = directions
+        self.wrap = wrap
         for row in board:
             if len(row) != len(board):
                 raise ValueError('board is not square.')
@@ -127,11 +179,12 @@ class Puzzle:
 
     def get_valid_moves(self, position, distance=1):
         """Gives a list of valid moves from a given ``position`` that are
-        ``distance`` spaces away in each direction in :attr:`DIRECTIONS`.
+        ``distance`` spaces away in each of the puzzle's ``directions``.
 
         A move is considerd valid if, starting from the origin ``position``,
         and moving in a direction ``distance`` number of spaces, the resulting
-        position is still within the bounds of the board.
+        position is still within the bounds of the board. On a board that
+        wraps, every move is valid and lands on the wrapped position.
 
         Args:
             position (tuple): A tuple containing a reference point (y, x).
@@ -152,26 +205,50 @@ class Puzzle:
         if not self.position_is_valid(position):
             raise IndexError('starting position out of bounds.')
         moves = []
-        for direction in DIRECTIONS:
+        for direction in self.directions:
             # pylint: disable=invalid-name
             # This allows usage of y and x as variable names.
             y, x = position
             direction_y, direction_x = direction
             y += direction_y * distance
             x += direction_x * distance
+            if self.wrap:
+                y %= self.height
+                x %= self.width
             if self.position_is_valid((y, x)):
                 moves.append((y, x))
             # pylint: enable=invalid-name
         return moves
 
     def get_direction(self, origin, target):
-        """Determines the relative direction from ``origin`` to ``target``.
+        """Determines the direction to move in from ``origin`` to reach
+        ``target``.
+
+        The direction is the step of the puzzle's ``directions`` that reaches
+        ``target`` in the fewest moves, wrapping around the edges of the board
+        if it wraps. Of the steps needing as few moves, the first one in
+        ``directions`` is given.
+
+        Args:
+            origin (tuple): A :obj:`tuple` containing a reference point (y, x).
+            target (tuple): A :obj:`tuple` containing a point relative to
+                ``origin``.
+
+        Returns:
+            tuple: A (y, x) step from the puzzle's ``directions`` representing
+            the direction one would have to move from the ``origin`` to arrive
+            at the ``target``, or (0, 0) if ``target`` is ``origin``.
 
-        The core idea of this method can be visualized as so.
+        Raises:
+            IndexError: If ``origin`` or ``target`` is out of bounds.
+            ValueError: If no number of moves along any of the directions leads
+                from ``origin`` to ``target``.
+        """
+        return self._get_line(origin, target)[0]
 
-        The ``origin`` point acts as an anchor, and if one draws a line from
-        the ``origin`` to ``target``, the direction of the resulting vector
-        gives the relative direction from ``origin`` to ``target``.
+    def _get_line(self, origin, target):
+        """Finds the direction to move in from ``origin`` to reach ``target``,
+        as :meth:`get_direction` does, and the number of moves it takes.
 
         Args:
             origin (tuple): A :obj:`tuple` containing a reference point (y, x).
@@ -179,20 +256,46 @@ class Puzzle:
                 ``origin``.
 
         Returns:
-            tuple: A :obj:`tuple` from the list of :attr:`DIRECTIONS`
-            representing the direction one would have to move from the
-            ``origin`` to arrive at the ``target``.
+            tuple: A :obj:`tuple` of the (y, x) step and the number of moves,
+            which is zero if ``target`` is ``origin``.
 
         Raises:
-            IndexError: if ``origin`` is out of bounds.
+            IndexError: See :meth:`get_direction`.
+            ValueError: See :meth:`get_direction`.
         """
         if not self.position_is_valid(origin):
             raise IndexError('origin is out of bounds.')
-        origin_y, origin_x = origin
-        target_y, target_x = target
-        direction_y = min(1, max(-1, target_y - origin_y))
-        direction_x = min(1, max(-1, target_x - origin_x))
-        return direction_y, direction_x
+        if not self.position_is_valid(target):
+            raise IndexError('target is out of bounds.')
+        origin = tuple(origin)
+        target = tuple(target)
+        if origin == target:
+            return (0, 0), 0
+        best = None
+        for direction in self.directions:
+            # pylint: disable=invalid-name
+            y, x = origin
+            moves = 0
+            while best is None or moves < best[1]:
+                y += direction[0]
+                x += direction[1]
+                moves += 1
+                if self.wrap:
+                    y %= self.height
+                    x %= self.width
+                elif not self.position_is_valid((y, x)):
+                    break
+                if (y, x) == target:
+                    best = direction, moves
+                    break
+                # A wrapped line ends where it started.
+                if (y, x) == origin:
+                    break
+            # pylint: enable=invalid-name
+        if best is None:
+            raise ValueError('target cannot be reached from origin along any '
+                             'direction.')
+        return best
 
     def get_characters(self, position, target):
         """Retrieves the characters from the board that fall between the indices
@@ -201,7 +304,9 @@ class Puzzle:
         This method gives both the list of characters and the list of positions
         of each of those characters. The ``position`` and ``target`` are
         specified as tuples giving the (y, x) coordinates for a selection of
-        characters.
+        characters, which are read moving along the direction given by
+        :meth:`get_direction`, wrapping around the edges of a board that
+        wraps.
 
         Note:
             The results include ``position`` and ``target``. That is to say, the
@@ -217,29 +322,208 @@ class Puzzle:
 
         Raises:
             IndexError: If either ``position`` or ``target`` fall out of the
-            bounds of the board.
+                bounds of the board.
+            ValueError: If ``target`` cannot be reached from ``position`` (see
+                :meth:`get_direction`).
         """
         if not self.position_is_valid(position):
             raise IndexError('starting position out of bounds.')
         if not self.position_is_valid(target):
             raise IndexError('target position out of bounds.')
+        direction, moves = self._get_line(position, target)
         characters = []
         positions = []
-        direction = self.get_direction(position, target)
         # pylint: disable=invalid-name
-        while position != target:
-            y, x = position
-            characters.append(self.board[y][x])
-            positions.append(position)
-            y += direction[0]
-            x += direction[1]
-            position = y, x
         y, x = position
-        characters.append(self.board[y][x])
+        for _ in range(moves + 1):
+            characters.append(self.board[y][x])
+            positions.append((y, x))
+            y = (y + direction[0]) % self.height
+            x = (x + direction[1]) % self.width
         # pylint: enable=invalid-name
-        positions.append(position)
         return characters, positions
 
+    def cells(self):
+        """Flattens the board into a single row-major :obj:`list` of cells.
+
+        This is the representation expected by the search kernels in
+        :mod:`wordsearch._kernels`.
+
+        Returns:
+            :obj:`list` of :obj:`str`: Every cell of the board, row by row.
+        """
+        return [cell for row in self.board for cell in row]
+
+    def codes(self):
+        """Flattens the board into the code point of each cell, which is how
+        the search kernels that walk a trie expect it.
+
+        Returns:
+            :obj:`list` of int: The code point of every cell, row by row, or -1
+            for cells that are not a single character.
+        """
+        return [ord(cell) if len(cell) == 1 else -1 for cell in self.cells()]
+
+    def starting_cells(self, character):
+        """Gives the cells a search for a word starting with ``character``
+        has to visit.
+
+        The board may change between two searches, so every cell is visited
+        and the kernel skips the ones holding another character. See
+        :meth:`FrozenPuzzle.starting_cells` for the indexed version.
+
+        Args:
+            character (str): The first character of the word.
+
+        Returns:
+            The ascending flat indices of the cells to start from.
+        """
+        # pylint: disable=unused-argument
+        return range(self.height * self.width)
+
+    def neighbor_table(self):
+        """Gives the cells adjacent to each cell, following the puzzle's
+        direction model.
+
+        The neighbors of a cell are the moves given by :meth:`get_valid_moves`
+        at a distance of one, as flat indices and without repeats.
+
+        Returns:
+            :obj:`list` of :obj:`tuple` of int: The flat indices of the
+            neighbors of each cell, indexed by the flat index of the cell.
+        """
+        table = []
+        for position in self.all_positions():
+            neighbors = []
+            for row, column in self.get_valid_moves(position):
+                neighbor = row * self.width + column
+                if neighbor not in neighbors and neighbor != len(table):
+                    neighbors.append(neighbor)
+            table.append(tuple(neighbors))
+        return table
+
+    def symmetries(self):
+        """Gives the symmetries of the square that map the puzzle's direction
+        model onto itself, so that a search finds the same words on the
+        transformed board.
+
+        Returns:
+            :obj:`list` of :obj:`wordsearch.symmetry.Symmetry`: All eight
+            symmetries for :attr:`DIRECTIONS` or :attr:`KNIGHT_MOVES`, only the
+            identity for :attr:`FORWARD_DIRECTIONS`.
+        """
+        return [
+            symmetry for symmetry in SYMMETRIES
+            if symmetry.preserves(self.directions)
+        ]
+
+    def canonical(self):
+        """Gives the fingerprint of the puzzle along with the symmetry that
+        transforms its board into the canonical board the fingerprint is
+        computed from.
+
+        Returns:
+            tuple: A :obj:`tuple` of the fingerprint (see :meth:`fingerprint`)
+            and the :obj:`wordsearch.symmetry.Symmetry`.
+        """
+        key, symmetry = canonical_form(self.board, self.symmetries())
+        model = json.dumps([sorted(self.directions), self.wrap])
+        digest = hashlib.sha256((model + '\n' + key).encode('UTF-8'))
+        return digest.hexdigest(), symmetry
+
+    def fingerprint(self):
+        """Computes a hash of the puzzle that is the same for every rotation
+        and mirror image of the board, as long as it preserves the direction
+        model (see :meth:`symmetries`). Puzzles with the same fingerprint find
+        the same words, at transformed positions.
+
+        Returns:
+            str: The SHA-256 hash of the canonical board and the direction
+            model, in hexadecimal.
+        """
+        return self.canonical()[0]
+
+    def freeze(self):
+        """Gives an immutable copy of this puzzle that may be shared between
+        threads.
+
+        Returns:
+            A :class:`FrozenPuzzle` with the same board and limits.
+        """
+        return FrozenPuzzle(self.board, self.limits, self.directions,
+                            self.wrap)
+
+    def get_match(self, code, length):
+        """Turns a match code produced by the search kernels into a
+        :obj:`wordsearch.match.Match`.
+
+        Args:
+            code (int): A match code of the form ``start * len(directions) +
+                move`` as returned by :func:`wordsearch._kernels.scan`.
+            length (int): The number of characters in the match.
+
+        Returns:
+            A :obj:`wordsearch.match.Match`.
+        """
+        start, move = divmod(code, len(self.directions))
+        return Match(divmod(start, self.width), tuple(self.directions[move]),
+                     length, (self.height, self.width) if self.wrap else None)
+
+    def get_positions(self, code, length):
+        """Expands a match code produced by the search kernels into the
+        positions of each character of the match.
+
+        Args:
+            code (int): See :meth:`get_match`.
+            length (int): The number of characters in the match.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: The (y, x) position of each character.
+        """
+        return list(self.get_match(code, length))
+
+    def scan(self, word, limit=0, budget=None, starts=None):
+        """Collects the match codes of ``word`` using the search kernel.
+
+        Without a ``budget`` every starting cell is handed to the kernel at
+        once. Otherwise the starting cells are handed over one board width at
+        a time, so that the step limit and the timeout are checked regularly.
+
+        Args:
+            word (str): The word to search for.
+            limit (int): The maximum number of matches, or zero for all of them.
+            budget (:obj:`wordsearch.limits.Budget`): The budget to charge the
+                search to, or ``None``.
+            starts (:obj:`list` of int): The flat indices of the cells to start
+                from, in ascending order. Every cell is tried if omitted.
+
+        Returns:
+            :obj:`list` of int: The codes of the matches, in search order.
+
+        Raises:
+            LimitExceeded: If the search exceeds the budget.
+        """
+        cells = self.cells()
+        if starts is None:
+            starts = self.starting_cells(word[0])
+        if budget is None:
+            codes, _ = _kernels.scan(cells, self.height, self.width, word,
+                                     self.directions, self.wrap, starts, limit,
+                                     UNLIMITED)
+            return codes
+        codes = []
+        for first in range(0, len(starts), self.width):
+            found, steps = _kernels.scan(cells, self.height, self.width, word,
+                                         self.directions, self.wrap,
+                                         starts[first:first + self.width],
+                                         limit - len(codes) if limit else 0,
+                                         budget.remaining)
+            budget.spend(steps)
+            codes.extend(found)
+            if limit and len(codes) >= limit:
+                break
+        return codes
+
     def find(self, word):
         """Searchs for a ``word`` in the puzzle and gives the positions of the
         characters of that word.
@@ -255,7 +539,34 @@ class Puzzle:
         Raises:
             ValueError: If ``word`` is ``None`` or is too long or too short.
             TypeError: If ``word`` is not a :obj:`str`.
+            LimitExceeded: If the search exceeds the step limit or timeout.
         """
+        match = self.find_match(word)
+        if match is None:
+            return []
+        return list(match)
+
+    def find_match(self, word):
+        """Searches for a ``word`` in the puzzle, like :meth:`find`, but gives
+        a compact :obj:`wordsearch.match.Match` instead of a list of positions.
+
+        Args:
+            word (str): The word to search in the puzzle.
+
+        Returns:
+            A :obj:`wordsearch.match.Match`, or ``None`` if the word is not
+            found.
+
+        Raises:
+            ValueError: See :meth:`find`.
+            TypeError: See :meth:`find`.
+            LimitExceeded: See :meth:`find`.
+        """
+        self._validate(word)
+        return self._find(word, self.limits.budget())
+
+    def _validate(self, word):
+        """Raises the errors documented in :meth:`find` for an invalid word."""
         if word is None:
             raise ValueError('the specified word is None.')
         if len(word) > self.width:
@@ -265,38 +576,464 @@ class Puzzle:
             raise ValueError('the specified word (%s) is too short.' % word)
         if not isinstance(word, str):
             raise TypeError('the specified word is not of type str.')
-        for position in self.all_positions():
-            for target in self.get_valid_moves(position,
-                                               distance=len(word) - 1):
-                characters, positions = self.get_characters(position, target)
-                if characters == list(word):
-                    return positions
-        return []
-
-    def find_all(self, words):
+
+    def _find(self, word, budget):
+        """Implements :meth:`find_match`, charging the search to ``budget``."""
+        codes = self.scan(word, limit=1, budget=budget)
+        if not codes:
+            return None
+        return self.get_match(codes[0], len(word))
+
+    def find_all(self,
+                 words,
+                 on_invalid=None,
+                 chunk_size=CHUNK_SIZE,
+                 on_progress=None):
         """Searches for each word in the given list of words and gives the
         accumulated results.
 
+        The words are taken ``chunk_size`` at a time and each chunk is turned
+        into a :obj:`wordsearch.wordlist.WordList`, so each distinct word is
+        searched once and words sharing a prefix share the work of matching
+        it, in a single pass over the board (see :meth:`find_words`). Words
+        that :meth:`find` would reject are skipped rather than aborting the
+        search, and are passed to ``on_invalid``.
+
         Args:
-            words (:obj:`list` of :obj:`str`): A list of words to find in the
-                puzzle.
+            words: A :obj:`list`, or any other iterable, of the words to find
+                in the puzzle, or a :obj:`wordsearch.wordlist.WordList`.
+            on_invalid (callable): Called with each invalid word and the reason
+                it is invalid. Invalid words are skipped silently if omitted.
+            chunk_size (int): The number of words searched at a time.
+            on_progress (callable): Called with the metrics of a
+                :obj:`wordsearch.progress.Progress` every so often during the
+                search, and once at the end. No progress is reported if
+                omitted.
 
         Returns:
-            A :obj:`dict` containing the results of searching for each word in
-            the specified list of words.
+            A :obj:`dict` mapping each word found, in the order of the list, to
+            its :obj:`wordsearch.match.Match`, which compares equal to the list
+            of positions :meth:`find` would give.
 
         Raises:
-            ValueError: If ``words`` is ``None``.
-            TypeError: If ``words`` is not a :obj:`list`.
+            ValueError: If ``words`` is ``None``, or if ``chunk_size`` is not
+                positive.
+            TypeError: If ``words`` is a :obj:`str` or is not iterable.
+            LimitExceeded: If there are more words than ``limits.max_words``, or
+                if the search exceeds the step limit or timeout.
         """
+        if self._check_words(words, chunk_size):
+            codes = self.codes()
+            return self._search_word_list(
+                words, lambda word_list, budget, progress: self._find_words(
+                    word_list, codes, budget, progress), on_progress)
+        return dict(self.iter_find(words, on_invalid, chunk_size, on_progress))
+
+    def iter_find(self,
+                  words,
+                  on_invalid=None,
+                  chunk_size=CHUNK_SIZE,
+                  on_progress=None):
+        """Searches for the words of an iterable one chunk at a time, giving
+        each word as soon as the chunk holding it has been searched.
+
+        Only one chunk of words is held in memory at a time, along with the
+        board and the words found so far, so ``words`` may be a generator
+        reading a dictionary far larger than memory (see
+        :func:`wordsearch.wordlist.read_words`). A word is given once, even if
+        it occurs again in a later chunk. The whole search shares one budget.
+
+        Args:
+            words: An iterable of the words to find in the puzzle.
+            on_invalid (callable): See :meth:`find_all`.
+            chunk_size (int): The number of words searched at a time.
+            on_progress (callable): See :meth:`find_all`. The total number of
+                words is only known if ``words`` has a length.
+
+        Returns:
+            An iterator of (word, :obj:`wordsearch.match.Match`) pairs, in the
+            order in which the words first occur.
+
+        Raises:
+            ValueError: See :meth:`find_all`.
+            TypeError: See :meth:`find_all`.
+            LimitExceeded: See :meth:`find_all`. Raised while iterating, once
+                too many words have been read or the budget is spent.
+        """
+        self._check_words(words, chunk_size)
+        codes = self.codes()
+
+        def search(word_list, budget, progress):
+            return self._find_words(word_list, codes, budget, progress)
+
+        return self._stream(words, self.width, on_invalid, chunk_size, search,
+                            self._progress(words, on_progress))
+
+    def _check_words(self, words, chunk_size):
+        """Raises the errors documented in :meth:`find_all` for ``words``,
+        checking the number of words when it is known up front, and tells
+        whether ``words`` is a :obj:`wordsearch.wordlist.WordList`."""
+        # Imported here, since the wordlist module depends on this one.
+        from wordsearch.wordlist import WordList
         if words is None:
             raise ValueError('the specified list of words is None.')
-        if not isinstance(words, list):
-            raise TypeError('expected words to be of type list, but got (%s)' %
-                            type(words))
+        if isinstance(words, str) or not isinstance(words,
+                                                    collections.abc.Iterable):
+            raise TypeError(
+                'expected words to be an iterable of str, but got (%s)' %
+                type(words))
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be positive.')
+        if isinstance(words, collections.abc.Sized):
+            self.limits.check('max_words', len(words))
+        return isinstance(words, WordList)
+
+    def _progress(self, words, on_progress):
+        """Creates the :obj:`wordsearch.progress.Progress` of a search for
+        ``words``, or gives ``None`` if ``on_progress`` is ``None``."""
+        if on_progress is None:
+            return None
+        total = len(words) if isinstance(words, collections.abc.Sized) else None
+        return Progress(on_progress, total)
+
+    def _search_word_list(self, word_list, search, on_progress):
+        """Calls ``search`` with a whole ``word_list``, the budget and the
+        progress of a single search."""
+        progress = self._progress(word_list, on_progress)
+        if progress is not None:
+            progress.start_chunk(len(word_list), self.height * self.width)
+        results = search(word_list, self.limits.budget(), progress)
+        if progress is not None:
+            progress.finish_chunk()
+            progress.finish()
+        return results
+
+    def _stream(self, words, max_length, on_invalid, chunk_size, search,
+                progress):
+        """Implements :meth:`iter_find` and :meth:`iter_find_paths`, calling
+        ``search`` with the word list of each chunk, the shared budget and the
+        shared ``progress``."""
+        # Imported here, since the wordlist module depends on this one.
+        from wordsearch.wordlist import WordList
+        budget = self.limits.budget()
+        iterator = iter(words)
+        count = 0
+        found = set()
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                if progress is not None:
+                    progress.finish()
+                return
+            count += len(chunk)
+            self.limits.check('max_words', count)
+            word_list = WordList.from_words(chunk, max_length)
+            if on_invalid is not None:
+                for word, reason in word_list.invalid:
+                    on_invalid(word, reason)
+            if progress is not None:
+                progress.start_chunk(len(chunk), self.height * self.width)
+            results = search(word_list, budget, progress)
+            if progress is not None:
+                progress.finish_chunk()
+            for word, result in _in_order(chunk, results).items():
+                if word not in found:
+                    found.add(word)
+                    yield word, result
+
+    def find_words(self, word_list, budget=None, starts=None):
+        """Searches for every word of a :obj:`wordsearch.wordlist.WordList` in
+        a single pass over the board.
+
+        The trie of the word list is walked along every line of the board, so
+        the board is scanned once no matter how many words there are. Each
+        word gets the same match :meth:`find_match` would give it. Words that
+        do not fit on the board are simply not found.
+
+        Args:
+            word_list (:obj:`wordsearch.wordlist.WordList`): The words to find.
+            budget (:obj:`wordsearch.limits.Budget`): The budget to charge the
+                search to, or ``None``.
+            starts (:obj:`list` of int): The flat index of every cell, in the
+                order the cells are tried as starting cells. Defaults to row
+                by row order. A word gets the first match in this order.
+
+        Returns:
+            A :obj:`dict` mapping each word found, in the order of the word
+            list, to its :obj:`wordsearch.match.Match`.
+
+        Raises:
+            LimitExceeded: If the search exceeds the budget.
+        """
+        return self._find_words(word_list, self.codes(), budget, starts=starts)
+
+    def _find_words(self, word_list, codes, budget, progress=None,
+                    starts=None):
+        """Implements :meth:`find_words` on the board given as ``codes``."""
+        found = [-1] * len(word_list)
+        trie = (word_list.first_edge, word_list.edge_count, word_list.node_word,
+                word_list.edge_code, word_list.edge_target)
+        shortest = word_list.shortest()
+
+        def run(starts, remaining):
+            return _kernels.scan_trie(codes, self.height, self.width,
+                                      self.directions, self.wrap, starts,
+                                      *trie, shortest, found, remaining)
+
+        self._by_row(run, budget, progress, starts)
         results = {}
-        for word in words:
-            positions = self.find(word)
-            if positions:
-                results[word] = positions
+        for index, code in enumerate(found):
+            if code >= 0:
+                word = word_list[index]
+                results[word] = self.get_match(code, len(word))
         return results
+
+    def _by_row(self, run, budget, progress, starts=None):
+        """Calls ``run`` with the starting cells (every cell, in the order of
+        ``starts`` if given) and the steps left, for the whole board at once
+        or, when there is a budget to charge or progress to report, a row's
+        worth of cells at a time."""
+        size = self.height * self.width
+        starts = range(size) if starts is None else starts
+        if budget is None and progress is None:
+            run(starts, UNLIMITED)
+            return
+        for first in range(0, size, self.width):
+            steps = run(starts[first:first + self.width],
+                        UNLIMITED if budget is None else budget.remaining)
+            if budget is not None:
+                budget.spend(steps)
+            if progress is not None:
+                progress.scanned(self.width)
+
+    def find_paths(self,
+                   words,
+                   on_invalid=None,
+                   chunk_size=CHUNK_SIZE,
+                   on_progress=None):
+        """Searches for each word along a path of adjacent cells, as in a game
+        of Boggle, rather than along a straight line.
+
+        Two cells are adjacent if one is a valid move away from the other (see
+        :meth:`get_valid_moves`), and a path may not use the same cell twice.
+        The words of each chunk are searched at once, with a depth-first
+        search pruned by the trie of the chunk.
+
+        Args:
+            words: A :obj:`list`, or any other iterable, of the words to find
+                in the puzzle, or a :obj:`wordsearch.wordlist.WordList`.
+            on_invalid (callable): See :meth:`find_all`. Words may be as long
+                as the board has cells.
+            chunk_size (int): The number of words searched at a time.
+            on_progress (callable): See :meth:`find_all`.
+
+        Returns:
+            A :obj:`dict` mapping each word found to the positions of its
+            characters along the first path found for it.
+
+        Raises:
+            ValueError: See :meth:`find_all`.
+            TypeError: See :meth:`find_all`.
+            LimitExceeded: See :meth:`find_all`.
+        """
+        if self._check_words(words, chunk_size):
+            codes = self.codes()
+            neighbors = self.neighbor_table()
+            return self._search_word_list(
+                words, lambda word_list, budget, progress: self._find_paths(
+                    word_list, codes, neighbors, budget, progress), on_progress)
+        return dict(
+            self.iter_find_paths(words, on_invalid, chunk_size, on_progress))
+
+    def iter_find_paths(self,
+                        words,
+                        on_invalid=None,
+                        chunk_size=CHUNK_SIZE,
+                        on_progress=None):
+        """Searches for the words of an iterable along paths of adjacent cells,
+        one chunk at a time, like :meth:`iter_find`.
+
+        Args:
+            words: An iterable of the words to find in the puzzle.
+            on_invalid (callable): See :meth:`find_paths`.
+            chunk_size (int): The number of words searched at a time.
+            on_progress (callable): See :meth:`iter_find`.
+
+        Returns:
+            An iterator of (word, positions) pairs, in the order in which the
+            words first occur.
+
+        Raises:
+            ValueError: See :meth:`iter_find`.
+            TypeError: See :meth:`iter_find`.
+            LimitExceeded: See :meth:`iter_find`.
+        """
+        self._check_words(words, chunk_size)
+        codes = self.codes()
+        neighbors = self.neighbor_table()
+
+        def search(word_list, budget, progress):
+            return self._find_paths(word_list, codes, neighbors, budget,
+                                    progress)
+
+        return self._stream(words, self.height * self.width, on_invalid,
+                            chunk_size, search,
+                            self._progress(words, on_progress))
+
+    def _find_paths(self, word_list, codes, neighbors, budget, progress=None):
+        """Implements :meth:`find_paths` for a word list, on the board given as
+        ``codes`` and ``neighbors``."""
+        trie = (word_list.first_edge, word_list.edge_count, word_list.node_word,
+                word_list.edge_code, word_list.edge_target)
+        pending = word_list.word_counts()
+        paths = [[] for _ in range(len(word_list))]
+        deadline = math.inf if budget is None else budget.deadline
+
+        def run(starts, remaining):
+            return _kernels.search_paths(codes, neighbors, starts, *trie,
+                                         pending, paths, remaining, deadline)
+
+        self._by_row(run, budget, progress)
+        found = {}
+        for index, path in enumerate(paths):
+            if path:
+                found[word_list[index]] = [divmod(cell, self.width)
+                                           for cell in path]
+        return found
+
+
+class FrozenPuzzle(Puzzle):
+    """The :class:`FrozenPuzzle` class is an immutable :class:`Puzzle` that can
+    be searched from many threads at once.
+
+    The board is copied into a :obj:`tuple` of :obj:`tuple` and no attribute
+    may be assigned after construction. The indexes used to speed up searches
+    are built lazily, exactly once, under a lock, and are read-only afterwards;
+    searches never write to the puzzle, so they need no locking at all.
+
+    Args:
+        board (:obj:`list` of :obj:`list` of :obj:`str`): A two-dimensional list
+            of single characters that represent the word search puzzle board.
+        limits (:obj:`wordsearch.limits.Limits`): The resource limits enforced
+            on the board and on every search. No limits are enforced if omitted.
+        directions (:obj:`list` of :obj:`tuple`): See :class:`Puzzle`.
+        wrap (bool): See :class:`Puzzle`.
+
+    Raises:
+        ValueError: See :class:`Puzzle`.
+        TypeError: See :class:`Puzzle`.
+        LimitExceeded: See :class:`Puzzle`.
+    """
+
+    def __init__(self, board, limits=None, directions=None, wrap=False):
+        if isinstance(board, tuple):
+            board = [list(row) for row in board]
+        super().__init__(board, limits, directions, wrap)
+        # Attributes may be assigned until the puzzle is marked as frozen.
+        self.directions = tuple(self.directions)
+        self.board = tuple(tuple(row) for row in board)
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError('FrozenPuzzle is immutable.')
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError('FrozenPuzzle is immutable.')
+
+    def _cached(self, name, build):
+        """Gives the shared index called ``name``, calling ``build`` to create
+        it the first time. Concurrent first calls build it only once."""
+        value = self._cache.get(name)
+        if value is None:
+            with self._lock:
+                value = self._cache.get(name)
+                if value is None:
+                    value = build()
+                    self._cache[name] = value
+        return value
+
+    def indexes(self):
+        """Gives the search indexes, building them on first use.
+
+        The indexes are the flattened board and a read-only mapping from each
+        character to the ascending flat indices of the cells holding it.
+        Building them is guarded by a lock, so concurrent first calls build
+        them once and every caller sees the same objects.
+
+        Returns:
+            tuple: A :obj:`tuple` of the flattened board (a :obj:`tuple` of
+            :obj:`str`) and the character index (a read-only :obj:`dict`).
+        """
+        return self._cached('indexes', self._build_indexes)
+
+    def _build_indexes(self):
+        """Builds the indexes returned by :meth:`indexes`."""
+        cells = tuple(cell for row in self.board for cell in row)
+        index = {}
+        for position, cell in enumerate(cells):
+            index.setdefault(cell, []).append(position)
+        index = types.MappingProxyType(
+            {cell: tuple(starts) for cell, starts in index.items()})
+        return cells, index
+
+    def neighbor_table(self):
+        """Gives the shared table of the cells adjacent to each cell, building
+        it on first use.
+
+        Returns:
+            :obj:`tuple` of :obj:`tuple` of int: See
+            :meth:`Puzzle.neighbor_table`.
+        """
+        return self._cached('neighbors',
+                            lambda: tuple(Puzzle.neighbor_table(self)))
+
+    def cells(self):
+        """Gives the flattened board from the shared indexes.
+
+        Returns:
+            :obj:`tuple` of :obj:`str`: Every cell of the board, row by row.
+        """
+        return self.indexes()[0]
+
+    def codes(self):
+        """Gives the shared code points of the board, building them on first
+        use.
+
+        Returns:
+            :obj:`tuple` of int: See :meth:`Puzzle.codes`.
+        """
+        # The cells are read outside of the build, which runs under the lock
+        # that reading them may need.
+        cells = self.cells()
+        return self._cached(
+            'codes',
+            lambda: tuple(ord(cell) if len(cell) == 1 else -1
+                          for cell in cells))
+
+    def starting_cells(self, character):
+        """Gives the cells holding ``character``, from the shared indexes.
+
+        Args:
+            character (str): The first character of the word.
+
+        Returns:
+            :obj:`tuple` of int: The ascending flat indices of those cells.
+        """
+        return self.indexes()[1].get(character, ())
+
+    def freeze(self):
+        """Gives this puzzle, which is already immutable."""
+        return self
+
+
+def _in_order(words, results):
+    """Orders ``results`` by the first occurrence of each word in ``words``."""
+    ordered = {}
+    for word in words:
+        if isinstance(word, str) and word in results and word not in ordered:
+            ordered[word] = results[word]
+    return ordered
@@ -0,0 +1,146 @@
+"""The :mod:`symmetry` module contains the eight symmetries of a square board
+(its rotations and mirror images), used to recognize boards that are copies of
+one another.
+
+Example:
+    Two boards that are rotations of each other have the same canonical form,
+    and the symmetry returned along with it maps positions and directions from
+    each board to the canonical one::
+
+        key, symmetry = canonical_form(board)
+        symmetry.position((0, 0), len(board))
+
+Attributes:
+    SYMMETRIES (:obj:`list` of :class:`Symmetry`): The eight symmetries of the
+        square, starting with the identity.
+"""
+import itertools
+import json
+
+
+class Symmetry:
+    """The :class:`Symmetry` class is one of the eight symmetries of a square:
+    an optional flip of the rows, then an optional flip of the columns, then an
+    optional transpose.
+
+    Args:
+        transpose (bool): Whether rows and columns are swapped.
+        flip_y (bool): Whether the order of the rows is reversed.
+        flip_x (bool): Whether the order of the columns is reversed.
+    """
+
+    def __init__(self, transpose, flip_y, flip_x):
+        self.transpose = transpose
+        self.flip_y = flip_y
+        self.flip_x = flip_x
+
+    def position(self, position, size):
+        """Maps a (y, x) ``position`` of a board of ``size`` rows and columns.
+
+        Returns:
+            tuple: The (y, x) position on the transformed board.
+        """
+        # pylint: disable=invalid-name
+        y, x = position
+        if self.flip_y:
+            y = size - 1 - y
+        if self.flip_x:
+            x = size - 1 - x
+        return (x, y) if self.transpose else (y, x)
+        # pylint: enable=invalid-name
+
+    def direction(self, direction):
+        """Maps a (y, x) step, which moves the same way on the transformed
+        board as ``direction`` does on the original one.
+
+        Returns:
+            tuple: The (y, x) step on the transformed board.
+        """
+        step_y, step_x = direction
+        if self.flip_y:
+            step_y = -step_y
+        if self.flip_x:
+            step_x = -step_x
+        return (step_x, step_y) if self.transpose else (step_y, step_x)
+
+    def board(self, board):
+        """Transforms a square ``board``.
+
+        Returns:
+            :obj:`list` of :obj:`list`: A new board, where the cell at each
+            position of ``board`` is at its mapped position.
+        """
+        size = len(board)
+        result = [[None] * size for _ in range(size)]
+        for y, row in enumerate(board):  # pylint: disable=invalid-name
+            for x, cell in enumerate(row):  # pylint: disable=invalid-name
+                new_y, new_x = self.position((y, x), size)
+                result[new_y][new_x] = cell
+        return result
+
+    def inverse(self):
+        """Gives the symmetry that undoes this one.
+
+        Returns:
+            A :class:`Symmetry`.
+        """
+        if not self.transpose:
+            return self
+        # Undoing the transpose first swaps the roles of the two flips.
+        return Symmetry(True, self.flip_x, self.flip_y)
+
+    def preserves(self, directions):
+        """Tells whether this symmetry maps a set of ``directions`` onto itself,
+        which is when a search along them finds the same words on the
+        transformed board.
+
+        Args:
+            directions (:obj:`list` of :obj:`tuple`): The (y, x) steps.
+
+        Returns:
+            bool: ``True`` if the directions are preserved.
+        """
+        directions = {tuple(direction) for direction in directions}
+        return {self.direction(direction)
+                for direction in directions} == directions
+
+    def __eq__(self, other):
+        return isinstance(other, Symmetry) and (
+            self.transpose, self.flip_y, self.flip_x) == (
+                other.transpose, other.flip_y, other.flip_x)
+
+    def __hash__(self):
+        return hash((self.transpose, self.flip_y, self.flip_x))
+
+    def __repr__(self):
+        return 'Symmetry(transpose=%s, flip_y=%s, flip_x=%s)' % (
+            self.transpose, self.flip_y, self.flip_x)
+
+
+SYMMETRIES = [
+    Symmetry(transpose, flip_y, flip_x)
+    for transpose, flip_y, flip_x in itertools.product([False, True], repeat=3)
+]
+
+
+def canonical_form(board, symmetries=None):
+    """Finds the canonical form of a square ``board``: the smallest of its
+    transformed copies, serialized, over the given symmetries.
+
+    Args:
+        board (:obj:`list` of :obj:`list` of :obj:`str`): A square board.
+        symmetries (:obj:`list` of :class:`Symmetry`): The symmetries to try.
+            Defaults to :attr:`SYMMETRIES`.
+
+    Returns:
+        tuple: A :obj:`tuple` of the canonical form (a :obj:`str`) and the
+        :class:`Symmetry` that transforms ``board`` into it. Of the symmetries
+        giving the same form, the first one is returned.
+    """
+    symmetries = SYMMETRIES if symmetries is None else symmetries
+    best = None
+    for symmetry in symmetries:
+        key = json.dumps(symmetry.board(board), ensure_ascii=False)
+        if best is None or key < best[0]:
+            best = key, symmetry
+    return best
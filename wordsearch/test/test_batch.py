@@ -0,0 +1,138 @@
+import random
+import subprocess
+import unittest
+
+import pytest
+
+import wordsearch
+from wordsearch.batch import iter_solve_corpus, solve_corpus
+from wordsearch.limits import Budget, LimitExceeded, Limits
+from wordsearch.solver import (DIRECTIONS, FORWARD_DIRECTIONS, KNIGHT_MOVES,
+                               Puzzle)
+from wordsearch.symmetry import SYMMETRIES
+from wordsearch.wordlist import WordList
+
+
+# pylint: disable=invalid-name, no-self-use, attribute-defined-outside-init
+class SolveCorpusTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        with open('data/pillar-sample.puzzle') as puzzle_file:
+            self.words, self.board = wordsearch.parse_puzzle(puzzle_file)
+    # pylint: enable=unused-argument
+
+    def test_rotations_and_mirrors_are_searched_once(self):
+        corpus = [(self.words, symmetry.board(self.board))
+                  for symmetry in SYMMETRIES]
+        results, boards = solve_corpus(corpus)
+        assert boards == 1
+        for (words, board), result in zip(corpus, results):
+            assert result == Puzzle(board).find_all(words)
+
+    def test_results_match_find_all_exactly(self):
+        generator = random.Random(7)
+        for directions, wrap in [(DIRECTIONS, False), (DIRECTIONS, True),
+                                 (KNIGHT_MOVES, False),
+                                 (FORWARD_DIRECTIONS, False)]:
+            # A tiny alphabet puts most words on the board many times over.
+            base = [[generator.choice('AB') for _ in range(5)]
+                    for _ in range(5)]
+            words = [
+                ''.join(generator.choice('AB') for _ in range(length))
+                for length in [2, 2, 3, 3, 4, 5, 6]
+            ]
+            corpus = [(words, generator.choice(SYMMETRIES).board(base))
+                      for _ in range(6)]
+            results, _ = solve_corpus(corpus, directions, wrap)
+            for (_, board), result in zip(corpus, results):
+                expected = Puzzle(board, directions=directions,
+                                  wrap=wrap).find_all(words)
+                assert result == expected
+                assert list(result) == list(expected)
+
+    def test_each_puzzle_keeps_its_own_words(self):
+        mirrored = SYMMETRIES[1].board(self.board)
+        results, boards = solve_corpus([(['KIRK'], self.board),
+                                        (['KHAN', 'NOPE'], mirrored)])
+        assert boards == 1
+        assert list(results[0]) == ['KIRK']
+        assert list(results[1]) == ['KHAN']
+
+    def test_copies_are_searched_once_within_one_budget(self):
+        budget = Budget()
+        Puzzle(self.board).find_words(WordList.from_words(self.words), budget)
+        corpus = [(self.words, self.board)] * 8
+        results, _ = solve_corpus(corpus,
+                                  limits=Limits(max_steps=budget.steps))
+        assert results == [Puzzle(self.board).find_all(self.words)] * 8
+        with pytest.raises(LimitExceeded):
+            solve_corpus(corpus, limits=Limits(max_steps=budget.steps - 1))
+
+    def test_reports_progress_per_group(self):
+        reports = []
+        solve_corpus([(self.words, self.board)] * 3,
+                     on_progress=reports.append)
+        assert reports[-1]['words'] == reports[-1]['total'] == \
+            3 * len(self.words)
+
+    def test_yields_each_group_as_soon_as_it_is_searched(self):
+        mirrored = SYMMETRIES[1].board(self.board)
+        other = [list('KHAN'), list('ABCD'), list('EFGH'), list('IJKL')]
+        invalid = []
+        groups = iter_solve_corpus([(['KIRK'], self.board),
+                                    (['KHAN', 'K'], other),
+                                    (['KHAN'], mirrored)],
+                                   on_invalid=lambda word, _: invalid.append(
+                                       word))
+        indexes, found = next(groups)
+        assert indexes == [0, 2]
+        assert [list(result) for result in found] == [['KIRK'], ['KHAN']]
+        assert not invalid
+        assert list(groups) == [
+            ([1], [{'KHAN': Puzzle(other).find_all(['KHAN'])['KHAN']}])
+        ]
+        assert invalid == ['K']
+
+
+class BatchCommandTest(unittest.TestCase):
+
+    def test_batch_prints_the_results_of_each_puzzle(self):
+        path = 'data/pillar-sample.puzzle'
+        process = subprocess.run(
+            ['python', '-m', 'wordsearch', 'batch', path, path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE)
+        single = subprocess.run(['python', '-m', 'wordsearch', path],
+                                stdout=subprocess.PIPE).stdout.decode()
+        assert process.stdout.decode() == '==> %s <==\n%s\n==> %s <==\n%s' % (
+            path, single, path, single)
+        assert process.stderr.decode() == \
+            'solved 2 puzzles with 1 distinct boards\n'
+
+    def test_batch_enforces_the_resource_limits(self):
+        path = 'data/pillar-sample.puzzle'
+        for options, error in [
+            (['--max-size', '3'], 'max_size exceeded: 15 > 3'),
+            (['--max-input', '10'], 'max_input exceeded: 11 > 10'),
+            (['--max-steps', '10'], 'max_steps exceeded: 11 > 10'),
+            (['--max-words', '6'], 'max_words exceeded: 7 > 6'),
+        ]:
+            process = subprocess.run(
+                ['python', '-m', 'wordsearch', 'batch'] + options +
+                [path, path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE)
+            assert process.returncode == 2
+            assert process.stderr.decode().endswith(
+                'wordsearch batch: error: %s\n' % error)
+
+    def test_batch_limits_the_words_of_each_puzzle(self):
+        path = 'data/pillar-sample.puzzle'
+        process = subprocess.run(
+            ['python', '-m', 'wordsearch', 'batch', '--max-words', '7', path,
+             path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE)
+        assert process.returncode == 0
+# pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init
@@ -0,0 +1,448 @@
+"""Differential tests between the search engines of the solver.
+
+Every engine is run on randomly generated boards and word lists, including
+repetitive, adversarial ones, and must give exactly what a naive reference
+search gives, which defines the semantics of :meth:`Puzzle.find_all`: the
+first occurrence in the order of the starting cells and then of the
+directions, with the words in the order they first occur. The engines that
+search along paths of adjacent cells are compared with each other and with a
+brute force search. Both kinds of search are also run a row at a time, as when
+there is a budget to charge or progress to report, and with the pure Python
+kernels, which a compiled extension otherwise shadows.
+
+A failing case is shrunk, by dropping words and rows, shortening words and
+simplifying cells, to a minimal counterexample before it is reported.
+
+The number of cases can be raised with the ``WORDSEARCH_DIFFERENTIAL_CASES``
+environment variable for a longer run.
+"""
+import os
+import random
+import unittest
+
+import wordsearch.solver
+from wordsearch.batch import solve_corpus
+from wordsearch.limits import Limits
+from wordsearch.solver import (DIRECTIONS, FORWARD_DIRECTIONS, KNIGHT_MOVES,
+                               MIN_WORD_SIZE, FrozenPuzzle, Puzzle)
+from wordsearch.symmetry import SYMMETRIES
+from wordsearch.test.test_kernels import load_pure_python_kernels
+from wordsearch.test.test_solver import path_exists
+from wordsearch.wordlist import WordList
+
+CASES = int(os.environ.get('WORDSEARCH_DIFFERENTIAL_CASES', 300))
+
+# Generous enough never to be exceeded, so that the search is merely charged
+# to a budget, a row at a time.
+LIMITS = Limits(max_steps=10**9, timeout=3600)
+
+PURE_KERNELS = load_pure_python_kernels()
+
+
+def is_valid(word, size):
+    """Tells whether :meth:`Puzzle.find` accepts ``word`` on a board of
+    ``size`` columns."""
+    return isinstance(word, str) and MIN_WORD_SIZE <= len(word) <= size
+
+
+def reference_find_all(board, words, directions, wrap):
+    """The naive search defining the expected results of every engine."""
+    size = len(board)
+    results = {}
+    for word in words:
+        if not is_valid(word, size) or word in results:
+            continue
+        for start in range(size * size):
+            for step_y, step_x in directions:
+                positions = []
+                # pylint: disable=invalid-name
+                y, x = divmod(start, size)
+                for character in word:
+                    if wrap:
+                        y, x = y % size, x % size
+                    elif not (0 <= y < size and 0 <= x < size):
+                        break
+                    if board[y][x] != character:
+                        break
+                    positions.append((y, x))
+                    y, x = y + step_y, x + step_x
+                # pylint: enable=invalid-name
+                if len(positions) == len(word):
+                    results[word] = positions
+                    break
+            if word in results:
+                break
+    return results
+
+
+def in_order(words, results):
+    """Orders ``results`` by the first occurrence of each word in ``words``."""
+    return {
+        word: results[word]
+        for word in dict.fromkeys(word for word in words
+                                  if isinstance(word, str))
+        if word in results
+    }
+
+
+def find_each(board, words, directions, wrap):
+    """Searches for each word on its own, with the straight line kernel."""
+    puzzle = Puzzle(board, directions=directions, wrap=wrap)
+    results = {}
+    for word in words:
+        if is_valid(word, len(board)) and word not in results:
+            match = puzzle.find_match(word)
+            if match is not None:
+                results[word] = match
+    return results
+
+
+def find_mirrored(board, words, directions, wrap):
+    """Solves a transformed copy of the board along with the board itself,
+    so the batch mode maps the matches back through a symmetry."""
+    symmetry = random.Random(str(board)).choice(SYMMETRIES)
+    results, _ = solve_corpus([(words, symmetry.board(board)),
+                               (words, board)], directions, wrap)
+    return results[1]
+
+
+def with_pure_kernels(engine):
+    """Gives an engine that runs ``engine`` with the pure Python kernels in
+    place of the installed ones."""
+
+    def run(*case):
+        # pylint: disable=protected-access
+        installed = wordsearch.solver._kernels
+        wordsearch.solver._kernels = PURE_KERNELS
+        try:
+            return engine(*case)
+        finally:
+            wordsearch.solver._kernels = installed
+
+    return run
+
+
+def ignore_progress(metrics):  # pylint: disable=unused-argument
+    """Asks for progress reports, so that the search runs a row at a time."""
+
+
+ENGINES = {
+    'find_all':
+        lambda board, words, directions, wrap: Puzzle(
+            board, directions=directions, wrap=wrap).find_all(words),
+    'find_match':
+        find_each,
+    'word_list':
+        lambda board, words, directions, wrap: in_order(
+            words,
+            Puzzle(board, directions=directions, wrap=wrap).find_all(
+                WordList.from_words(words, len(board)))),
+    'frozen':
+        lambda board, words, directions, wrap: FrozenPuzzle(
+            board, directions=directions, wrap=wrap).find_all(words),
+    'iter_find':
+        lambda board, words, directions, wrap: dict(
+            Puzzle(board, directions=directions, wrap=wrap).iter_find(
+                iter(words), chunk_size=2)),
+    'batch':
+        find_mirrored,
+    'by_row':
+        lambda board, words, directions, wrap: Puzzle(
+            board, directions=directions, wrap=wrap).find_all(
+                words, on_progress=ignore_progress),
+    'budgeted':
+        lambda board, words, directions, wrap: Puzzle(
+            board, LIMITS, directions, wrap).find_all(words),
+    'pure_kernels':
+        with_pure_kernels(lambda board, words, directions, wrap: Puzzle(
+            board, directions=directions, wrap=wrap).find_all(words)),
+    'pure_kernels_budgeted':
+        with_pure_kernels(lambda board, words, directions, wrap: Puzzle(
+            board, LIMITS, directions, wrap).find_all(words))
+}
+
+PATH_ENGINES = {
+    'find_paths':
+        lambda board, words, directions: Puzzle(board, directions=directions
+                                               ).find_paths(words),
+    'paths_word_list':
+        lambda board, words, directions: in_order(
+            words,
+            Puzzle(board, directions=directions).find_paths(
+                WordList.from_words(words))),
+    'paths_frozen':
+        lambda board, words, directions: FrozenPuzzle(
+            board, directions=directions).find_paths(words),
+    'paths_iter_find':
+        lambda board, words, directions: dict(
+            Puzzle(board, directions=directions).iter_find_paths(
+                iter(words), chunk_size=1)),
+    'paths_by_row':
+        lambda board, words, directions: Puzzle(
+            board, directions=directions).find_paths(
+                words, on_progress=ignore_progress),
+    'paths_budgeted':
+        lambda board, words, directions: Puzzle(
+            board, LIMITS, directions).find_paths(words),
+    'paths_pure_kernels':
+        with_pure_kernels(lambda board, words, directions: Puzzle(
+            board, directions=directions).find_paths(words)),
+    'paths_pure_kernels_budgeted':
+        with_pure_kernels(lambda board, words, directions: Puzzle(
+            board, LIMITS, directions).find_paths(words))
+}
+
+
+def generate_case(generator, max_size=7, max_length=None):
+    """Generates a random board and word list.
+
+    Boards use small alphabets, so words occur many times, and one board in
+    four is all the same letter but one. Words are read off the board along
+    random lines (so that they are found), made up, repeated, and cut to
+    prefixes of one another, and a few are too long or too short.
+    """
+    size = generator.randint(MIN_WORD_SIZE, max_size)
+    if generator.random() < 0.25:
+        board = [['A'] * size for _ in range(size)]
+        board[generator.randrange(size)][generator.randrange(size)] = 'B'
+    else:
+        alphabet = generator.choice(['AB', 'ABC', 'ABCDEFGH'])
+        board = [[generator.choice(alphabet) for _ in range(size)]
+                 for _ in range(size)]
+    max_length = size + 1 if max_length is None else max_length
+    words = []
+    for _ in range(generator.randint(1, 12)):
+        length = generator.randint(1, max_length)
+        kind = generator.random()
+        if kind < 0.4:
+            # pylint: disable=invalid-name
+            y, x = generator.randrange(size), generator.randrange(size)
+            step_y, step_x = generator.choice(DIRECTIONS + KNIGHT_MOVES)
+            word = ''
+            for _ in range(length):
+                word += board[y % size][x % size]
+                y, x = y + step_y, x + step_x
+            # pylint: enable=invalid-name
+            words.append(word)
+        elif kind < 0.6 and words:
+            word = generator.choice(words)
+            words.append(word[:generator.randint(1, len(word))])
+        elif kind < 0.7 and words:
+            words.append(generator.choice(words))
+        else:
+            words.append(''.join(
+                generator.choice('AB') for _ in range(length)))
+    return board, words
+
+
+def generate_model(generator):
+    """Picks a random direction model and wrap flag."""
+    kind = generator.random()
+    if kind < 0.4:
+        directions = DIRECTIONS
+    elif kind < 0.55:
+        directions = FORWARD_DIRECTIONS
+    elif kind < 0.7:
+        directions = KNIGHT_MOVES
+    else:
+        directions = generator.sample(DIRECTIONS, generator.randint(1, 8))
+    return directions, generator.random() < 0.3
+
+
+def smaller_cases(board, words):
+    """Gives the candidate simplifications of a case, the largest first."""
+    for index in range(len(words)):
+        yield board, words[:index] + words[index + 1:]
+    size = len(board)
+    if size > MIN_WORD_SIZE:
+        for top in [0, 1]:
+            for left in [0, 1]:
+                yield ([row[left:left + size - 1]
+                        for row in board[top:top + size - 1]], words)
+    for index, word in enumerate(words):
+        if isinstance(word, str) and len(word) > 1:
+            for shorter in [word[:-1], word[1:]]:
+                yield board, words[:index] + [shorter] + words[index + 1:]
+    for y in range(size):  # pylint: disable=invalid-name
+        for x in range(size):  # pylint: disable=invalid-name
+            if board[y][x] != 'A':
+                simpler = [list(row) for row in board]
+                simpler[y][x] = 'A'
+                yield simpler, words
+
+
+def shrink(board, words, fails):
+    """Shrinks a failing case for as long as a simpler case still fails.
+
+    Args:
+        board: The board of the failing case.
+        words: The words of the failing case.
+        fails (callable): Tells whether a (board, words) case fails.
+
+    Returns:
+        tuple: The smallest failing (board, words) case found.
+    """
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for candidate in smaller_cases(board, words):
+            if fails(*candidate):
+                board, words = candidate
+                shrunk = True
+                break
+    return board, words
+
+
+def difference(engine, expected, board, words, *model):
+    """Runs ``engine`` on a case and describes how its results differ from
+    ``expected``, or gives ``None`` if they are the same."""
+    try:
+        actual = engine(board, words, *model)
+    except Exception as error:  # pylint: disable=broad-except
+        return 'raised %r' % error
+    actual = {word: list(positions) for word, positions in actual.items()}
+    if actual != expected or list(actual) != list(expected):
+        return 'gave %s instead of %s' % (actual, expected)
+    return None
+
+
+def counterexample(name, engine, board, words, directions, wrap):
+    """Shrinks a case on which a straight line ``engine`` disagrees with the
+    reference, and describes the minimal counterexample."""
+
+    def fails(board, words):
+        expected = reference_find_all(board, words, directions, wrap)
+        return difference(engine, expected, board, words, directions,
+                          wrap) is not None
+
+    board, words = shrink(board, words, fails)
+    expected = reference_find_all(board, words, directions, wrap)
+    return '%s, with directions=%s and wrap=%s, on board %s and words %s %s' % (
+        name, directions, wrap, board, words,
+        difference(engine, expected, board, words, directions, wrap))
+
+
+def path_difference(engine, board, words, directions, reference=None):
+    """Runs a path ``engine`` on a case and describes what is wrong with its
+    results, or gives ``None`` if nothing is.
+
+    The words found must be those a brute force search finds, in order, each
+    along a valid path and, if a ``reference`` engine is given, along the path
+    it finds.
+    """
+    try:
+        actual = engine(board, words, directions)
+    except Exception as error:  # pylint: disable=broad-except
+        return 'raised %r' % error
+    puzzle = Puzzle(board, directions=directions)
+    expected = [
+        word for word in dict.fromkeys(words)
+        if is_valid(word, len(board) * len(board)) and
+        path_exists(puzzle, word, [])
+    ]
+    if list(actual) != expected:
+        return 'found %s instead of %s' % (list(actual), expected)
+    for word, path in actual.items():
+        # pylint: disable=invalid-name
+        if (''.join(board[y][x] for y, x in path) != word or
+                len(set(path)) != len(path) or
+                any(second not in puzzle.get_valid_moves(first)
+                    for first, second in zip(path, path[1:]))):
+            return 'gave the invalid path %s for %s' % (path, word)
+        # pylint: enable=invalid-name
+    if reference is not None:
+        expected = reference(board, words, directions)
+        if actual != expected:
+            return 'gave %s instead of %s' % (actual, expected)
+    return None
+
+
+def path_counterexample(name, engine, board, words, directions,
+                        reference=None):
+    """Shrinks a case on which a path ``engine`` goes wrong (see
+    :func:`path_difference`), and describes the minimal counterexample."""
+
+    def fails(board, words):
+        return path_difference(engine, board, words, directions,
+                               reference) is not None
+
+    board, words = shrink(board, words, fails)
+    return '%s, with directions=%s, on board %s and words %s %s' % (
+        name, directions, board, words,
+        path_difference(engine, board, words, directions, reference))
+
+
+# pylint: disable=invalid-name, no-self-use
+class DifferentialTest(unittest.TestCase):
+
+    def test_every_engine_agrees_with_the_reference(self):
+        generator = random.Random(2024)
+        for _ in range(CASES):
+            board, words = generate_case(generator)
+            directions, wrap = generate_model(generator)
+            expected = reference_find_all(board, words, directions, wrap)
+            for name, engine in ENGINES.items():
+                if difference(engine, expected, board, words, directions,
+                              wrap) is not None:
+                    raise AssertionError(
+                        counterexample(name, engine, board, words, directions,
+                                       wrap))
+
+    def test_every_path_engine_finds_a_valid_path_for_the_same_words(self):
+        generator = random.Random(2025)
+        for _ in range(CASES // 3):
+            board, words = generate_case(generator, max_size=4, max_length=5)
+            directions, _ = generate_model(generator)
+            for name, engine in PATH_ENGINES.items():
+                # Every engine must find the same paths as find_paths.
+                reference = (None if name == 'find_paths' else
+                             PATH_ENGINES['find_paths'])
+                if path_difference(engine, board, words, directions,
+                                   reference) is not None:
+                    raise AssertionError(
+                        path_counterexample(name, engine, board, words,
+                                            directions, reference))
+
+    def test_shrink_reduces_a_failure_to_a_minimal_counterexample(self):
+
+        def broken(board, words, directions, wrap):
+            # Misses every word containing 'BB'.
+            found = reference_find_all(board, words, directions, wrap)
+            return {word: found[word] for word in found if 'BB' not in word}
+
+        generator = random.Random(1)
+        while True:
+            board, words = generate_case(generator)
+            expected = reference_find_all(board, words, DIRECTIONS, False)
+            if difference(broken, expected, board, words, DIRECTIONS,
+                          False) is not None:
+                break
+
+        def fails(board, words):
+            expected = reference_find_all(board, words, DIRECTIONS, False)
+            return difference(broken, expected, board, words, DIRECTIONS,
+                              False) is not None
+
+        board, words = shrink(board, words, fails)
+        assert words == ['BB']
+        assert len(board) == MIN_WORD_SIZE
+        assert sorted(cell for row in board for cell in row) == \
+            ['A', 'A', 'B', 'B']
+        assert 'broken, with directions=' in counterexample(
+            'broken', broken, board, words, DIRECTIONS, False)
+
+    def test_path_failures_are_shrunk_to_a_minimal_counterexample(self):
+
+        def broken(board, words, directions):
+            # Misses every word containing 'BB'.
+            found = Puzzle(board, directions=directions).find_paths(words)
+            return {word: found[word] for word in found if 'BB' not in word}
+
+        board = [list('ABAB'), list('BABA'), list('ABAB'), list('BABA')]
+        words = ['AB', 'ABA', 'BAB', 'ABBA', 'BABA']
+        description = path_counterexample('broken', broken, board, words,
+                                          DIRECTIONS)
+        assert description == (
+            "broken, with directions=%s, on board [['A', 'B'], ['B', 'A']] "
+            "and words ['BB'] found [] instead of ['BB']" % DIRECTIONS)
+# pylint: enable=invalid-name, no-self-use
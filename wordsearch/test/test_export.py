@@ -0,0 +1,112 @@
+import subprocess
+import unittest
+import pytest
+
+import wordsearch
+import wordsearch.export
+from wordsearch.export import (COLUMNS, ResultWriter, default_format,
+                               read_packed)
+from wordsearch.solver import Puzzle
+
+
+# pylint: disable=invalid-name, no-self-use, attribute-defined-outside-init
+class ResultWriterTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        with open('data/pillar-sample.puzzle') as puzzle_file:
+            words, board = wordsearch.parse_puzzle(puzzle_file)
+        self.results = Puzzle(board).find_all(words)
+    # pylint: enable=unused-argument
+
+    def read(self, path):
+        with open(path, 'rb') as result_file:
+            return list(read_packed(result_file))
+
+    def test_packed_rows_describe_each_match(self):
+        path = self.tmp_path / 'results.bin'
+        with ResultWriter(path, 'packed') as writer:
+            writer.write('sample', self.results)
+        batch, = self.read(path)
+        assert batch['word'] == list(self.results)
+        assert batch['puzzle'] == ['sample'] * len(self.results)
+        row = batch['word'].index('KHAN')
+        assert (batch['start_x'][row], batch['start_y'][row],
+                batch['direction_x'][row], batch['direction_y'][row],
+                batch['length'][row]) == (5, 9, 0, -1, 4)
+
+    def test_packed_rows_are_written_in_batches(self):
+        path = self.tmp_path / 'results.bin'
+        with ResultWriter(path, 'packed', batch_size=3) as writer:
+            writer.write('first', self.results)
+            writer.write('second', self.results)
+            assert writer.rows == 12
+        batches = self.read(path)
+        assert [len(batch['word']) for batch in batches] == [3, 3, 3, 3, 2]
+        assert sum((batch['puzzle'] for batch in batches), []) == \
+            ['first'] * 7 + ['second'] * 7
+
+    def test_read_packed_rejects_other_files(self):
+        path = self.tmp_path / 'results.bin'
+        path.write_bytes(b'not a result file')
+        with pytest.raises(ValueError) as e:
+            self.read(path)
+        assert str(e.value) == 'not a packed result file.'
+
+    def test_read_packed_detects_a_truncated_file(self):
+        path = self.tmp_path / 'results.bin'
+        with ResultWriter(path, 'packed') as writer:
+            writer.write('sample', self.results)
+        path.write_bytes(path.read_bytes()[:-1])
+        with pytest.raises(ValueError) as e:
+            self.read(path)
+        assert str(e.value) == 'the packed result file is truncated.'
+
+    def test_raises_value_error_for_an_unknown_format(self):
+        with pytest.raises(ValueError) as e:
+            ResultWriter(self.tmp_path / 'results.csv', 'csv')
+        assert str(e.value) == 'unknown export format (csv).'
+
+    def test_parquet_requires_pyarrow(self):
+        if wordsearch.export.pyarrow is not None:
+            pytest.skip('pyarrow is installed.')
+        assert default_format() == 'packed'
+        with pytest.raises(ValueError) as e:
+            ResultWriter(self.tmp_path / 'results.parquet', 'parquet')
+        assert str(e.value) == 'the parquet format requires pyarrow.'
+
+    def test_parquet_rows_describe_each_match(self):
+        parquet = pytest.importorskip('pyarrow.parquet')
+        path = self.tmp_path / 'results.parquet'
+        with ResultWriter(path, 'parquet', batch_size=3) as writer:
+            writer.write('sample', self.results)
+        table = parquet.read_table(path).to_pydict()
+        assert table['word'] == list(self.results)
+        assert table['start_x'][table['word'].index('KHAN')] == 5
+
+    def test_parquet_export_without_matches_is_readable(self):
+        parquet = pytest.importorskip('pyarrow.parquet')
+        path = self.tmp_path / 'results.parquet'
+        with ResultWriter(path, 'parquet') as writer:
+            writer.write('sample', {})
+        table = parquet.read_table(path)
+        assert table.num_rows == 0
+        assert table.column_names == COLUMNS
+
+    def test_batch_exports_the_results_of_each_puzzle(self):
+        path = self.tmp_path / 'results.bin'
+        puzzle = 'data/pillar-sample.puzzle'
+        process = subprocess.run([
+            'python', '-m', 'wordsearch', 'batch', '--export',
+            str(path), '--export-format', 'packed', puzzle, puzzle
+        ],
+                                 stdout=subprocess.PIPE)
+        assert process.returncode == 0
+        assert process.stdout.decode() == ''
+        batch, = self.read(path)
+        assert batch['puzzle'] == [puzzle] * 2 * len(self.results)
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.tmp_path = tmp_path
+# pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init
@@ -0,0 +1,168 @@
+import io
+import random
+import subprocess
+import unittest
+import pytest
+
+import wordsearch
+from wordsearch.generate import (Occurrences, PuzzleGenerator, find_duplicate,
+                                 plan)
+from wordsearch.solver import DIRECTIONS, FORWARD_DIRECTIONS, Puzzle
+from wordsearch.wordlist import WordList
+
+WORDS = [
+    'BONES', 'KHAN', 'KIRK', 'SCOTTY', 'SPOCK', 'SULU', 'UHURA', 'LEVEL'
+]
+
+
+# pylint: disable=invalid-name, no-self-use, attribute-defined-outside-init
+class PuzzleGeneratorTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        self.generator = PuzzleGenerator(15, seed=42)
+    # pylint: enable=unused-argument
+
+    def test_generate_returns_a_square_board_of_the_given_size(self):
+        board = self.generator.generate(WORDS)
+        assert len(board) == 15
+        assert all(len(row) == 15 for row in board)
+
+    def test_generate_places_every_word_exactly_once(self):
+        for _ in range(20):
+            puzzle = Puzzle(self.generator.generate(WORDS))
+            assert find_duplicate(puzzle, WORDS) is None
+            assert all(puzzle.find(word) for word in WORDS)
+
+    def test_generate_is_repeatable_with_the_same_seed(self):
+        first = PuzzleGenerator(15, seed=7).generate(WORDS)
+        second = PuzzleGenerator(15, seed=7).generate(WORDS)
+        assert first == second
+
+    def test_generate_fills_the_board_from_the_alphabet(self):
+        generator = PuzzleGenerator(6, seed=1, alphabet='XY')
+        board = generator.generate(['AB', 'CD'])
+        letters = {cell for row in board for cell in row}
+        assert letters <= {'A', 'B', 'C', 'D', 'X', 'Y'}
+
+    def test_generate_places_large_boards(self):
+        generator = PuzzleGenerator(100, seed=1)
+        puzzle = Puzzle(generator.generate(WORDS))
+        assert find_duplicate(puzzle, WORDS) is None
+
+    def test_generate_only_places_words_along_the_given_directions(self):
+        generator = PuzzleGenerator(15, seed=5, directions=FORWARD_DIRECTIONS)
+        for _ in range(10):
+            board = generator.generate(WORDS)
+            puzzle = Puzzle(board, directions=FORWARD_DIRECTIONS)
+            assert find_duplicate(puzzle, WORDS) is None
+
+    def test_generate_raises_if_a_word_does_not_fit(self):
+        with pytest.raises(ValueError) as e:
+            PuzzleGenerator(4, seed=1).generate(['SCOTTY'])
+        assert str(e.value) == 'the word (SCOTTY) does not fit on the board.'
+
+    def test_generate_raises_if_the_words_exceed_the_maximum_density(self):
+        generator = PuzzleGenerator(5, seed=1, max_density=0.5)
+        with pytest.raises(ValueError) as e:
+            generator.generate(['ABCDE', 'FGHIJ', 'KLMNO'])
+        assert str(e.value) == 'the words exceed the maximum density.'
+
+    def test_generate_raises_if_the_words_cannot_be_placed(self):
+        generator = PuzzleGenerator(15, seed=1, max_attempts=5)
+        generator.place = lambda words: None
+        with pytest.raises(ValueError) as e:
+            generator.generate(WORDS)
+        assert str(e.value) == 'could not generate a puzzle after 5 attempts.'
+
+    def test_raises_if_the_alphabet_is_too_small(self):
+        with pytest.raises(ValueError) as e:
+            PuzzleGenerator(5, alphabet='AAA')
+        assert str(e.value) == 'alphabet must have at least two letters.'
+
+
+class OccurrencesTest(unittest.TestCase):
+
+    def test_finds_every_occurrence_once(self):
+        # yapf: disable
+        cells = ['A', 'B', 'X',
+                 'X', 'X', 'X',
+                 'X', 'B', 'A']
+        # yapf: enable
+        occurrences = Occurrences(WordList.from_words(['AB']), 3, DIRECTIONS)
+        occurrences.load(cells)
+        assert occurrences.duplicates() == [[0, 1], [8, 7]]
+
+    def test_counts_a_palindrome_read_both_ways_once(self):
+        occurrences = Occurrences(WordList.from_words(['LEVEL']), 5,
+                                  DIRECTIONS)
+        occurrences.load(list('LEVEL') + ['X'] * 20)
+        assert occurrences.duplicates() is None
+
+    def test_update_gives_the_same_occurrences_as_a_new_search(self):
+        generator = random.Random(3)
+        word_list = WordList.from_words(['AB', 'ABA', 'BAB', 'AAB'])
+        cells = [generator.choice('ABC') for _ in range(36)]
+        occurrences = Occurrences(word_list, 6, DIRECTIONS)
+        occurrences.load(cells)
+        for _ in range(200):
+            position = generator.randrange(36)
+            cells[position] = generator.choice('ABC')
+            occurrences.update(position, cells[position])
+            expected = Occurrences(word_list, 6, DIRECTIONS)
+            expected.load(cells)
+            assert [set(found) for found in occurrences.found] == \
+                [set(found) for found in expected.found]
+
+    def test_duplicates_raises_if_a_word_is_missing(self):
+        occurrences = Occurrences(WordList.from_words(['AB']), 2, DIRECTIONS)
+        occurrences.load(['X'] * 4)
+        with pytest.raises(ValueError) as e:
+            occurrences.duplicates()
+        assert str(e.value) == 'the word (AB) is missing.'
+
+
+class PlanTest(unittest.TestCase):
+
+    def test_plan_places_the_longest_words_first(self):
+        assert plan(['DOG', 'HORSE', 'CAT']) == ['HORSE', 'DOG', 'CAT']
+
+    def test_plan_skips_words_spelled_out_by_a_longer_word(self):
+        assert plan(['BUTT', 'BUTTER', 'RET']) == ['BUTTER']
+
+    def test_plan_raises_if_a_word_is_part_of_two_longer_words(self):
+        with pytest.raises(ValueError) as e:
+            plan(['BUTT', 'BUTTER', 'BUTTOCKS'])
+        assert str(e.value) == 'the word (BUTT) is part of more than one word.'
+
+
+class GenerateCommandTest(unittest.TestCase):
+
+    def test_generate_command_writes_a_puzzle_that_can_be_solved(self):
+        process = subprocess.run(
+            'python -m wordsearch generate --size 15 --seed 3 %s' %
+            ','.join(WORDS),
+            shell=True,
+            stdout=subprocess.PIPE)
+        assert process.returncode == 0
+        words, board = wordsearch.parse_puzzle(
+            io.StringIO(process.stdout.decode()))
+        assert words == WORDS
+        assert set(Puzzle(board).find_all(words)) == set(WORDS)
+
+    def test_generate_command_writes_numbered_files(self):
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            directory = self.tmp_path
+            monkeypatch.chdir(directory)
+            wordsearch.main([
+                'generate', '--size', '6', '--count', '3', '--output',
+                'puzzle-{index}.puzzle', 'DOG,CAT'
+            ])
+        assert sorted(path.name for path in directory.iterdir()) == [
+            'puzzle-0.puzzle', 'puzzle-1.puzzle', 'puzzle-2.puzzle'
+        ]
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.tmp_path = tmp_path
+# pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init
@@ -0,0 +1,188 @@
+import importlib.util
+import math
+import os
+import unittest
+import pytest
+
+import wordsearch
+import wordsearch._kernels
+from wordsearch.limits import UNLIMITED
+from wordsearch.solver import COMPILED, DIRECTIONS, Puzzle
+from wordsearch.wordlist import WordList
+
+PUZZLE_FILES = [
+    'data/pillar-sample.puzzle',
+    'data/sample-puzzle.puzzle',
+    'data/large.puzzle',
+]
+
+
+def load_pure_python_kernels():
+    """Imports the kernel source file directly, bypassing any compiled
+    extension that may shadow it."""
+    spec = importlib.util.spec_from_file_location(
+        'wordsearch._pure_kernels', 'wordsearch/_kernels.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Without a compiled extension, the installed kernels are the source file
+# itself, and comparing them with it would prove nothing.
+compiled_only = pytest.mark.skipif(
+    not COMPILED, reason='the kernels are not compiled (run make test-compiled)')
+
+
+# pylint: disable=invalid-name, no-self-use, attribute-defined-outside-init
+class KernelTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        self.pure = load_pure_python_kernels()
+        self.installed = wordsearch._kernels
+    # pylint: enable=unused-argument
+
+    def scan_both(self, path, limit):
+        with open(path) as puzzle_file:
+            words, board = wordsearch.parse_puzzle(puzzle_file)
+        puzzle = Puzzle(board)
+        cells = puzzle.cells()
+        starts = range(len(cells))
+        for word in words:
+            yield (
+                self.pure.scan(cells, puzzle.height, puzzle.width, word,
+                               DIRECTIONS, False, starts, limit,
+                               UNLIMITED),
+                self.installed.scan(cells, puzzle.height, puzzle.width, word,
+                                    DIRECTIONS, False, starts, limit,
+                                    UNLIMITED),
+            )
+
+    @compiled_only
+    def test_pure_and_installed_kernels_find_the_same_first_match(self):
+        for path in PUZZLE_FILES:
+            for pure, installed in self.scan_both(path, 1):
+                assert len(pure[0]) == 1
+                assert pure == installed
+
+    @compiled_only
+    def test_pure_and_installed_kernels_find_the_same_matches(self):
+        for path in PUZZLE_FILES:
+            for pure, installed in self.scan_both(path, 0):
+                assert pure == installed
+
+    @pytest.mark.skipif('WORDSEARCH_REQUIRE_COMPILED' not in os.environ,
+                        reason='a compiled extension is not required')
+    def test_the_compiled_kernels_are_loaded(self):
+        assert COMPILED, '%s is not compiled' % wordsearch._kernels.__file__
+
+    def test_scan_finds_matches_in_every_direction(self):
+        # yapf: disable
+        cells = ['a', 'b', 'a',
+                 'b', 'a', 'b',
+                 'a', 'b', 'a']
+        # yapf: enable
+        codes, _ = self.pure.scan(cells, 3, 3, 'ab', DIRECTIONS, False,
+                                  range(9), 0, UNLIMITED)
+        starts = {code // len(DIRECTIONS) for code in codes}
+        assert starts == {0, 2, 4, 6, 8}
+        assert len(codes) == 12
+
+    def test_scan_stops_at_the_limit(self):
+        cells = ['a'] * 9
+        codes, _ = self.pure.scan(cells, 3, 3, 'aa', DIRECTIONS, False,
+                                  range(9), 5, UNLIMITED)
+        assert len(codes) == 5
+
+    def test_scan_gives_up_once_the_budget_is_spent(self):
+        cells = ['a'] * 9
+        codes, steps = self.pure.scan(cells, 3, 3, 'ab', DIRECTIONS, False,
+                                      range(9), 0, 10)
+        assert not codes
+        assert steps > 10
+        assert steps < 20
+
+    def test_solver_results_match_the_pure_python_kernels(self):
+        with open('data/large.puzzle') as puzzle_file:
+            words, board = wordsearch.parse_puzzle(puzzle_file)
+        puzzle = Puzzle(board)
+        for word in words:
+            codes, _ = self.pure.scan(puzzle.cells(), puzzle.height,
+                                      puzzle.width, word, DIRECTIONS, False,
+                                      range(puzzle.height * puzzle.width), 1,
+                                      UNLIMITED)
+            assert puzzle.find(word) == puzzle.get_positions(
+                codes[0], len(word))
+
+    @compiled_only
+    def test_pure_and_installed_kernels_scan_a_trie_the_same_way(self):
+        for path in PUZZLE_FILES:
+            with open(path) as puzzle_file:
+                words, board = wordsearch.parse_puzzle(puzzle_file)
+            puzzle = Puzzle(board)
+            word_list = WordList.from_words(words)
+            codes = [ord(cell) for cell in puzzle.cells()]
+            trie = (word_list.first_edge, word_list.edge_count,
+                    word_list.node_word, word_list.edge_code,
+                    word_list.edge_target)
+            results = []
+            for kernels in [self.pure, self.installed]:
+                found = [-1] * len(word_list)
+                steps = kernels.scan_trie(codes, puzzle.height, puzzle.width,
+                                          DIRECTIONS, False, range(len(codes)),
+                                          *trie, word_list.shortest(),
+                                          found, UNLIMITED)
+                results.append((found, steps))
+            assert results[0] == results[1]
+            assert all(code >= 0 for code in results[0][0])
+
+    @compiled_only
+    def test_pure_and_installed_kernels_collect_every_match_of_a_trie(self):
+        with open('data/large.puzzle') as puzzle_file:
+            words, board = wordsearch.parse_puzzle(puzzle_file)
+        puzzle = Puzzle(board)
+        word_list = WordList.from_words(words + ['AB', 'BA', 'ABA'])
+        codes = [ord(cell) for cell in puzzle.cells()]
+        trie = (word_list.first_edge, word_list.edge_count,
+                word_list.node_word, word_list.edge_code,
+                word_list.edge_target)
+        results = []
+        for kernels in [self.pure, self.installed]:
+            matches = []
+            steps = kernels.collect_trie(codes, puzzle.height, puzzle.width,
+                                         DIRECTIONS, False, range(len(codes)),
+                                         *trie, matches, UNLIMITED)
+            results.append((matches, steps))
+        assert results[0] == results[1]
+        matches = results[0][0]
+        # Every match of each word, in the order scan finds them.
+        for index, word in enumerate(word_list):
+            expected, _ = self.pure.scan(puzzle.cells(), puzzle.height,
+                                         puzzle.width, word, DIRECTIONS,
+                                         False, range(len(codes)), 0,
+                                         UNLIMITED)
+            assert expected == [
+                code for word_index, code in zip(matches[::2], matches[1::2])
+                if word_index == index
+            ]
+
+    @compiled_only
+    def test_pure_and_installed_kernels_search_paths_the_same_way(self):
+        with open('data/large.puzzle') as puzzle_file:
+            words, board = wordsearch.parse_puzzle(puzzle_file)
+        puzzle = Puzzle(board)
+        word_list = WordList.from_words(words + ['ABBA', 'STAB', 'TAXES'])
+        codes = [ord(cell) for cell in puzzle.cells()]
+        trie = (word_list.first_edge, word_list.edge_count,
+                word_list.node_word, word_list.edge_code,
+                word_list.edge_target)
+        results = []
+        for kernels in [self.pure, self.installed]:
+            pending = word_list.word_counts()
+            paths = [[] for _ in range(len(word_list))]
+            steps = kernels.search_paths(codes, puzzle.neighbor_table(),
+                                         range(len(codes)), *trie, pending,
+                                         paths, UNLIMITED, math.inf)
+            results.append((paths, pending, steps))
+        assert results[0] == results[1]
+# pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init
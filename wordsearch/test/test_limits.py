@@ -0,0 +1,51 @@
+import unittest
+import pytest
+
+from wordsearch.limits import UNLIMITED, Budget, LimitExceeded, Limits
+
+
+# pylint: disable=invalid-name, no-self-use
+class LimitsTest(unittest.TestCase):
+
+    def test_limits_are_not_enforced_by_default(self):
+        limits = Limits()
+        limits.check('max_size', 10**9)
+        assert limits.budget() is None
+
+    def test_raises_value_error_if_a_limit_is_not_positive(self):
+        with pytest.raises(ValueError) as e:
+            Limits(max_steps=0)
+        assert str(e.value) == 'max_steps must be positive.'
+
+    def test_check_raises_limit_exceeded_with_the_details(self):
+        with pytest.raises(LimitExceeded) as e:
+            Limits(max_words=10).check('max_words', 11)
+        assert str(e.value) == 'max_words exceeded: 11 > 10'
+        assert e.value.as_dict() == {
+            'limit': 'max_words',
+            'value': 11,
+            'maximum': 10
+        }
+
+
+class BudgetTest(unittest.TestCase):
+
+    def test_remaining_is_unlimited_without_a_step_limit(self):
+        assert Budget(timeout=1.0).remaining == UNLIMITED
+
+    def test_spend_counts_down_the_remaining_steps(self):
+        budget = Budget(max_steps=10)
+        budget.spend(4)
+        assert budget.remaining == 6
+        with pytest.raises(LimitExceeded) as e:
+            budget.spend(7)
+        assert e.value.limit == 'max_steps'
+        assert e.value.value == 11
+
+    def test_spend_raises_once_the_timeout_has_passed(self):
+        budget = Budget(timeout=0.01)
+        budget.started -= 1
+        with pytest.raises(LimitExceeded) as e:
+            budget.spend(0)
+        assert e.value.limit == 'timeout'
+# pylint: enable=invalid-name, no-self-use
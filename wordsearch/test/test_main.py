@@ -1,8 +1,12 @@
 import unittest
 import argparse
+import io
+import json
+import re
 import subprocess
 import pytest
 import wordsearch
+from wordsearch.limits import LimitExceeded, Limits
 from wordsearch.solver import Puzzle
 
 PILLAR_SAMPLE_WORD_LIST = 'BONES,KHAN,KIRK,SCOTTY,SPOCK,SULU,UHURA'.split(',')
@@ -73,12 +77,22 @@ class HelpAndUsageTest(unittest.TestCase):
     # pylint: enable=unused-argument
 
     def test_passing_the_help_flag_prints_the_program_usage(self):
-        content = 'usage: wordsearch [-h] puzzle_file'
-        assert content in self.stdout
+        usage = self.stdout.split('\n\n')[0]
+        assert usage.startswith('usage: wordsearch [-h]')
+        assert usage.endswith('puzzle_file')
 
     def test_the_help_message_has_a_description_for_the_input_file(self):
-        content = 'puzzle_file  The input puzzle file to solve.'
-        assert content in self.stdout
+        content = re.compile(r'puzzle_file +The input puzzle file to solve\.')
+        assert content.search(self.stdout)
+
+    def test_the_help_message_lists_the_resource_limits(self):
+        for option in ['--max-size N', '--max-words N', '--max-steps N',
+                       '--timeout SECONDS', '--max-input N']:
+            assert option in self.stdout
+
+    def test_the_help_message_lists_the_progress_options(self):
+        for option in ['--progress', '--metrics FILE']:
+            assert option in self.stdout
 
 
 class PuzzleParserTest(unittest.TestCase):
@@ -131,6 +145,38 @@ class PuzzleParserTest(unittest.TestCase):
             assert wordsearch.parse_puzzle(None)
         assert str(e.value) == 'Invalid argument: puzzle_file must not be None.'
 
+    def test_parse_puzzle_raises_if_the_board_exceeds_max_size(self):
+        limits = Limits(max_size=10)
+        with open('data/pillar-sample.puzzle') as puzzle_file:
+            with pytest.raises(LimitExceeded) as e:
+                wordsearch.parse_puzzle(puzzle_file, limits)
+        assert e.value.as_dict() == {
+            'limit': 'max_size',
+            'value': 15,
+            'maximum': 10
+        }
+
+    def test_parse_puzzle_raises_if_the_word_list_exceeds_max_words(self):
+        limits = Limits(max_words=3)
+        with open('data/pillar-sample.puzzle') as puzzle_file:
+            with pytest.raises(LimitExceeded) as e:
+                wordsearch.parse_puzzle(puzzle_file, limits)
+        assert e.value.limit == 'max_words'
+
+    def test_parse_puzzle_stops_reading_at_max_input(self):
+        puzzle_file = io.StringIO('A,B\n' + 'A' * 10000)
+        with pytest.raises(LimitExceeded) as e:
+            wordsearch.parse_puzzle(puzzle_file, Limits(max_input=100))
+        assert e.value.limit == 'max_input'
+        assert puzzle_file.tell() <= 101
+
+    def test_parse_puzzle_accepts_input_within_the_limits(self):
+        limits = Limits(max_size=15, max_words=7, max_input=1000)
+        with open('data/pillar-sample.puzzle') as puzzle_file:
+            words, puzzle = wordsearch.parse_puzzle(puzzle_file, limits)
+        assert words == PILLAR_SAMPLE_WORD_LIST
+        assert puzzle == PILLAR_SAMPLE_PUZZLE_BOARD
+
     def test_parse_puzzle_returns_none_and_empty_list_if_puzzle_is_empty(self):
         with open('data/empty.puzzle') as puzzle_file:
             words, puzzle = wordsearch.parse_puzzle(puzzle_file)
@@ -233,4 +279,66 @@ class WordsearchEndToEndTest(unittest.TestCase):
         # yapf: enable
         assert expected in self.stdout
 
+    def test_wordsearch_finds_words_along_paths(self):
+        command = 'python -m wordsearch --paths %s' % self.path
+        process = subprocess.run(command.split(), stdout=subprocess.PIPE)
+        lines = process.stdout.decode().split('\n')
+        assert [line.split(':')[0] for line in lines if line] == \
+            PILLAR_SAMPLE_WORD_LIST
+
+    def test_wordsearch_reports_an_exceeded_limit_as_an_error(self):
+        command = 'python -m wordsearch --max-steps 100 %s' % self.path
+        process = subprocess.run(command.split(),
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE)
+        assert process.returncode == 2
+        assert 'max_steps exceeded' in process.stderr.decode()
+
+    def test_wordsearch_warns_about_invalid_words(self):
+        path = self.tmp_path / 'invalid.puzzle'
+        path.write_text('A,CAT,CATERPILLAR\nC,A,T\nX,X,X\nX,X,X\n')
+        process = subprocess.run(['python', '-m', 'wordsearch',
+                                  str(path)],
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE)
+        assert process.returncode == 0
+        assert process.stdout.decode() == 'CAT: (0,0),(1,0),(2,0)\n'
+        assert process.stderr.decode().split('\n') == [
+            'wordsearch: warning: the specified word (A) is too short.',
+            'wordsearch: warning: the specified word (CATERPILLAR) is larger '
+            'than the board.', ''
+        ]
+
+    def test_wordsearch_streams_the_words_of_a_word_file(self):
+        words = self.tmp_path / 'words.txt'
+        words.write_text('KIRK\nNOTAWORD\nBONES\nK\nKIRK\n')
+        command = 'python -m wordsearch --chunk-size 2 --words-file %s %s' % (
+            words, self.path)
+        process = subprocess.run(command.split(),
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE)
+        assert process.stdout.decode().split('\n') == [
+            'KIRK: (4,7),(3,7),(2,7),(1,7)',
+            'BONES: (0,6),(0,7),(0,8),(0,9),(0,10)', ''
+        ]
+        assert process.stderr.decode() == \
+            'wordsearch: warning: the specified word (K) is too short.\n'
+
+    def test_wordsearch_writes_metrics_and_a_progress_bar(self):
+        metrics = self.tmp_path / 'metrics.jsonl'
+        command = 'python -m wordsearch --progress --metrics %s %s' % (
+            metrics, self.path)
+        process = subprocess.run(command.split(),
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE)
+        assert process.stdout.decode() == self.stdout
+        assert '100%' in process.stderr.decode()
+        last = json.loads(metrics.read_text().splitlines()[-1])
+        assert last['words'] == last['total'] == len(PILLAR_SAMPLE_WORD_LIST)
+        assert last['eta'] == 0
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.tmp_path = tmp_path
+
 # pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init
@@ -0,0 +1,52 @@
+import json
+import unittest
+import pytest
+
+from wordsearch.match import Match
+
+
+# pylint: disable=invalid-name, no-self-use, attribute-defined-outside-init
+class MatchTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        self.match = Match((3, 0), (-1, 1), 3)
+    # pylint: enable=unused-argument
+
+    def test_iterating_gives_the_position_of_each_character(self):
+        assert list(self.match) == [(3, 0), (2, 1), (1, 2)]
+
+    def test_a_match_compares_equal_to_the_list_of_its_positions(self):
+        assert self.match == [(3, 0), (2, 1), (1, 2)]
+        assert [(3, 0), (2, 1), (1, 2)] == self.match
+        assert self.match != [(3, 0), (2, 1)]
+
+    def test_a_match_is_a_sequence(self):
+        assert len(self.match) == 3
+        assert self.match[0] == (3, 0)
+        assert self.match[-1] == self.match.end == (1, 2)
+        assert self.match[1:] == [(2, 1), (1, 2)]
+        assert (2, 1) in self.match
+        with pytest.raises(IndexError):
+            _ = self.match[3]
+
+    def test_positions_wrap_around_the_board(self):
+        match = Match((0, 3), (0, 1), 3, size=(4, 4))
+        assert list(match) == [(0, 3), (0, 0), (0, 1)]
+
+    def test_matches_are_equal_and_hash_equal_if_their_fields_are(self):
+        other = Match((3, 0), (-1, 1), 3)
+        assert self.match == other
+        assert hash(self.match) == hash(other)
+        assert self.match != Match((3, 0), (-1, 1), 2)
+
+    def test_as_dict_can_be_serialized_to_json(self):
+        assert json.loads(json.dumps(self.match.as_dict())) == {
+            'start': [3, 0],
+            'direction': [-1, 1],
+            'length': 3
+        }
+
+    def test_a_match_does_not_store_its_positions(self):
+        assert not hasattr(self.match, '__dict__')
+# pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init
@@ -0,0 +1,70 @@
+import io
+import json
+import unittest
+
+from wordsearch.progress import Progress, metrics_writer, progress_bar
+
+
+# pylint: disable=invalid-name, no-self-use, attribute-defined-outside-init
+class ProgressTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        self.reports = []
+        self.progress = Progress(self.reports.append, total=100, interval=0)
+    # pylint: enable=unused-argument
+
+    def test_words_within_a_chunk_are_estimated_from_the_cells_scanned(self):
+        self.progress.start_chunk(100, 10)
+        self.progress.scanned(5)
+        assert self.reports[-1]['words'] == 50
+        assert self.reports[-1]['cells'] == 5
+        assert self.reports[-1]['total'] == 100
+
+    def test_finishing_a_chunk_counts_all_of_its_words(self):
+        self.progress.start_chunk(40, 10)
+        self.progress.scanned(10)
+        self.progress.finish_chunk()
+        self.progress.finish()
+        assert self.reports[-1]['words'] == 40
+        assert self.reports[-1]['eta'] is not None
+
+    def test_reports_are_limited_to_one_per_interval(self):
+        progress = Progress(self.reports.append, interval=3600)
+        progress.start_chunk(10, 100)
+        for _ in range(100):
+            progress.scanned(1)
+        assert self.reports == []
+        progress.finish()
+        assert len(self.reports) == 1
+
+    def test_the_eta_is_unknown_without_a_total(self):
+        progress = Progress(self.reports.append)
+        assert progress.as_dict()['eta'] is None
+
+    def test_metrics_writer_writes_lines_of_json(self):
+        stream = io.StringIO()
+        write = metrics_writer(stream)
+        write(self.progress.as_dict())
+        write(self.progress.as_dict())
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert set(json.loads(lines[0])) == {
+            'words', 'total', 'cells', 'elapsed', 'words_per_second',
+            'cells_per_second', 'eta'
+        }
+
+    def test_progress_bar_draws_the_share_of_words_done(self):
+        stream = io.StringIO()
+        progress_bar(stream, width=10)({
+            'words': 50,
+            'total': 100,
+            'cells': 10,
+            'elapsed': 1.0,
+            'words_per_second': 50.0,
+            'cells_per_second': 10.0,
+            'eta': 1.0
+        })
+        assert stream.getvalue() == \
+            '\r[#####.....]  50% 50 words, 50 words/s, 10 cells/s, ETA 1s'
+# pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init
@@ -1,8 +1,17 @@
+import concurrent.futures
+import random
+import sys
+import time
 import unittest
 import pytest
 
+import wordsearch
 import wordsearch.solver
-from wordsearch.solver import Puzzle
+from wordsearch.limits import Budget, LimitExceeded, Limits
+from wordsearch.match import Match
+from wordsearch.solver import (FORWARD_DIRECTIONS, KNIGHT_MOVES, FrozenPuzzle,
+                               Puzzle)
+from wordsearch.wordlist import WordList
 
 
 # pylint: disable=invalid-name, no-self-use, attribute-defined-outside-init
@@ -229,16 +238,475 @@ class PuzzleTest(unittest.TestCase):
         }
         assert expected == self.puzzle.find_all(words)
 
+    def test_find_match_gives_a_compact_match(self):
+        match = self.puzzle.find_match('cat')
+        assert isinstance(match, Match)
+        assert (match.start, match.direction, match.length) == \
+            ((3, 0), (-1, 1), 3)
+        assert self.puzzle.find_match('cow') is None
+
+    def test_find_all_gives_matches_equal_to_the_positions_of_find(self):
+        found = self.puzzle.find_all(['dog', 'cat'])
+        assert all(isinstance(match, Match) for match in found.values())
+        assert found == {word: self.puzzle.find(word) for word in found}
+
+    def test_find_all_keeps_the_order_of_the_first_occurrences(self):
+        words = ['pig', 'dog', 'pig', 'cow', 'do', 'dog']
+        assert list(self.puzzle.find_all(words)) == ['pig', 'dog', 'do']
+
+    def test_find_all_finds_a_prefix_of_a_word_along_the_same_line(self):
+        found = self.puzzle.find_all(['dog', 'do'])
+        assert found['do'] == found['dog'][:2]
+
+    def test_find_all_reports_invalid_words_instead_of_raising(self):
+        invalid = []
+        found = self.puzzle.find_all(['d', 'dog', 'doggy', 7],
+                                     lambda *args: invalid.append(args))
+        assert list(found) == ['dog']
+        assert invalid == [
+            ('d', 'the specified word (d) is too short.'),
+            ('doggy', 'the specified word (doggy) is larger than the board.'),
+            (7, 'the specified word is not of type str.')
+        ]
+
+    def test_find_all_skips_invalid_words_without_a_callback(self):
+        assert list(self.puzzle.find_all(['d', 'dog', None])) == ['dog']
+
     def test_find_all_raises_value_error_when_words_is_null(self):
         with pytest.raises(ValueError) as e:
             self.puzzle.find_all(None)
         assert str(e.value) == 'the specified list of words is None.'
 
-    def test_find_all_raises_type_error_if_words_is_not_a_list(self):
-        words = ('cat', 'dog', 'pig')
-        with pytest.raises(TypeError) as e:
-            self.puzzle.find_all(words)
+    def test_find_all_raises_type_error_if_words_is_not_iterable(self):
+        for words in ['cat', 5]:
+            with pytest.raises(TypeError) as e:
+                self.puzzle.find_all(words)
+            assert str(e.value) == \
+                'expected words to be an iterable of str, but got (%s)' % \
+                type(words)
+
+    def test_find_all_accepts_any_iterable_of_words(self):
+        words = ['dog', 'cat', 'cow']
+        expected = self.puzzle.find_all(words)
+        assert self.puzzle.find_all(tuple(words)) == expected
+        assert self.puzzle.find_all(word for word in words) == expected
+
+    def test_find_all_raises_value_error_if_chunk_size_is_not_positive(self):
+        with pytest.raises(ValueError) as e:
+            self.puzzle.find_all(['dog'], chunk_size=0)
+        assert str(e.value) == 'chunk_size must be positive.'
+
+    def test_iter_find_searches_one_chunk_at_a_time(self):
+        chunks = []
+        words = iter(['pig', 'cow', 'dog', 'pig', 'cat', 'dog', 'rat'])
+
+        def read():
+            for word in words:
+                chunks.append(word)
+                yield word
+
+        found = self.puzzle.iter_find(read(), chunk_size=2)
+        assert next(found)[0] == 'pig'
+        assert chunks == ['pig', 'cow']
+        assert [word for word, _ in found] == ['dog', 'cat']
+
+    def test_find_all_reports_its_progress(self):
+        reports = []
+        words = ['dog', 'cat', 'pig', 'cow', 'rat']
+        self.puzzle.find_all(words, chunk_size=2, on_progress=reports.append)
+        assert reports[-1]['words'] == reports[-1]['total'] == len(words)
+        assert reports[-1]['cells'] == 3 * 16
+
+    def test_find_paths_reports_its_progress(self):
+        reports = []
+        self.puzzle.find_paths(WordList.from_words(['dog', 'coat']),
+                               on_progress=reports.append)
+        assert reports[-1]['words'] == 2
+        assert reports[-1]['cells'] == 16
+
+    def test_iter_find_checks_max_words_as_it_reads(self):
+        puzzle = Puzzle(self.board, limits=Limits(max_words=3))
+        found = puzzle.iter_find(iter(['dog', 'cat', 'pig', 'cow']),
+                                 chunk_size=2)
+        assert next(found)[0] == 'dog'
+        with pytest.raises(LimitExceeded) as e:
+            list(found)
+        assert e.value.limit == 'max_words'
+
+    def test_iter_find_paths_gives_the_paths_of_find_paths(self):
+        words = ['dog', 'coat', 'cow', 'dog', 'rat']
+        assert dict(self.puzzle.iter_find_paths(iter(words), chunk_size=1)) \
+            == self.puzzle.find_paths(words)
+
+    def test_raises_limit_exceeded_if_the_board_is_larger_than_max_size(self):
+        with pytest.raises(LimitExceeded) as e:
+            _ = Puzzle(self.board, limits=Limits(max_size=3))
+        assert e.value.limit == 'max_size'
+
+    def test_find_all_raises_limit_exceeded_if_there_are_too_many_words(self):
+        puzzle = Puzzle(self.board, limits=Limits(max_words=2))
+        with pytest.raises(LimitExceeded) as e:
+            puzzle.find_all(['dog', 'cat', 'pig'])
+        assert e.value.limit == 'max_words'
+
+    def test_find_gives_the_same_results_within_the_limits(self):
+        puzzle = Puzzle(self.board, limits=Limits(max_steps=1000, timeout=10))
+        assert [(3, 0), (2, 1), (1, 2)] == puzzle.find('cat')
+        assert [] == puzzle.find('cow')
+
+
+class AdversarialPuzzleTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        self.size = 60
+        self.board = [['A'] * self.size for _ in range(self.size)]
+        self.word = 'A' * (self.size - 1) + 'B'
+    # pylint: enable=unused-argument
+
+    def test_find_stops_after_max_steps(self):
+        puzzle = Puzzle(self.board, limits=Limits(max_steps=10000))
+        with pytest.raises(LimitExceeded) as e:
+            puzzle.find(self.word)
+        assert e.value.limit == 'max_steps'
+        assert e.value.maximum == 10000
+        # The budget is checked once per row, so the overshoot is bounded.
+        assert e.value.value < 10000 + 8 * self.size * self.size
+
+    def test_find_all_shares_one_budget_between_the_words(self):
+        puzzle = Puzzle(self.board, limits=Limits(max_steps=20000))
+        assert puzzle.find_all(['BA']) == {}
+        with pytest.raises(LimitExceeded):
+            puzzle.find_all(['BA', self.word])
+
+    def test_find_stops_after_the_timeout(self):
+        puzzle = Puzzle(self.board, limits=Limits(timeout=0.001))
+        with pytest.raises(LimitExceeded) as e:
+            puzzle.find_all([self.word] * 1000)
+        assert e.value.limit == 'timeout'
+
+    def test_find_paths_stops_after_max_steps_within_a_single_start(self):
+        # From a single cell of a uniform board, the paths branch without end.
+        board = [['A'] * 6 for _ in range(6)]
+        puzzle = Puzzle(board, limits=Limits(max_steps=10000))
+        with pytest.raises(LimitExceeded) as e:
+            puzzle.find_paths(['A' * 30 + 'B'])
+        assert e.value.limit == 'max_steps'
+        assert e.value.value == 10001
+
+    def test_find_paths_stops_after_the_timeout_within_a_single_start(self):
+        board = [['A'] * 6 for _ in range(6)]
+        puzzle = Puzzle(board, limits=Limits(timeout=0.2))
+        started = time.monotonic()
+        with pytest.raises(LimitExceeded) as e:
+            puzzle.find_paths(['A' * 30 + 'B'])
+        assert e.value.limit == 'timeout'
+        assert time.monotonic() - started < 5
+
+
+class DirectionModelTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        # Word list: dog, cat, pig
+        # yapf: disable
+        self.board = [
+            ['x', 'd', 'o', 'g'],
+            ['o', 'r', 't', 'i'],
+            ['j', 'a', 'i', 'p'],
+            ['c', 'l', 'm', 'q']
+        ]
+        # yapf: enable
+    # pylint: enable=unused-argument
+
+    def test_directions_default_to_all_eight_directions(self):
+        assert Puzzle(self.board).directions == wordsearch.solver.DIRECTIONS
+
+    def test_find_only_searches_the_enabled_directions(self):
+        puzzle = Puzzle(self.board, directions=FORWARD_DIRECTIONS)
+        assert puzzle.find('dog') == [(0, 1), (0, 2), (0, 3)]
+        assert puzzle.find('cat') == [(3, 0), (2, 1), (1, 2)]
+        assert puzzle.find('pig') == []
+        assert puzzle.find('god') == []
+
+    def test_get_valid_moves_only_gives_the_enabled_directions(self):
+        puzzle = Puzzle(self.board, directions=[wordsearch.solver.RIGHT])
+        assert puzzle.get_valid_moves((1, 1)) == [(1, 2)]
+
+    def test_restricting_the_directions_reduces_the_work(self):
+        words = ['dog', 'cat', 'pig', 'cow']
+        steps = []
+        for directions in [None, FORWARD_DIRECTIONS]:
+            puzzle = Puzzle(self.board, directions=directions)
+            budget = Budget(max_steps=10**6)
+            for word in words:
+                puzzle.scan(word, budget=budget)
+            steps.append(budget.steps)
+        assert steps[1] < steps[0]
+
+    def test_find_follows_knight_moves(self):
+        # yapf: disable
+        board = [
+            ['k', 'x', 'x', 'x'],
+            ['x', 'x', 'n', 'x'],
+            ['x', 'x', 'x', 'x'],
+            ['x', 'i', 'x', 'x']
+        ]
+        # yapf: enable
+        puzzle = Puzzle(board, directions=KNIGHT_MOVES)
+        assert puzzle.find('kn') == [(0, 0), (1, 2)]
+        assert puzzle.find('kni') == []
+        assert puzzle.find('ni') == [(1, 2), (3, 1)]
+
+    def test_find_wraps_around_the_edges_when_wrap_is_set(self):
+        puzzle = Puzzle(self.board, wrap=True)
+        assert Puzzle(self.board).find('gx') == []
+        assert puzzle.find('gx') == [(0, 3), (0, 0)]
+        assert puzzle.find('qxr') == [(3, 3), (0, 0), (1, 1)]
+        assert puzzle.get_valid_moves((0, 0)) == [(0, 1), (0, 3), (3, 0),
+                                                  (1, 0), (3, 1), (1, 1),
+                                                  (3, 3), (1, 3)]
+
+    def test_get_characters_follows_every_valid_move(self):
+        for directions, wrap in [(None, False), (None, True),
+                                 (KNIGHT_MOVES, False), (KNIGHT_MOVES, True)]:
+            puzzle = Puzzle(self.board, directions=directions, wrap=wrap)
+            for origin in puzzle.all_positions():
+                for target in puzzle.get_valid_moves(origin):
+                    _, positions = puzzle.get_characters(origin, target)
+                    assert positions[0] == origin
+                    assert positions[-1] == target
+
+    def test_get_characters_follows_a_knight_move(self):
+        puzzle = Puzzle(self.board, directions=KNIGHT_MOVES)
+        assert puzzle.get_direction((0, 0), (1, 2)) == (1, 2)
+        assert puzzle.get_characters((0, 0), (1, 2)) == (['x', 't'],
+                                                        [(0, 0), (1, 2)])
+
+    def test_get_characters_takes_the_shortest_way_around_the_edges(self):
+        board = [list('abcde')] + [list('fghij')] * 4
+        puzzle = Puzzle(board, wrap=True)
+        assert puzzle.get_direction((0, 0), (0, 3)) == wordsearch.solver.LEFT
+        characters, positions = puzzle.get_characters((0, 0), (0, 3))
+        assert characters == ['a', 'e', 'd']
+        assert positions == [(0, 0), (0, 4), (0, 3)]
+
+    def test_get_direction_raises_if_the_target_cannot_be_reached(self):
+        puzzle = Puzzle(self.board)
+        with pytest.raises(ValueError) as e:
+            puzzle.get_direction((0, 0), (1, 2))
         assert str(e.value) == \
-            'expected words to be of type list, but got (%s)' % type(words)
+            'target cannot be reached from origin along any direction.'
+        with pytest.raises(ValueError):
+            puzzle.get_characters((0, 0), (1, 2))
+
+    def test_find_all_with_a_word_list_uses_the_direction_model(self):
+        words = ['dog', 'god', 'cat', 'pig', 'gx', 'qxr', 'ggg', 'jojo']
+        for directions, wrap in [(None, True), (FORWARD_DIRECTIONS, False),
+                                 (FORWARD_DIRECTIONS, True),
+                                 (KNIGHT_MOVES, True)]:
+            puzzle = Puzzle(self.board, directions=directions, wrap=wrap)
+            assert puzzle.find_all(WordList.from_words(words)) == \
+                puzzle.find_all(words)
+
+    def test_freeze_keeps_the_direction_model(self):
+        puzzle = Puzzle(self.board, directions=FORWARD_DIRECTIONS, wrap=True)
+        frozen = puzzle.freeze()
+        assert frozen.directions == tuple(FORWARD_DIRECTIONS)
+        assert frozen.wrap
+        assert frozen.find('gx') == puzzle.find('gx')
+
+    def test_raises_value_error_for_invalid_directions(self):
+        for directions, message in [
+            ([], 'directions is empty.'),
+            ([(0, 1), (0, 1)], 'directions contains duplicates.'),
+            ([(0, 0)], 'directions contains the step (0, 0).'),
+        ]:
+            with pytest.raises(ValueError) as e:
+                Puzzle(self.board, directions=directions)
+            assert str(e.value) == message
+
+
+def path_exists(puzzle, word, path):
+    """A brute force check for a path of adjacent cells spelling ``word``."""
+    if len(path) == len(word):
+        return True
+    if path:
+        moves = puzzle.get_valid_moves(path[-1])
+    else:
+        moves = puzzle.all_positions()
+    for y, x in moves:  # pylint: disable=invalid-name
+        if (y, x) not in path and puzzle.board[y][x] == word[len(path)]:
+            if path_exists(puzzle, word, path + [(y, x)]):
+                return True
+    return False
+
+
+class PathSearchTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        # yapf: disable
+        self.board = [
+            ['c', 'a', 't'],
+            ['x', 'o', 'x'],
+            ['d', 'g', 'x']
+        ]
+        # yapf: enable
+        self.puzzle = Puzzle(self.board)
+    # pylint: enable=unused-argument
+
+    def test_find_paths_follows_adjacent_cells(self):
+        assert self.puzzle.find_paths(['dog', 'coat', 'cow']) == {
+            'dog': [(2, 0), (1, 1), (2, 1)],
+            'coat': [(0, 0), (1, 1), (0, 1), (0, 2)]
+        }
+
+    def test_find_paths_does_not_reuse_a_cell(self):
+        assert self.puzzle.find_paths(['coco', 'gog']) == {}
+
+    def test_find_paths_follows_the_direction_model(self):
+        puzzle = Puzzle(self.board, directions=FORWARD_DIRECTIONS)
+        assert puzzle.find_paths(['cat', 'tac', 'cog', 'dog', 'god']) == {
+            'cat': [(0, 0), (0, 1), (0, 2)],
+            'cog': [(0, 0), (1, 1), (2, 1)],
+            'dog': [(2, 0), (1, 1), (2, 1)]
+        }
+        puzzle = Puzzle(self.board, wrap=True)
+        assert 'tc' in puzzle.find_paths(['tc'])
+
+    def test_find_paths_accepts_a_word_list(self):
+        word_list = WordList.from_words(['dog', 'coat', 'cow'])
+        assert self.puzzle.freeze().find_paths(word_list) == \
+            self.puzzle.find_paths(['dog', 'coat', 'cow'])
+
+    def test_find_paths_finds_the_same_words_as_a_brute_force_search(self):
+        generator = random.Random(3)
+        for _ in range(20):
+            size = generator.randint(2, 5)
+            board = [[generator.choice('abc') for _ in range(size)]
+                     for _ in range(size)]
+            words = list({
+                ''.join(generator.choice('abc')
+                        for _ in range(generator.randint(2, 7)))
+                for _ in range(30)
+            })
+            puzzle = Puzzle(board)
+            found = puzzle.find_paths(words)
+            for word in words:
+                assert (word in found) == path_exists(puzzle, word, [])
+            for word, path in found.items():
+                assert len(set(path)) == len(path)
+                assert ''.join(board[y][x] for y, x in path) == word
+                for first, second in zip(path, path[1:]):
+                    assert second in puzzle.get_valid_moves(first)
+
+    def test_find_paths_reports_invalid_words(self):
+        invalid = []
+        found = self.puzzle.find_paths(['c', 'dog', None],
+                                       lambda *args: invalid.append(args))
+        assert list(found) == ['dog']
+        assert invalid == [('c', 'the specified word (c) is too short.'),
+                           (None, 'the specified word is None.')]
+
+    def test_find_paths_respects_the_limits(self):
+        puzzle = Puzzle(self.board, limits=Limits(max_steps=5))
+        with pytest.raises(LimitExceeded):
+            puzzle.find_paths(['coat', 'dog'])
+
+
+class FrozenPuzzleTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        # yapf: disable
+        self.board = [
+            ['x', 'd', 'o', 'g'],
+            ['o', 'r', 't', 'i'],
+            ['j', 'a', 'i', 'p'],
+            ['c', 'l', 'm', 'q']
+        ]
+        # yapf: enable
+        self.puzzle = FrozenPuzzle(self.board)
+    # pylint: enable=unused-argument
+
+    def test_board_is_copied_into_tuples(self):
+        assert self.puzzle.board[0] == ('x', 'd', 'o', 'g')
+        self.board[0][0] = 'c'
+        assert self.puzzle.board[0][0] == 'x'
+
+    def test_attributes_cannot_be_assigned(self):
+        with pytest.raises(AttributeError) as e:
+            self.puzzle.board = []
+        assert str(e.value) == 'FrozenPuzzle is immutable.'
+        with pytest.raises(AttributeError):
+            del self.puzzle.limits
+
+    def test_freeze_gives_a_frozen_copy_of_a_puzzle(self):
+        puzzle = Puzzle(self.board)
+        frozen = puzzle.freeze()
+        assert isinstance(frozen, FrozenPuzzle)
+        assert frozen.freeze() is frozen
+        assert frozen.board == tuple(tuple(row) for row in self.board)
+
+    def test_indexes_are_built_once_and_are_read_only(self):
+        cells, index = self.puzzle.indexes()
+        assert self.puzzle.indexes()[1] is index
+        assert cells[4] == 'o'
+        assert index['o'] == (2, 4)
+        with pytest.raises(TypeError):
+            index['z'] = (0,)
+
+    def test_find_all_gives_the_same_results_as_a_puzzle(self):
+        words = ['dog', 'cat', 'pig', 'cow', 'tar']
+        assert Puzzle(self.board).find_all(words) == \
+            self.puzzle.find_all(words)
+
+    def test_find_respects_the_limits(self):
+        puzzle = FrozenPuzzle(self.board, limits=Limits(max_steps=2))
+        with pytest.raises(LimitExceeded):
+            puzzle.find('dog')
+
+
+class ConcurrentSearchTest(unittest.TestCase):
+    """Runs many searches on one shared :class:`FrozenPuzzle` at once."""
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        with open('data/large.puzzle') as puzzle_file:
+            self.words, board = wordsearch.parse_puzzle(puzzle_file)
+        self.expected = Puzzle(board).find_all(self.words)
+        self.puzzle = FrozenPuzzle(board)
+        self.threads = 16
+        self.rounds = 32
+    # pylint: enable=unused-argument
+
+    def solve(self, threads):
+        started = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+            results = list(
+                executor.map(lambda _: self.puzzle.find_all(self.words),
+                             range(self.rounds)))
+        return results, time.perf_counter() - started
+
+    def test_find_all_from_many_threads_gives_the_correct_results(self):
+        results, _ = self.solve(self.threads)
+        assert len(results) == self.rounds
+        assert all(result == self.expected for result in results)
+
+    def test_indexes_are_built_once_by_concurrent_first_searches(self):
+        with concurrent.futures.ThreadPoolExecutor(self.threads) as executor:
+            indexes = set(
+                executor.map(lambda _: id(self.puzzle.indexes()[1]),
+                             range(self.threads)))
+        assert len(indexes) == 1
+
+    @pytest.mark.skipif(getattr(sys, '_is_gil_enabled', lambda: True)(),
+                        reason='threads only run in parallel without the GIL')
+    def test_find_all_throughput_scales_with_threads(self):
+        self.solve(1)
+        _, serial = self.solve(1)
+        _, parallel = self.solve(4)
+        assert parallel < serial / 2
 # pylint: enable=too-many-public-methods
 # pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init,
@@ -0,0 +1,90 @@
+import unittest
+
+from wordsearch.solver import (DIRECTIONS, FORWARD_DIRECTIONS, KNIGHT_MOVES,
+                               FrozenPuzzle, Puzzle)
+from wordsearch.symmetry import SYMMETRIES, Symmetry, canonical_form
+
+
+# pylint: disable=invalid-name, no-self-use, attribute-defined-outside-init
+class SymmetryTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        # yapf: disable
+        self.board = [
+            ['a', 'b', 'c'],
+            ['d', 'e', 'f'],
+            ['g', 'h', 'i']
+        ]
+        # yapf: enable
+    # pylint: enable=unused-argument
+
+    def test_there_are_eight_distinct_symmetries(self):
+        boards = {str(symmetry.board(self.board)) for symmetry in SYMMETRIES}
+        assert len(boards) == 8
+        assert SYMMETRIES[0].board(self.board) == self.board
+
+    def test_a_rotation_moves_cells_and_directions_together(self):
+        # Transposing and then flipping the columns turns the board clockwise.
+        clockwise = Symmetry(True, True, False)
+        assert clockwise.board(self.board) == [['g', 'd', 'a'],
+                                               ['h', 'e', 'b'],
+                                               ['i', 'f', 'c']]
+        assert clockwise.position((0, 0), 3) == (0, 2)
+        assert clockwise.direction((0, 1)) == (1, 0)
+
+    def test_inverse_undoes_a_symmetry(self):
+        for symmetry in SYMMETRIES:
+            inverse = symmetry.inverse()
+            assert inverse.board(symmetry.board(self.board)) == self.board
+            for direction in DIRECTIONS:
+                assert inverse.direction(symmetry.direction(direction)) == \
+                    direction
+
+    def test_canonical_form_is_the_same_for_every_symmetry(self):
+        forms = set()
+        for symmetry in SYMMETRIES:
+            board = symmetry.board(self.board)
+            key, found = canonical_form(board)
+            assert found.board(board) == canonical_form(self.board)[1].board(
+                self.board)
+            forms.add(key)
+        assert len(forms) == 1
+
+    def test_preserves_tells_which_direction_models_are_symmetric(self):
+        assert all(symmetry.preserves(DIRECTIONS) for symmetry in SYMMETRIES)
+        assert all(symmetry.preserves(KNIGHT_MOVES) for symmetry in SYMMETRIES)
+        assert [symmetry for symmetry in SYMMETRIES
+                if symmetry.preserves(FORWARD_DIRECTIONS)] == [SYMMETRIES[0]]
+
+
+class FingerprintTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        self.board = [list('cat'), list('dog'), list('pig')]
+    # pylint: enable=unused-argument
+
+    def test_fingerprint_is_invariant_under_rotations_and_mirrors(self):
+        fingerprints = {
+            Puzzle(symmetry.board(self.board)).fingerprint()
+            for symmetry in SYMMETRIES
+        }
+        assert len(fingerprints) == 1
+
+    def test_fingerprint_differs_between_boards(self):
+        other = [list('cat'), list('dog'), list('pug')]
+        assert Puzzle(self.board).fingerprint() != \
+            Puzzle(other).fingerprint()
+
+    def test_fingerprint_depends_on_the_direction_model(self):
+        assert Puzzle(self.board).fingerprint() != \
+            Puzzle(self.board, wrap=True).fingerprint()
+        mirrored = SYMMETRIES[1].board(self.board)
+        assert Puzzle(self.board, directions=FORWARD_DIRECTIONS).fingerprint() \
+            != Puzzle(mirrored, directions=FORWARD_DIRECTIONS).fingerprint()
+
+    def test_a_frozen_puzzle_has_the_same_fingerprint(self):
+        assert FrozenPuzzle(self.board).fingerprint() == \
+            Puzzle(self.board).fingerprint()
+# pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init
@@ -0,0 +1,138 @@
+import io
+import subprocess
+import unittest
+import pytest
+
+import wordsearch
+from wordsearch.solver import Puzzle
+from wordsearch.wordlist import WordList, read_words
+
+PUZZLE_FILES = [
+    'data/pillar-sample.puzzle',
+    'data/sample-puzzle.puzzle',
+    'data/large.puzzle',
+]
+
+
+# pylint: disable=invalid-name, no-self-use, attribute-defined-outside-init
+class WordListTest(unittest.TestCase):
+
+    # pylint: disable=unused-argument
+    def setup_method(self, method):
+        self.word_list = WordList.from_words(
+            ['DOG', 'CAT', 'DOG', 'DO', 'D', 'CATS'])
+    # pylint: enable=unused-argument
+
+    def test_from_words_deduplicates_sorts_and_drops_short_words(self):
+        assert list(self.word_list) == ['CAT', 'CATS', 'DO', 'DOG']
+        assert len(self.word_list) == 4
+
+    def test_from_words_shares_prefixes_in_the_trie(self):
+        # The root, C, CA, CAT, CATS, D, DO and DOG.
+        assert len(self.word_list.node_word) == 8
+        assert len(self.word_list.edge_code) == 7
+
+    def test_from_words_reports_invalid_words(self):
+        word_list = WordList.from_words(['DOG', 5, None, 'A', 'HORSE'],
+                                        max_length=4)
+        assert list(word_list) == ['DOG']
+        assert word_list.invalid == [
+            (5, 'the specified word is not of type str.'),
+            (None, 'the specified word is None.'),
+            ('A', 'the specified word (A) is too short.'),
+            ('HORSE', 'the specified word (HORSE) is larger than the board.')
+        ]
+
+    def test_shortest_gives_the_length_of_the_shortest_word(self):
+        assert self.word_list.shortest() == 2
+        assert WordList.from_words(['ABCD', 'XY']).shortest() == 2
+        assert WordList.from_words([]).shortest() == 0
+
+    def test_getitem_raises_index_error_if_out_of_range(self):
+        with pytest.raises(IndexError):
+            _ = self.word_list[4]
+
+    def test_save_and_from_buffer_round_trip(self):
+        compiled = io.BytesIO()
+        self.word_list.save(compiled)
+        loaded = WordList.from_buffer(compiled.getvalue())
+        assert list(loaded) == list(self.word_list)
+        assert list(loaded.edge_target) == list(self.word_list.edge_target)
+
+    def test_from_buffer_rejects_other_files(self):
+        with pytest.raises(ValueError) as e:
+            WordList.from_buffer(b'BONES,KHAN,KIRK,SCOTTY,SPOCK,SULU,UHURA')
+        assert str(e.value) == 'not a compiled word list.'
+
+    def test_from_buffer_rejects_truncated_files(self):
+        compiled = io.BytesIO()
+        self.word_list.save(compiled)
+        with pytest.raises(ValueError) as e:
+            WordList.from_buffer(compiled.getvalue()[:-1])
+        assert str(e.value) == 'the compiled word list is truncated.'
+
+    def test_load_memory_maps_a_compiled_file(self):
+        path = self.tmp_path / 'words.wsw'
+        with open(path, 'wb') as word_file:
+            self.word_list.save(word_file)
+        with WordList.load(str(path)) as loaded:
+            assert list(loaded) == ['CAT', 'CATS', 'DO', 'DOG']
+        assert loaded.source is None
+
+    def test_read_words_splits_on_commas_and_white_space(self):
+        word_file = io.StringIO('BONES,KHAN\nKIRK\n\n SCOTTY SPOCK,\n')
+        assert list(read_words(word_file)) == [
+            'BONES', 'KHAN', 'KIRK', 'SCOTTY', 'SPOCK'
+        ]
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.tmp_path = tmp_path
+
+
+class FindWordListTest(unittest.TestCase):
+
+    def test_find_all_with_a_word_list_matches_find_all_with_a_list(self):
+        for path in PUZZLE_FILES:
+            with open(path) as puzzle_file:
+                words, board = wordsearch.parse_puzzle(puzzle_file)
+            puzzle = Puzzle(board)
+            expected = puzzle.find_all(words)
+            assert puzzle.find_all(WordList.from_words(words)) == expected
+            assert puzzle.freeze().find_all(
+                WordList.from_words(words)) == expected
+
+    def test_find_all_with_a_word_list_skips_words_that_do_not_fit(self):
+        puzzle = Puzzle([['A', 'B'], ['C', 'D']])
+        word_list = WordList.from_words(['AB', 'ABCD', 'DA', 'AD'])
+        assert puzzle.find_all(word_list) == {
+            'AB': [(0, 0), (0, 1)],
+            'AD': [(0, 0), (1, 1)],
+            'DA': [(1, 1), (0, 0)]
+        }
+
+
+class CompileWordsCommandTest(unittest.TestCase):
+
+    def test_compiled_words_can_be_used_to_solve_a_puzzle(self):
+        words = self.tmp_path / 'words.txt'
+        words.write_text('BONES\nKHAN\nKIRK\nX\nKIRK\n')
+        compiled = self.tmp_path / 'words.wsw'
+        wordsearch.main(
+            ['compile-words', str(words), '--output',
+             str(compiled)])
+        process = subprocess.run([
+            'python', '-m', 'wordsearch', '--words',
+            str(compiled), 'data/pillar-sample.puzzle'
+        ],
+                                 stdout=subprocess.PIPE)
+        assert process.stdout.decode().split('\n')[:3] == [
+            'BONES: (0,6),(0,7),(0,8),(0,9),(0,10)',
+            'KHAN: (5,9),(5,8),(5,7),(5,6)',
+            'KIRK: (4,7),(3,7),(2,7),(1,7)',
+        ]
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.tmp_path = tmp_path
+# pylint: enable=invalid-name, no-self-use, attribute-defined-outside-init
@@ -0,0 +1,359 @@
+"""The :mod:`wordlist` module contains the :class:`WordList` class, a prepared
+set of words stored as a trie, and the ``compile-words`` command that saves one
+to a compact binary file that can be memory-mapped.
+
+Example:
+    To compile a word list once and reuse it for many puzzles, do:
+
+        $ python -m wordsearch compile-words words.txt -o words.wsw
+        $ python -m wordsearch --words words.wsw puzzle.puzzle
+
+The file starts with a header of six little-endian, unsigned 32-bit integers:
+the :attr:`MAGIC` number, the :attr:`VERSION`, and the number of words, nodes,
+edges, and bytes of text. The trie arrays follow as 32-bit signed integers, in
+the order ``first_edge``, ``edge_count``, ``node_word`` (one per node),
+``edge_code``, ``edge_target`` (one per edge) and ``word_offset`` (one per
+word, plus one), then the UTF-8 text of all words, back to back.
+
+Attributes:
+    MAGIC (int): The number that every compiled word file starts with.
+    VERSION (int): The version of the file format.
+"""
+import argparse
+import array
+import mmap
+import struct
+import sys
+
+from wordsearch.solver import MIN_WORD_SIZE
+
+MAGIC = 0x4c575357  # b'WSWL' in little-endian order.
+VERSION = 1
+
+HEADER = struct.Struct('<6I')
+
+
+class WordList:
+    """The :class:`WordList` class holds a deduplicated set of words as a trie,
+    ready to be searched by :meth:`wordsearch.solver.Puzzle.find_all`.
+
+    A word list is either built in memory, with :meth:`from_words`, or loaded
+    from a compiled file, with :meth:`load`, in which case the trie arrays are
+    views on a memory map and nothing is parsed up front.
+
+    Args:
+        arrays (:obj:`list`): The six trie arrays, in the order described in the
+            module documentation.
+        text (bytes): The UTF-8 text of all words, back to back.
+        source: An object to close along with the word list, or ``None``.
+
+    Attributes:
+        invalid (:obj:`list` of :obj:`tuple`): The words left out by
+            :meth:`from_words`, each paired with the reason it was left out.
+        first_edge: The first edge of each node; node zero is the root.
+        edge_count: The number of edges of each node.
+        node_word: The index of the word spelled by each node, or -1.
+        edge_code: The code point of the character on each edge.
+        edge_target: The node each edge leads to.
+        word_offset: The offset of each word in ``text``.
+    """
+
+    def __init__(self, arrays, text, source=None):
+        (self.first_edge, self.edge_count, self.node_word, self.edge_code,
+         self.edge_target, self.word_offset) = arrays
+        self.text = text
+        self.source = source
+        self.invalid = []
+
+    @classmethod
+    def from_words(cls, words, max_length=None):
+        """Builds a word list from ``words``, which are deduplicated and
+        sorted, so that words sharing a prefix share the trie nodes for it.
+
+        Invalid words (see :func:`check_word`) are left out rather than raising
+        an error, and are listed with the reason in :attr:`invalid`.
+
+        Args:
+            words: An iterable of :obj:`str`.
+            max_length (int): The length of the longest word that is kept, or
+                ``None`` to keep words of any length.
+
+        Returns:
+            A :class:`WordList`.
+        """
+        invalid = []
+        unique = set()
+        for word in words:
+            reason = check_word(word, max_length)
+            if reason is None:
+                unique.add(word)
+            else:
+                invalid.append((word, reason))
+        words = sorted(unique)
+        # Sorted words put every node's children in code point order, and
+        # numbering nodes breadth-first keeps each node's edges contiguous.
+        children = [{}]
+        node_word = [-1]
+        for index, word in enumerate(words):
+            node = 0
+            for character in word:
+                child = children[node].get(character)
+                if child is None:
+                    child = len(children)
+                    children[node][character] = child
+                    children.append({})
+                    node_word.append(-1)
+                node = child
+            node_word[node] = index
+        order = [0]
+        for node in order:
+            order.extend(children[node][character]
+                         for character in sorted(children[node]))
+        number = {node: position for position, node in enumerate(order)}
+        first_edge = array.array('i')
+        edge_count = array.array('i')
+        edge_code = array.array('i')
+        edge_target = array.array('i')
+        for node in order:
+            first_edge.append(len(edge_code))
+            edge_count.append(len(children[node]))
+            for character in sorted(children[node]):
+                edge_code.append(ord(character))
+                edge_target.append(number[children[node][character]])
+        encoded = [word.encode('UTF-8') for word in words]
+        word_offset = array.array('i', [0])
+        for data in encoded:
+            word_offset.append(word_offset[-1] + len(data))
+        arrays = [
+            first_edge, edge_count,
+            array.array('i', [node_word[node] for node in order]), edge_code,
+            edge_target, word_offset
+        ]
+        word_list = cls(arrays, b''.join(encoded))
+        word_list.invalid = invalid
+        return word_list
+
+    @classmethod
+    def load(cls, path):
+        """Memory-maps a word list compiled by :meth:`save`.
+
+        Args:
+            path (str): The path of the compiled word file.
+
+        Returns:
+            A :class:`WordList` backed by the file. Close it with
+            :meth:`close`, or use it as a context manager.
+
+        Raises:
+            ValueError: If the file is not a compiled word list.
+        """
+        with open(path, 'rb') as word_file:
+            mapped = mmap.mmap(word_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls.from_buffer(mapped, source=mapped)
+        except ValueError:
+            mapped.close()
+            raise
+
+    @classmethod
+    def from_buffer(cls, buffer, source=None):
+        """Creates a word list viewing the compiled ``buffer`` without copying.
+
+        Args:
+            buffer: A bytes-like object holding a compiled word list.
+            source: An object to close along with the word list, or ``None``.
+
+        Returns:
+            A :class:`WordList`.
+
+        Raises:
+            ValueError: If ``buffer`` is not a compiled word list.
+        """
+        if len(buffer) < HEADER.size:
+            raise ValueError('not a compiled word list.')
+        magic, version, words, nodes, edges, size = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError('not a compiled word list.')
+        if version != VERSION:
+            raise ValueError('unsupported word list version (%s).' % version)
+        lengths = [nodes, nodes, nodes, edges, edges, words + 1]
+        if len(buffer) != HEADER.size + 4 * sum(lengths) + size:
+            raise ValueError('the compiled word list is truncated.')
+        view = memoryview(buffer)
+        arrays = []
+        offset = HEADER.size
+        for length in lengths:
+            data = view[offset:offset + 4 * length]
+            if sys.byteorder == 'little':
+                arrays.append(data.cast('i'))
+            else:
+                swapped = array.array('i')
+                swapped.frombytes(data)
+                swapped.byteswap()
+                arrays.append(swapped)
+            offset += 4 * length
+        return cls(arrays, view[offset:offset + size], source)
+
+    def shortest(self):
+        """Gives the length of the shortest word, in characters.
+
+        Returns:
+            int: The length of the shortest word, or zero if there are none.
+        """
+        depths = [0] * len(self.node_word)
+        # Nodes are numbered breadth-first, so the first node spelling a word
+        # is the one closest to the root.
+        for node in range(len(depths)):
+            if self.node_word[node] >= 0:
+                return depths[node]
+            first = self.first_edge[node]
+            for edge in range(first, first + self.edge_count[node]):
+                depths[self.edge_target[edge]] = depths[node] + 1
+        return 0
+
+    def word_counts(self):
+        """Counts the words spelled by each node of the trie or any node below
+        it.
+
+        Returns:
+            :obj:`list` of int: The number of words below each node, where the
+            root counts every word.
+        """
+        counts = [0] * len(self.node_word)
+        # Nodes are numbered breadth-first, so children come after parents.
+        for node in range(len(counts) - 1, -1, -1):
+            count = 1 if self.node_word[node] >= 0 else 0
+            first = self.first_edge[node]
+            for edge in range(first, first + self.edge_count[node]):
+                count += counts[self.edge_target[edge]]
+            counts[node] = count
+        return counts
+
+    def save(self, word_file):
+        """Writes the word list to an open binary ``word_file``.
+
+        Args:
+            word_file (:obj:`file object`): A file open for writing bytes.
+        """
+        word_file.write(
+            HEADER.pack(MAGIC, VERSION, len(self), len(self.node_word),
+                        len(self.edge_code), len(self.text)))
+        for values in [
+                self.first_edge, self.edge_count, self.node_word,
+                self.edge_code, self.edge_target, self.word_offset
+        ]:
+            values = array.array('i', values)
+            if sys.byteorder != 'little':
+                values.byteswap()
+            word_file.write(values.tobytes())
+        word_file.write(bytes(self.text))
+
+    def close(self):
+        """Releases the memory map backing the word list, if any."""
+        if self.source is not None:
+            for name in [
+                    'first_edge', 'edge_count', 'node_word', 'edge_code',
+                    'edge_target', 'word_offset', 'text'
+            ]:
+                view = getattr(self, name)
+                if isinstance(view, memoryview):
+                    view.release()
+            self.source.close()
+            self.source = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.word_offset) - 1
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError('word index out of range.')
+        start = self.word_offset[index]
+        return bytes(self.text[start:self.word_offset[index + 1]]).decode(
+            'UTF-8')
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def check_word(word, max_length=None):
+    """Checks whether ``word`` can be searched for.
+
+    Args:
+        word (str): The word to check.
+        max_length (int): The length of the longest valid word, or ``None``.
+
+    Returns:
+        str: The reason the word is invalid, in the words of the error
+        :meth:`wordsearch.solver.Puzzle.find` would raise for it, or ``None``
+        if the word is valid.
+    """
+    if word is None:
+        return 'the specified word is None.'
+    if not isinstance(word, str):
+        return 'the specified word is not of type str.'
+    if max_length is not None and len(word) > max_length:
+        return 'the specified word (%s) is larger than the board.' % word
+    if len(word) < MIN_WORD_SIZE:
+        return 'the specified word (%s) is too short.' % word
+    return None
+
+
+def read_words(word_file):
+    """A generator that yields the words of a text file, where words are
+    separated by commas, white space or new lines.
+
+    Args:
+        word_file (:obj:`file object`): An open text file.
+
+    Yields:
+        str: Each word in the file.
+    """
+    for line in word_file:
+        for word in line.replace(',', ' ').split():
+            yield word
+
+
+def build_argument_parser():
+    """Constructs and configures the :obj:`argparse.ArgumentParser` of the
+    ``compile-words`` command.
+
+    Returns:
+        A configured instance of :obj:`argparse.ArgumentParser`.
+    """
+    argument_parser = argparse.ArgumentParser(
+        prog='wordsearch compile-words',
+        description='Compiles a word list to a binary file for fast loading.')
+    argument_parser.add_argument(
+        'words_file',
+        help='The words to compile, separated by commas or new lines.',
+        type=argparse.FileType('r', encoding='UTF-8'))
+    argument_parser.add_argument('-o',
+                                 '--output',
+                                 required=True,
+                                 help='The compiled word file to write.')
+    return argument_parser
+
+
+def main(argv=None):
+    """The entry point of the ``compile-words`` command.
+
+    Args:
+        argv (:obj:`list` of :obj:`str`): The command line arguments, without
+            the command name. Defaults to :obj:`sys.argv`.
+    """
+    argument_parser = build_argument_parser()
+    arguments = argument_parser.parse_args(argv)
+    with arguments.words_file:
+        words = list(read_words(arguments.words_file))
+    word_list = WordList.from_words(words)
+    with open(arguments.output, 'wb') as word_file:
+        word_list.save(word_file)
+    print('compiled %s words (%s duplicate or too short) to %s' %
+          (len(word_list), len(words) - len(word_list), arguments.output))